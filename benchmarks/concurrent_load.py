@@ -0,0 +1,83 @@
+"""Benchmark CPU use of many threads waiting for objects to load.
+
+Usage::
+
+    python benchmarks/concurrent_load.py [num_loaders] [playlist_uri]
+
+Starts ``num_loaders`` (default 100) threads that each load one of the tracks
+of a playlist, first with the old busy polling loop that processed events and
+slept for 1 ms between checks, and then with :meth:`spotify.Track.load`. The
+two runs use different tracks, so that none of them are loaded already. The
+playlist should thus have at least ``2 * num_loaders`` tracks. The CPU time
+used by the process while loading is reported for both.
+
+Assumes a ``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import threading
+import time
+
+import spotify
+
+
+PLAYLIST_URI = 'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ'
+
+
+def polling_load(session, obj, timeout=10):
+    deadline = time.time() + timeout
+    while not obj.is_loaded:
+        session.process_events()
+        if time.time() > deadline:
+            raise spotify.Timeout(timeout)
+        time.sleep(0.001)
+    return obj
+
+
+def event_driven_load(session, obj, timeout=10):
+    return obj.load(timeout=timeout)
+
+
+def measure(session, load, tracks):
+    threads = [
+        threading.Thread(target=load, args=(session, track))
+        for track in tracks]
+    cpu_start = sum(os.times()[:2])
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    cpu = sum(os.times()[:2]) - cpu_start
+    return elapsed, cpu
+
+
+def main(num_loaders=100, playlist_uri=PLAYLIST_URI):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    playlist = session.get_playlist(playlist_uri).load()
+    tracks = list(playlist.tracks)
+    print('Loading tracks from %d threads' % num_loaders)
+
+    for i, (label, load) in enumerate([
+            ('Busy polling', polling_load),
+            ('Event driven', event_driven_load)]):
+        batch = tracks[i * num_loaders:(i + 1) * num_loaders]
+        elapsed, cpu = measure(session, load, batch)
+        print('%-14s %3d tracks  %6.2fs wall  %6.2fs CPU  %5.1f%% CPU' % (
+            label + ':', len(batch), elapsed, cpu, 100.0 * cpu / elapsed))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(
+        num_loaders=int(args[0]) if len(args) > 0 else 100,
+        playlist_uri=args[1] if len(args) > 1 else PLAYLIST_URI)
@@ -0,0 +1,102 @@
+"""Benchmark attaching and detaching event listeners on many playlists.
+
+Usage::
+
+    python benchmarks/emitter_registry.py [playlists]
+
+Attaches an event listener to each of ``playlists`` (default 10000)
+:class:`spotify.Playlist` objects, and then detaches them again, reporting the
+total time of the :meth:`~spotify.Playlist.on` and
+:meth:`~spotify.Playlist.off` calls. The listeners are detached in reverse
+order. While a playlist has listeners, it is kept alive by the session's
+registry of event emitters.
+
+For comparison, the same is measured for the old registry, which was a list
+that was searched on every ``on()`` and ``off()`` call, making attaching
+listeners to many playlists quadratic. The list also compared playlists by
+equality, so that of two equal playlists with listeners, only one was kept
+alive.
+
+The session and playlists are stand-ins that never call libspotify, so that
+only the registry is measured. No login is needed.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import spotify
+from spotify import ffi, utils
+
+
+class FakeSession(object):
+
+    def __init__(self, emitters):
+        self._emitters = emitters
+
+
+class FakePlaylist(spotify.Playlist):
+
+    def __init__(self, session, index):
+        utils.EventEmitter.__init__(self)
+        self._session = session
+        self._sp_playlist = ffi.cast('sp_playlist *', index + 1)
+
+    def _add_callbacks(self):
+        pass
+
+    def _remove_callbacks(self):
+        pass
+
+
+class ListRegistryPlaylist(FakePlaylist):
+    """A playlist using the registry as it was before it was keyed by id."""
+
+    def on(self, event, listener, *user_args):
+        if self not in self._session._emitters:
+            self._session._emitters.append(self)
+        utils.EventEmitter.on(self, event, listener, *user_args)
+
+    def off(self, event=None, listener=None):
+        utils.EventEmitter.off(self, event, listener)
+        if (self.num_listeners() == 0 and
+                self in self._session._emitters):
+            self._session._emitters.remove(self)
+
+
+def listener(*args):
+    pass
+
+
+def measure(playlist_class, emitters, num_playlists):
+    session = FakeSession(emitters)
+    playlists = [playlist_class(session, i) for i in range(num_playlists)]
+
+    start = time.time()
+    for playlist in playlists:
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, listener)
+    on_time = time.time() - start
+    assert len(session._emitters) == num_playlists
+
+    start = time.time()
+    for playlist in reversed(playlists):
+        playlist.off(spotify.PlaylistEvent.TRACKS_ADDED, listener)
+    off_time = time.time() - start
+    assert len(session._emitters) == 0
+
+    return on_time, off_time
+
+
+def main(num_playlists=10000):
+    print('Attaching and detaching listeners on %d playlists' % num_playlists)
+    for label, playlist_class, emitters in [
+            ('List', ListRegistryPlaylist, []),
+            ('Mapping', FakePlaylist, {})]:
+        on_time, off_time = measure(playlist_class, emitters, num_playlists)
+        print('%-9s on: %8.3f s  off: %8.3f s' % (
+            label + ':', on_time, off_time))
+
+
+if __name__ == '__main__':
+    main(num_playlists=int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,61 @@
+"""Benchmark the cost of converting integers to enum values.
+
+Usage::
+
+    python benchmarks/enum_lookup.py [repeats]
+
+Converts every known value of every enum type, like libspotify's return values
+are converted on each access of e.g. :attr:`spotify.Track.error` or
+:attr:`spotify.Session.connection_state`. Does not need a Spotify session.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import timeit
+
+import spotify
+from spotify import utils
+
+
+def get_enum_types():
+    enum_types = []
+    for name in sorted(spotify._LAZY_ATTRIBUTES):
+        obj = getattr(spotify, name)
+        if isinstance(obj, type) and issubclass(obj, utils.IntEnum):
+            enum_types.append(obj)
+    return enum_types
+
+
+def get_values(enum_type):
+    return sorted(set(
+        int(value) for value in vars(enum_type).values()
+        if isinstance(value, enum_type)))
+
+
+def measure(enum_type, values, repeats):
+    number = 100000 // len(values) + 1
+
+    def convert():
+        for value in values:
+            enum_type(value)
+
+    best = min(timeit.repeat(convert, repeat=repeats, number=number))
+    return best / (number * len(values))
+
+
+def main(repeats=5):
+    total = 0.0
+    enum_types = get_enum_types()
+    for enum_type in enum_types:
+        values = get_values(enum_type)
+        per_conversion = measure(enum_type, values, repeats)
+        total += per_conversion
+        print('%-25s %3d values  %6.0f ns/conversion' % (
+            enum_type.__name__, len(values), per_conversion * 1e9))
+    print('%-25s             %6.0f ns/conversion' % (
+        'Mean', total / len(enum_types) * 1e9))
+
+
+if __name__ == '__main__':
+    main(repeats=int(sys.argv[1]) if len(sys.argv) > 1 else 5)
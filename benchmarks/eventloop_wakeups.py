@@ -0,0 +1,120 @@
+"""Benchmark how :class:`spotify.EventLoop` handles bursts of
+``notify_main_thread`` callbacks.
+
+Usage::
+
+    python benchmarks/eventloop_wakeups.py [burst_size] [bursts]
+
+Sends ``bursts`` (default 100) bursts of ``burst_size`` (default 100)
+notifications to an event loop, and reports the notifications handled per
+second and the number of :meth:`~spotify.Session.process_events` calls per
+burst. This is done both for the event loop, which coalesces all notifications
+that arrive while it is busy into one ``process_events()`` call, and for the
+old event loop, which queued every notification and called
+``process_events()`` once per queued notification.
+
+The session is a stand-in that takes 1 ms per ``process_events()`` call, so
+that only the event loop itself is measured. No login is needed.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import threading
+import time
+
+try:
+    # Python 3
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+import spotify
+
+
+class FakeSession(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.idle = threading.Event()
+
+    def on(self, event, listener):
+        pass
+
+    def off(self, event, listener):
+        pass
+
+    def process_events(self):
+        self.idle.clear()
+        self.calls += 1
+        time.sleep(0.001)
+        self.idle.set()
+        return 10000
+
+
+class QueueEventLoop(spotify.EventLoop):
+    """The event loop as it was before notifications were coalesced."""
+
+    def __init__(self, session):
+        spotify.EventLoop.__init__(self, session)
+        self._queue = queue.Queue()
+
+    def run(self):
+        timeout = self._session.process_events() / 1000.0
+        while self._runnable:
+            try:
+                self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            finally:
+                timeout = self._session.process_events() / 1000.0
+
+    def _on_notify_main_thread(self, session):
+        self._queue.put_nowait(1)
+
+
+def wait_until_idle(session, event_loop):
+    while True:
+        time.sleep(0.005)
+        if session.idle.is_set() and not getattr(event_loop, '_notified', 0):
+            queued = getattr(event_loop, '_queue', None)
+            if queued is None or queued.empty():
+                return
+
+
+def measure(event_loop_class, burst_size, bursts):
+    session = FakeSession()
+    event_loop = event_loop_class(session)
+    event_loop.start()
+    wait_until_idle(session, event_loop)
+    session.calls = 0
+
+    elapsed = 0
+    for _ in range(bursts):
+        start = time.time()
+        for _ in range(burst_size):
+            event_loop._on_notify_main_thread(session)
+        elapsed += time.time() - start
+        wait_until_idle(session, event_loop)
+
+    event_loop.stop()
+    event_loop._on_notify_main_thread(session)
+    return burst_size * bursts / elapsed, session.calls / float(bursts)
+
+
+def main(burst_size=100, bursts=100):
+    print('%d bursts of %d notifications' % (bursts, burst_size))
+    for label, event_loop_class in [
+            ('Queue', QueueEventLoop),
+            ('Coalescing', spotify.EventLoop)]:
+        rate, calls = measure(event_loop_class, burst_size, bursts)
+        print('%-12s %10.0f notifications/s  %6.1f process_events/burst' % (
+            label + ':', rate, calls))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(
+        burst_size=int(args[0]) if len(args) > 0 else 100,
+        bursts=int(args[1]) if len(args) > 1 else 100)
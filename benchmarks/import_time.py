@@ -0,0 +1,63 @@
+"""Benchmark the time it takes to ``import spotify`` in a fresh interpreter.
+
+Usage::
+
+    python benchmarks/import_time.py [runs]
+
+Compares importing the out-of-line CFFI module built by ``setup.py`` with the
+:meth:`cffi.FFI.verify` fallback, and measures the cost of importing all the
+submodules, including the creation of all enums. Build the out-of-line module
+in place first with::
+
+    python spotify/_spotify_build.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import subprocess
+import sys
+import time
+
+
+OUT_OF_LINE = 'import spotify'
+
+ALL_SUBMODULES = (
+    'import spotify; '
+    '[getattr(spotify, name) for name in spotify._LAZY_ATTRIBUTES]')
+
+VERIFY = (
+    'import sys; '
+    'sys.modules["spotify._spotify"] = None; '  # Makes the import fail
+    'import spotify')
+
+
+def measure(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code])
+        timings.append(time.time() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main(runs=10):
+    baseline = measure('pass', runs)
+    print('Empty interpreter: min %.3fs  mean %.3fs' % baseline)
+
+    variants = [
+        ('Out-of-line', OUT_OF_LINE),
+        ('All submodules', ALL_SUBMODULES),
+        ('ffi.verify()', VERIFY),
+    ]
+    for label, code in variants:
+        try:
+            best, mean = measure(code, runs)
+        except subprocess.CalledProcessError:
+            print('%-17s failed; see output above' % (label + ':'))
+            continue
+        print('%-17s min %.3fs  mean %.3fs  (import only: %.3fs)' % (
+            label + ':', best, mean, best - baseline[0]))
+
+
+if __name__ == '__main__':
+    main(runs=int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,60 @@
+"""Benchmark loading many tracks one by one versus with
+:meth:`spotify.Session.load_all`.
+
+Usage::
+
+    python benchmarks/load_all.py [playlist_uri]
+
+Loads the first half of the playlist's tracks with one :meth:`Track.load`
+call per track, and the second half with a single
+:meth:`~spotify.Session.load_all` call, so that none of the tracks are
+loaded already.
+
+Assumes a ``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import spotify
+
+
+PLAYLIST_URI = 'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ'
+
+
+def load_one_by_one(session, tracks):
+    for track in tracks:
+        track.load()
+
+
+def load_all(session, tracks):
+    result = session.load_all(tracks)
+    if result.failed or result.timed_out:
+        print('%d failed, %d timed out' % (
+            len(result.failed), len(result.timed_out)))
+
+
+def main(playlist_uri=PLAYLIST_URI):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    playlist = session.get_playlist(playlist_uri).load()
+    tracks = list(playlist.tracks)
+    half = len(tracks) // 2
+    print('Loading %d tracks per run' % half)
+
+    for i, (label, load) in enumerate([
+            ('One by one', load_one_by_one),
+            ('load_all()', load_all)]):
+        start = time.time()
+        load(session, tracks[i * half:(i + 1) * half])
+        print('%-12s %6.2fs' % (label + ':', time.time() - start))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,85 @@
+"""Benchmark multi-threaded track metadata reads with and without fine
+grained locking.
+
+Usage::
+
+    python benchmarks/lock_contention.py [num_threads] [seconds]
+
+Assumes a ``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import threading
+import time
+
+import spotify
+
+
+ALBUM_URI = 'spotify:album:4m2880jivSbbyEGAKfITCa'
+
+
+def read_metadata(tracks, deadline, counts, index):
+    reads = 0
+    while time.time() < deadline:
+        for track in tracks:
+            track.name
+            track.duration
+            track.popularity
+            track.disc
+            track.index
+            reads += 1
+    counts[index] = reads
+
+
+def run(tracks, num_threads, seconds):
+    counts = [0] * num_threads
+    deadline = time.time() + seconds
+    threads = [
+        threading.Thread(
+            target=read_metadata, args=(tracks, deadline, counts, i))
+        for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main(num_threads=8, seconds=5.0):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    # Keep the event loop running, so that readers also compete with the
+    # thread calling process_events(), like in a real application.
+    event_loop = spotify.EventLoop(session)
+    event_loop.start()
+
+    album = session.get_album(ALBUM_URI).load()
+    tracks = [track.load() for track in album.browse().load().tracks]
+
+    print('Reading metadata of %d tracks from %d threads for %.1fs' % (
+        len(tracks), num_threads, seconds))
+
+    spotify.set_fine_grained_locking(False)
+    before = run(tracks, num_threads, seconds)
+    print('Global lock:         %10.0f track reads/s' % before)
+
+    spotify.set_fine_grained_locking(True)
+    after = run(tracks, num_threads, seconds)
+    print('Fine grained locking: %9.0f track reads/s' % after)
+
+    print('Speedup: %.2fx' % (after / before))
+
+    event_loop.stop()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(
+        num_threads=int(args[0]) if len(args) > 0 else 8,
+        seconds=float(args[1]) if len(args) > 1 else 5.0)
@@ -0,0 +1,67 @@
+"""Benchmark repeated metadata reads with and without metadata caching.
+
+Usage::
+
+    python benchmarks/metadata_caching.py [num_requests]
+
+Simulates a web app rendering the same album page for ``num_requests``
+requests, reading the name, duration, disc, and index of every track, and the
+name of the album and its artist.
+
+Assumes a ``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import spotify
+
+
+ALBUM_URI = 'spotify:album:4m2880jivSbbyEGAKfITCa'
+
+
+def handle_request(album, tracks):
+    page = [album.name, album.artist.name, album.year]
+    for track in tracks:
+        page.append(
+            (track.name, track.duration, track.disc, track.index))
+    return page
+
+
+def measure(album, tracks, num_requests):
+    start = time.time()
+    for _ in range(num_requests):
+        handle_request(album, tracks)
+    elapsed = time.time() - start
+    return elapsed / num_requests * 1e6
+
+
+def main(num_requests=10000):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    album = session.get_album(ALBUM_URI).load()
+    album.artist.load()
+    tracks = [track.load() for track in album.browse().load().tracks]
+
+    print('Rendering %d tracks for %d requests' % (
+        len(tracks), num_requests))
+
+    spotify.set_metadata_caching(False)
+    before = measure(album, tracks, num_requests)
+    print('Without caching: %8.1f us/request' % before)
+
+    spotify.set_metadata_caching(True)
+    after = measure(album, tracks, num_requests)
+    print('With caching:    %8.1f us/request' % after)
+
+    print('Speedup: %.2fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main(num_requests=int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,103 @@
+"""Stress test the latency of :class:`spotify.EventLoop` with slow event
+listeners.
+
+Usage::
+
+    python benchmarks/slow_listeners.py [seconds] [listener_ms] [workers]
+
+Runs an event loop for ``seconds`` (default 5) while a thread notifies it
+every 10 ms, as libspotify does when it has events to process. Each
+:meth:`~spotify.Session.process_events` call emits
+:attr:`~spotify.SessionEvent.METADATA_UPDATED` on the session and
+:attr:`~spotify.PlaylistEvent.TRACKS_ADDED` on one of ten playlists. All
+listeners sleep for ``listener_ms`` (default 50) milliseconds.
+
+This is done once with the listeners called from the event loop thread, and
+once with ``workers`` (default 4) worker threads and no budget. The time
+spent in ``process_events()`` and the delay from notification to processing
+are reported from :meth:`spotify.EventLoop.stats`. The listeners also check
+that each playlist's events arrive in order.
+
+The session and playlists are stand-ins, so that only the event loop itself
+is measured. No login is needed.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import spotify
+from spotify import utils
+
+
+class FakeSession(utils.EventEmitter):
+
+    def __init__(self, playlists):
+        utils.EventEmitter.__init__(self)
+        self.playlists = playlists
+        self.count = 0
+
+    def process_events(self):
+        self.count += 1
+        self.emit(spotify.SessionEvent.METADATA_UPDATED, self)
+        playlist = self.playlists[self.count % len(self.playlists)]
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_ADDED, playlist, [], self.count)
+        return 1000
+
+
+def measure(seconds, listener_ms, workers):
+    playlists = [utils.EventEmitter() for _ in range(10)]
+    session = FakeSession(playlists)
+    last_index = {}
+    errors = []
+
+    def on_metadata_updated(session):
+        time.sleep(listener_ms / 1000.0)
+
+    def on_tracks_added(playlist, tracks, index):
+        time.sleep(listener_ms / 1000.0)
+        if index <= last_index.get(playlist, 0):
+            errors.append(index)
+        last_index[playlist] = index
+
+    session.on(spotify.SessionEvent.METADATA_UPDATED, on_metadata_updated)
+    for playlist in playlists:
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, on_tracks_added)
+
+    event_loop = spotify.EventLoop(session, workers=workers)
+    event_loop.start()
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        event_loop._on_notify_main_thread(session)
+        time.sleep(0.01)
+    stats = event_loop.stats()
+    event_loop.stop()
+    return stats, errors
+
+
+def main(seconds=5, listener_ms=50, workers=4):
+    print('Notifying every 10 ms for %ds, with %d ms listeners' % (
+        seconds, listener_ms))
+    for label, num_workers in [
+            ('Inline', None), ('%d workers' % workers, workers)]:
+        stats, errors = measure(seconds, listener_ms, num_workers)
+        print(
+            '%-10s %5d iterations  process_events mean %7.2f ms '
+            'max %7.2f ms  notify delay mean %7.2f ms p99 %7.2f ms  '
+            '%d offloaded  %d out of order' % (
+                label + ':', stats.iterations,
+                stats.process_events.mean * 1000,
+                stats.process_events.max * 1000,
+                stats.notify_delay.mean * 1000,
+                stats.notify_delay.percentile(99) * 1000,
+                stats.offloaded, len(errors)))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(
+        seconds=int(args[0]) if len(args) > 0 else 5,
+        listener_ms=int(args[1]) if len(args) > 1 else 50,
+        workers=int(args[2]) if len(args) > 2 else 4)
@@ -0,0 +1,68 @@
+"""Benchmark the memory use of holding many track objects.
+
+Usage::
+
+    python benchmarks/track_memory.py [num_tracks]
+
+Creates ``num_tracks`` (default 1,000,000) :class:`spotify.Track` objects for
+the same libspotify track, bypassing the wrapper cache, and measures the
+memory held by them. For comparison, the same is done with a subclass that
+has a ``__dict__``, like all track objects had before they got
+``__slots__``.
+
+Requires Python 3.4+ for :mod:`tracemalloc`. Assumes a
+``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import gc
+import sys
+import tracemalloc
+
+import spotify
+
+
+TRACK_URI = 'spotify:track:2Foc5Q5nqNiosCNqttzHof'
+
+
+class DictTrack(spotify.Track):
+    """A track with a ``__dict__`` for every instance."""
+
+
+def measure(cls, session, sp_track, num_tracks):
+    gc.collect()
+    tracemalloc.start()
+    tracks = [
+        cls(session, sp_track=sp_track, add_ref=True)
+        for _ in range(num_tracks)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tracks
+    gc.collect()
+    return current
+
+
+def main(num_tracks=1000000):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    track = session.get_track(TRACK_URI).load()
+    print('Holding %d track objects' % num_tracks)
+
+    results = []
+    variants = [('With __dict__', DictTrack), ('Slotted', spotify.Track)]
+    for label, cls in variants:
+        memory = measure(cls, session, track._sp_track, num_tracks)
+        results.append(memory)
+        print('%-14s %8.1f MiB  %6.1f bytes/track' % (
+            label + ':', memory / 1024.0 ** 2, memory / float(num_tracks)))
+
+    print('Saved: %.1f MiB' % ((results[0] - results[1]) / 1024.0 ** 2))
+
+
+if __name__ == '__main__':
+    main(num_tracks=int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,68 @@
+"""Benchmark reading all metadata of tracks one attribute at a time versus
+with :meth:`spotify.Track.snapshot`.
+
+Usage::
+
+    python benchmarks/track_snapshot.py [rounds]
+
+Assumes a ``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+
+import spotify
+
+
+ALBUM_URI = 'spotify:album:4m2880jivSbbyEGAKfITCa'
+
+
+def read_attributes(tracks):
+    for track in tracks:
+        (
+            track.name, track.duration, track.popularity, track.disc,
+            track.index, track.availability, track.starred,
+            tuple(track.artists), track.album)
+
+
+def read_snapshots(tracks):
+    for track in tracks:
+        track.snapshot()
+
+
+def read_snapshot_many(tracks):
+    spotify.Track.snapshot_many(tracks)
+
+
+def measure(func, tracks, rounds):
+    start = time.time()
+    for _ in range(rounds):
+        func(tracks)
+    elapsed = time.time() - start
+    return elapsed / (rounds * len(tracks)) * 1e6
+
+
+def main(rounds=1000):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    album = session.get_album(ALBUM_URI).load()
+    tracks = [track.load() for track in album.browse().load().tracks]
+
+    print('Reading metadata of %d tracks %d times' % (len(tracks), rounds))
+
+    for label, func in [
+            ('Attributes', read_attributes),
+            ('snapshot()', read_snapshots),
+            ('snapshot_many()', read_snapshot_many)]:
+        print('%-16s %8.2f us/track' % (
+            label + ':', measure(func, tracks, rounds)))
+
+
+if __name__ == '__main__':
+    main(rounds=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,85 @@
+"""Benchmark memory use and allocations with and without reuse of cached
+wrapper objects.
+
+Usage::
+
+    python benchmarks/wrapper_cache.py [playlist_uri]
+
+Iterates the tracks of a playlist twice, and walks from every track to its
+album and the album's artist, first with the session's wrapper cache in use,
+and then with a cache that never returns anything.
+
+Requires Python 3.4+ for :mod:`tracemalloc`. Assumes a
+``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True`` and a proper logout.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import sys
+import time
+import tracemalloc
+import weakref
+
+import spotify
+
+
+PLAYLIST_URI = 'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ'
+
+
+class NoCache(weakref.WeakValueDictionary):
+    """A wrapper cache that never remembers anything."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def walk(tracks):
+    wrappers = []
+    for _ in range(2):
+        for track in tracks:
+            wrappers.append(track)
+    for track in tracks:
+        album = track.album
+        wrappers.append(album)
+        wrappers.append(album.artist)
+    return wrappers
+
+
+def measure(session, playlist):
+    tracemalloc.start()
+    start = time.time()
+    wrappers = walk(playlist.tracks)
+    elapsed = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    unique = len(set(id(wrapper) for wrapper in wrappers))
+    return len(wrappers), unique, current, peak, elapsed
+
+
+def main(playlist_uri=PLAYLIST_URI):
+    session = spotify.Session()
+    session.relogin()
+    while session.connection_state != spotify.ConnectionState.LOGGED_IN:
+        session.process_events()
+
+    playlist = session.get_playlist(playlist_uri).load()
+    for track in playlist.tracks:
+        track.load()
+
+    print('Walking %d tracks of %s' % (len(playlist.tracks), playlist.name))
+
+    for label, cache in [
+            ('Cached wrappers', session._cache),
+            ('No cache', NoCache())]:
+        session._cache = cache
+        wrappers, unique, current, peak, elapsed = measure(session, playlist)
+        print(
+            '%-16s %6d wrappers  %6d objects  %8.1f KiB held  '
+            '%8.1f KiB peak  %.3fs' % (
+                label + ':', wrappers, unique,
+                current / 1024.0, peak / 1024.0, elapsed))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -2,7 +2,6 @@ from __future__ import unicode_literals
 
 import re
 
-from distutils.command.build import build
 from setuptools import setup, find_packages
 
 
@@ -17,17 +16,6 @@ def get_version(filename):
     return metadata['version']
 
 
-class cffi_build(build):
-    """This is a shameful hack to ensure that cffi is present when we specify
-    ext_modules. We can't do this eagerly because setup_requires hasn't run
-    yet.
-    """
-    def finalize_options(self):
-        from spotify import ffi
-        self.distribution.ext_modules = [ffi.verifier.get_extension()]
-        build.finalize_options(self)
-
-
 setup(
     name='pyspotify',
     version=get_version('spotify/__init__.py'),
@@ -38,12 +26,11 @@ setup(
     description='Python wrapper for libspotify',
     long_description=read_file('README.rst'),
     packages=find_packages(exclude=['tests', 'tests.*']),
-    ext_package='spotify',
     zip_safe=False,
     include_package_data=True,
-    install_requires=['cffi >= 0.7'],
-    setup_requires=['cffi >= 0.7'],
-    cmdclass={'build': cffi_build},
+    install_requires=['cffi >= 1.0.0'],
+    setup_requires=['cffi >= 1.0.0'],
+    cffi_modules=['spotify/_spotify_build.py:build_ffi'],
     test_suite='nose.collector',
     tests_require=[
         'nose',
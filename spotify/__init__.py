@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import sys
 import threading
 
 
@@ -12,6 +13,122 @@ __version__ = '2.0.0a1'
 _lock = threading.RLock()
 
 
+# Whether libspotify functions that only read immutable data from loaded
+# objects are called without holding the global lock. Disabled by default. See
+# :func:`set_fine_grained_locking`.
+_fine_grained_locking = False
+
+
+# Function recording lock statistics for every serialized call, or None.
+# Set by :func:`spotify.stats.enable_lock_stats`.
+_lock_stats = None
+
+
+# Whether metadata read from loaded objects is remembered by the wrapper
+# objects. Disabled by default. See :func:`set_metadata_caching`.
+_metadata_caching = False
+
+
+# libspotify functions that only read data from an object that is immutable
+# once loaded, or a single status field of the object. They never touch
+# session state, reference counts, or callbacks, and may thus be called
+# without the global lock when fine grained locking is enabled. All other
+# libspotify functions are always serialized.
+_ACCESSOR_FUNCTIONS = frozenset([
+    # Track metadata
+    'sp_track_is_loaded',
+    'sp_track_error',
+    'sp_track_is_placeholder',
+    'sp_track_num_artists',
+    'sp_track_artist',
+    'sp_track_album',
+    'sp_track_name',
+    'sp_track_duration',
+    'sp_track_popularity',
+    'sp_track_disc',
+    'sp_track_index',
+
+    # Album metadata
+    'sp_album_is_loaded',
+    'sp_album_is_available',
+    'sp_album_artist',
+    'sp_album_cover',
+    'sp_album_name',
+    'sp_album_year',
+    'sp_album_type',
+
+    # Artist metadata
+    'sp_artist_is_loaded',
+    'sp_artist_name',
+    'sp_artist_portrait',
+
+    # User metadata
+    'sp_user_is_loaded',
+    'sp_user_canonical_name',
+    'sp_user_display_name',
+
+    # Album browser results
+    'sp_albumbrowse_is_loaded',
+    'sp_albumbrowse_error',
+    'sp_albumbrowse_album',
+    'sp_albumbrowse_artist',
+    'sp_albumbrowse_num_copyrights',
+    'sp_albumbrowse_copyright',
+    'sp_albumbrowse_num_tracks',
+    'sp_albumbrowse_track',
+    'sp_albumbrowse_review',
+    'sp_albumbrowse_backend_request_duration',
+
+    # Artist browser results
+    'sp_artistbrowse_is_loaded',
+    'sp_artistbrowse_error',
+    'sp_artistbrowse_artist',
+    'sp_artistbrowse_num_portraits',
+    'sp_artistbrowse_portrait',
+    'sp_artistbrowse_num_tracks',
+    'sp_artistbrowse_track',
+    'sp_artistbrowse_num_tophit_tracks',
+    'sp_artistbrowse_tophit_track',
+    'sp_artistbrowse_num_albums',
+    'sp_artistbrowse_album',
+    'sp_artistbrowse_num_similar_artists',
+    'sp_artistbrowse_similar_artist',
+    'sp_artistbrowse_biography',
+    'sp_artistbrowse_backend_request_duration',
+
+    # Search results
+    'sp_search_is_loaded',
+    'sp_search_error',
+    'sp_search_num_tracks',
+    'sp_search_track',
+    'sp_search_num_albums',
+    'sp_search_album',
+    'sp_search_num_playlists',
+    'sp_search_playlist_name',
+    'sp_search_playlist_uri',
+    'sp_search_playlist_image_uri',
+    'sp_search_num_artists',
+    'sp_search_artist',
+    'sp_search_query',
+    'sp_search_did_you_mean',
+    'sp_search_total_tracks',
+    'sp_search_total_albums',
+    'sp_search_total_artists',
+    'sp_search_total_playlists',
+
+    # Toplist results
+    'sp_toplistbrowse_is_loaded',
+    'sp_toplistbrowse_error',
+    'sp_toplistbrowse_num_artists',
+    'sp_toplistbrowse_artist',
+    'sp_toplistbrowse_num_albums',
+    'sp_toplistbrowse_album',
+    'sp_toplistbrowse_num_tracks',
+    'sp_toplistbrowse_track',
+    'sp_toplistbrowse_backend_request_duration',
+])
+
+
 # Reference to the spotify.Session instance. Used to enforce that one and only
 # one session exists in each process.
 session_instance = None
@@ -35,12 +152,40 @@ def _setup_logging():
 def serialized(f):
     """Acquires the global lock while calling the wrapped function.
 
+    Internal function.
+    """
+    return _serialized(f, _qualified_name(f), accessor=False)
+
+
+def serialized_accessor(f):
+    """Acquires the global lock while calling the wrapped function, unless
+    fine grained locking is enabled.
+
+    Use this instead of :func:`serialized` for functions that only read
+    immutable data from loaded libspotify objects.
+
+    Internal function.
+    """
+    return _serialized(f, _qualified_name(f), accessor=True)
+
+
+def _serialized(f, name, accessor):
+    """Wrap ``f`` to acquire the global lock while it is called.
+
+    If ``accessor`` is true, the lock isn't acquired when fine grained locking
+    is enabled. If lock statistics are enabled, the call is recorded under
+    ``name``.
+
     Internal function.
     """
     import functools
 
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
+        if _lock_stats is not None:
+            return _lock_stats(name, accessor, f, args, kwargs)
+        if accessor and _fine_grained_locking:
+            return f(*args, **kwargs)
         with _lock:
             return f(*args, **kwargs)
     if not hasattr(wrapper, '__wrapped__'):
@@ -49,45 +194,131 @@ def serialized(f):
     return wrapper
 
 
+def _qualified_name(f):
+    """Get the name lock statistics for ``f`` are recorded under, e.g.
+    ``spotify.track.Track.name``.
+
+    Internal function.
+    """
+    name = getattr(f, '__qualname__', f.__name__)
+    if getattr(f, '__module__', None):
+        name = '%s.%s' % (f.__module__, name)
+    return name
+
+
+def set_fine_grained_locking(enabled=True):
+    """Enable or disable fine grained locking.
+
+    By default, pyspotify holds a single global lock whenever a libspotify
+    function is called. With fine grained locking enabled, functions that
+    only read immutable data from loaded objects, like the name or duration of
+    a track, are called without the lock. Threads reading metadata will then
+    no longer block each other or the thread calling
+    :meth:`~spotify.Session.process_events`.
+
+    All calls that change state, or that work on the session, are still
+    serialized.
+    """
+    global _fine_grained_locking
+    _fine_grained_locking = bool(enabled)
+
+
+def set_metadata_caching(enabled=True):
+    """Enable or disable caching of metadata on loaded objects.
+
+    By default, every read of e.g. :attr:`Track.name` calls libspotify again.
+    With metadata caching enabled, :class:`Track`, :class:`Album`,
+    :class:`Artist`, and :class:`User` objects remember the values of their
+    metadata attributes once they are loaded, so that repeated reads of the
+    same attribute on the same object are served from Python.
+
+    When the session emits :attr:`~SessionEvent.METADATA_UPDATED` or
+    :attr:`~SessionEvent.USER_INFO_UPDATED`, each object checks on its next
+    read if it is still loaded and has the same error as before, and forgets
+    its remembered values if not. Objects that weren't affected by the update
+    keep their values.
+    """
+    global _metadata_caching
+    _metadata_caching = bool(enabled)
+
+
+class _Library(object):
+    """Library object which looks up any attribute it doesn't have itself on
+    the wrapped CFFI library object.
+
+    Internal class.
+    """
+
+    def __init__(self, lib):
+        self._lib = lib
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+    def __dir__(self):
+        names = set(dir(self._lib))
+        names.update(self.__dict__)
+        names.discard('_lib')
+        return sorted(names)
+
+
 def _serialize_access_to_library(lib):
-    """Modify CFFI library to serialize all calls to library functions.
+    """Wrap CFFI library to serialize all calls to library functions.
+
+    Functions listed in :data:`_ACCESSOR_FUNCTIONS` are wrapped like with
+    :func:`serialized_accessor`, all others like with :func:`serialized`.
+    Their lock statistics are recorded under the function name.
+
+    Returns a new library object, as the library objects of out-of-line CFFI
+    modules don't allow their functions to be replaced.
 
     Internal function.
     """
+    serialized_lib = _Library(lib)
     for name in dir(lib):
         if name.startswith('sp_') and callable(getattr(lib, name)):
-            setattr(lib, name, serialized(getattr(lib, name)))
+            setattr(serialized_lib, name, _serialized(
+                getattr(lib, name), name,
+                accessor=name in _ACCESSOR_FUNCTIONS))
+    return serialized_lib
 
 
 def _build_ffi():
-    """Build CFFI instance with knowledge of all libspotify types and a library
+    """Get CFFI instance with knowledge of all libspotify types and a library
     object which wraps libspotify for use from Python.
 
+    The out-of-line CFFI module ``spotify._spotify`` is built by ``setup.py``
+    from ``spotify/_spotify_build.py``. If it is missing, e.g. when running
+    from a source checkout, the CFFI module is compiled with
+    :meth:`cffi.FFI.verify` instead.
+
     Internal function.
     """
-    from distutils.version import StrictVersion
-    import os
+    try:
+        from spotify._spotify import ffi, lib
+    except ImportError:
+        ffi, lib = _verify_ffi()
+
+    return ffi, _serialize_access_to_library(lib)
 
-    import cffi
 
-    if StrictVersion(cffi.__version__) < StrictVersion('0.7'):
-        raise RuntimeError(
-            'pyspotify requires cffi >= 0.7, but found %s' % cffi.__version__)
+def _verify_ffi():
+    """Build CFFI instance and library object at runtime, using
+    :meth:`cffi.FFI.verify`.
 
-    header_file = os.path.join(os.path.dirname(__file__), 'api.processed.h')
-    with open(header_file) as fh:
-        header = fh.read()
-        header += '#define SPOTIFY_API_VERSION ...\n'
+    This is slow and requires a C compiler, unless a cached build from a
+    previous run is found.
 
-    ffi = cffi.FFI()
-    ffi.cdef(header)
+    Internal function.
+    """
+    from spotify import _spotify_build
+
+    ffi = _spotify_build.create_ffi()
     lib = ffi.verify(
         '#include "libspotify/api.h"',
         libraries=[str('spotify')],
         ext_package='spotify')
 
-    _serialize_access_to_library(lib)
-
     return ffi, lib
 
 
@@ -95,21 +326,100 @@ _setup_logging()
 ffi, lib = _build_ffi()
 
 
-from spotify.album import *  # noqa
-from spotify.artist import *  # noqa
-from spotify.audio import *  # noqa
-from spotify.config import *  # noqa
-from spotify.connection import *  # noqa
-from spotify.error import *  # noqa
-from spotify.eventloop import *  # noqa
-from spotify.image import *  # noqa
-from spotify.inbox import *  # noqa
-from spotify.link import *  # noqa
-from spotify.offline import *  # noqa
-from spotify.playlist import *  # noqa
-from spotify.search import *  # noqa
-from spotify.session import *  # noqa
-from spotify.social import *  # noqa
-from spotify.toplist import *  # noqa
-from spotify.track import *  # noqa
-from spotify.user import *  # noqa
+# Mapping from submodules to the public names they export. On Python 3.7+ the
+# submodules are imported when one of their names is first looked up on the
+# package, so that e.g. parsing links or building a config doesn't pay for
+# setting up playlists, search, and toplists.
+_SUBMODULE_EXPORTS = {
+    'album': ['Album', 'AlbumBrowser', 'AlbumType'],
+    'artist': ['Artist', 'ArtistBrowser', 'ArtistBrowserType'],
+    'audio': ['AudioBufferStats', 'AudioFormat', 'Bitrate', 'SampleType'],
+    'config': ['Config'],
+    'connection': ['ConnectionRule', 'ConnectionState', 'ConnectionType'],
+    'error': ['Error', 'ErrorType', 'LibError', 'Timeout'],
+    'eventloop': ['EventLoop'],
+    'image': ['Image', 'ImageFormat', 'ImageSize'],
+    'inbox': ['InboxPostResult'],
+    'link': ['Link', 'LinkType'],
+    'offline': ['OfflineSyncStatus'],
+    'playlist': [
+        'Playlist', 'PlaylistEvent', 'PlaylistContainer',
+        'PlaylistContainerEvent', 'PlaylistFolder', 'PlaylistOfflineStatus',
+        'PlaylistTrack', 'PlaylistType', 'PlaylistUnseenTracks'],
+    'search': ['Search', 'SearchPlaylist', 'SearchType'],
+    'session': ['LoadResult', 'Session', 'SessionEvent'],
+    'social': ['ScrobblingState', 'SocialProvider'],
+    'store': ['MetadataStore', 'TrackMetadata'],
+    'toplist': ['Toplist', 'ToplistRegion', 'ToplistType'],
+    'track': [
+        'LocalTrack', 'Track', 'TrackAvailability', 'TrackOfflineStatus',
+        'TrackSnapshot'],
+    'user': ['User'],
+}
+
+# Mapping from public names to the submodule exporting them.
+_LAZY_ATTRIBUTES = dict(
+    (name, module_name)
+    for module_name, names in _SUBMODULE_EXPORTS.items()
+    for name in names)
+
+# Names exported by ``from spotify import *``. As most names are only
+# imported on first use, they must be listed explicitly.
+__all__ = sorted(list(_LAZY_ATTRIBUTES) + [
+    'ffi',
+    'lib',
+    'serialized',
+    'serialized_accessor',
+    'session_instance',
+    'set_fine_grained_locking',
+    'set_metadata_caching',
+])
+
+# Submodules that are available as attributes of the package without
+# exporting any names into it.
+_LAZY_SUBMODULES = frozenset(['aio', 'release', 'stats', 'utils'])
+
+
+def _import_submodule(module_name):
+    """Import a submodule and add the names it exports to the package.
+
+    Internal function.
+    """
+    full_name = 'spotify.%s' % module_name
+    __import__(full_name)
+    module = sys.modules[full_name]
+    namespace = globals()
+    for name in module.__all__:
+        namespace[name] = getattr(module, name)
+    return module
+
+
+def __getattr__(name):
+    """Import submodules on first use.
+
+    Only called by Python 3.7+ for names that are not yet in the package
+    namespace. See :pep:`562`.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        _import_submodule(_LAZY_ATTRIBUTES[name])
+        return globals()[name]
+    if name in _LAZY_SUBMODULES:
+        full_name = 'spotify.%s' % name
+        __import__(full_name)
+        return sys.modules[full_name]
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    names = set(globals())
+    names.update(_LAZY_ATTRIBUTES)
+    names.update(_LAZY_SUBMODULES)
+    return sorted(names)
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ isn't supported, so import everything now.
+    for _module_name in sorted(_SUBMODULE_EXPORTS):
+        _import_submodule(_module_name)
+    from spotify import release, stats  # noqa
@@ -0,0 +1,47 @@
+"""CFFI build script for the out-of-line ``spotify._spotify`` module.
+
+Used by ``setup.py`` through the ``cffi_modules`` option. It can also be run
+directly to build the module in place::
+
+    python spotify/_spotify_build.py
+
+The header parsing is shared with the :meth:`cffi.FFI.verify` fallback in
+``spotify/__init__.py``, which is used when the module hasn't been built.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+from cffi import FFI
+
+
+def read_header():
+    """Read the preprocessed libspotify header."""
+    header_file = os.path.join(os.path.dirname(__file__), 'api.processed.h')
+    with open(header_file) as fh:
+        header = fh.read()
+    return header + '#define SPOTIFY_API_VERSION ...\n'
+
+
+def create_ffi():
+    """Create a CFFI instance with knowledge of all libspotify types."""
+    ffi = FFI()
+    ffi.cdef(read_header())
+    return ffi
+
+
+def build_ffi():
+    """Create the CFFI instance used to build the ``spotify._spotify``
+    module."""
+    ffi = create_ffi()
+    ffi.set_source(
+        str('spotify._spotify'),
+        '#include "libspotify/api.h"',
+        libraries=[str('spotify')])
+    return ffi
+
+
+if __name__ == '__main__':
+    build_ffi().compile(
+        tmpdir=os.path.join(os.path.dirname(__file__), os.pardir))
@@ -0,0 +1,294 @@
+from __future__ import unicode_literals
+
+import collections
+import logging
+import threading
+import time
+
+try:
+    # Python 3.4+
+    import asyncio
+except ImportError:
+    asyncio = None
+
+import spotify
+
+
+__all__ = [
+    'AsyncioEventLoop',
+    'EventStream',
+]
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before processing events again if processing them failed.
+_RETRY_TIMEOUT = 1.0
+
+
+def _get_running_loop():
+    """Get the running :mod:`asyncio` event loop, or :class:`None`.
+
+    Internal function.
+    """
+    try:
+        # Python 3.7+
+        return asyncio.get_running_loop()
+    except AttributeError:
+        return asyncio._get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncioEventLoop(object):
+    """Event loop for processing events from libspotify on an :mod:`asyncio`
+    event loop.
+
+    This is an alternative to :class:`~spotify.EventLoop` for applications
+    built around :mod:`asyncio`. Instead of running a separate thread, it
+    calls :meth:`~spotify.Session.process_events` as a callback on the
+    ``loop``, which defaults to the running event loop. If no event loop is
+    running, ``loop`` must be given. The callback is
+    scheduled when the session emits
+    :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD`, and when the timeout
+    returned by the last :meth:`~spotify.Session.process_events` call is
+    reached.
+
+    To use it, pass it your :class:`~spotify.Session` instance and call
+    :meth:`start`. Objects can then be loaded, searched for, and browsed by
+    awaiting :meth:`load`, :meth:`search`, and :meth:`browse`, so that a single
+    thread can wait for any number of them at once::
+
+        >>> import asyncio
+        >>> import spotify.aio
+        >>> session = spotify.Session()
+        >>> loop = asyncio.new_event_loop()
+        >>> event_loop = spotify.aio.AsyncioEventLoop(session, loop=loop)
+        >>> event_loop.start()
+        # ...
+        >>> async def get_name(uri):
+        ...     track = await event_loop.load(session.get_track(uri))
+        ...     return track.name
+
+    All event listeners, including the ones registered by
+    :meth:`session_events` and :meth:`playlist_events`, are called from the
+    thread running the ``loop``, except for the listeners of the events that
+    libspotify emits from its internal threads.
+
+    Requires Python 3.5+.
+    """
+
+    def __init__(self, session, loop=None):
+        if asyncio is None:
+            raise RuntimeError('AsyncioEventLoop requires Python 3.5+')
+        if loop is None:
+            loop = _get_running_loop()
+        if loop is None:
+            raise RuntimeError(
+                'No running asyncio event loop; pass the loop argument')
+        self._session = session
+        self._loop = loop
+        self._running = False
+        self._timer = None
+        self._thread = None
+
+        # Keep a reference to the bound method, so that the same object is
+        # passed to Session.on() and Session.off().
+        self._notify_listener = self._on_notify_main_thread
+
+    @property
+    def loop(self):
+        """The :mod:`asyncio` event loop events are processed on."""
+        return self._loop
+
+    def start(self):
+        """Start processing events on the :mod:`asyncio` event loop."""
+        self._running = True
+        self._session.on(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._notify_listener)
+        self._loop.call_soon_threadsafe(self._process_events)
+
+    def stop(self):
+        """Stop processing events.
+
+        Must be called from the thread running the :mod:`asyncio` event loop.
+        """
+        self._running = False
+        # Clear the flag even if stop() is called from another thread, so that
+        # loaders no longer wait for this loop to process events.
+        if (self._thread is not None and
+                self._session._event_loop_thread is self._thread):
+            self._session._event_loop_thread = None
+        self._thread = None
+        self._session.off(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD, self._notify_listener)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def load(self, obj, timeout=None):
+        """Get an awaitable :class:`asyncio.Future` that is completed with the
+        object when it is loaded.
+
+        The ``obj`` can be any object with a ``load_async()`` method, like
+        :class:`~spotify.Track` or :class:`~spotify.Playlist`. If loading
+        fails, the future's exception is a :exc:`~spotify.LibError`. After
+        ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+        """
+        return self._wrap(obj.load_async(timeout=timeout))
+
+    def search(self, query, **kwargs):
+        """Get an awaitable :class:`asyncio.Future` that is completed with a
+        :class:`~spotify.Search` when the search completes.
+
+        Takes the same arguments as :meth:`spotify.Session.search_async`.
+        """
+        return self._wrap(self._session.search_async(query, **kwargs))
+
+    def browse(self, obj, **kwargs):
+        """Get an awaitable :class:`asyncio.Future` that is completed with an
+        :class:`~spotify.AlbumBrowser` or :class:`~spotify.ArtistBrowser` when
+        the album or artist ``obj`` has been browsed.
+
+        Takes the same keyword arguments as :meth:`spotify.Album.browse_async`
+        or :meth:`spotify.Artist.browse_async`.
+        """
+        return self._wrap(obj.browse_async(**kwargs))
+
+    def session_events(self, *events):
+        """Get an :class:`EventStream` of the given session ``events``.
+
+        ``events`` are one or more :class:`~spotify.SessionEvent` values.
+        """
+        return EventStream(self._loop, self._session, events)
+
+    def playlist_events(self, playlist, *events):
+        """Get an :class:`EventStream` of the given ``events`` from
+        ``playlist``.
+
+        ``events`` are one or more :class:`~spotify.PlaylistEvent` values.
+        """
+        return EventStream(self._loop, playlist, events)
+
+    def _wrap(self, future):
+        return asyncio.wrap_future(future, loop=self._loop)
+
+    def _on_notify_main_thread(self, session):
+        # WARNING: This event listener is called from an internal libspotify
+        # thread. It must not block.
+        try:
+            self._loop.call_soon_threadsafe(self._process_events)
+        except RuntimeError:
+            # The asyncio event loop has been closed.
+            logger.debug('Event loop closed; dropped notification event')
+
+    def _process_events(self):
+        if not self._running:
+            return
+        # Threads waiting for objects to load leave processing events to us.
+        self._thread = threading.current_thread()
+        self._session._event_loop_thread = self._thread
+        if self._timer is not None:
+            self._timer.cancel()
+        timeout = _RETRY_TIMEOUT
+        try:
+            timeout = self._session.process_events() / 1000.0
+        except Exception:
+            logger.exception('Processing events failed')
+        finally:
+            # Wake up in time to time out futures from load(), as they are
+            # only completed by process_events().
+            deadline = self._session.next_load_deadline
+            if deadline is not None:
+                timeout = max(0, min(timeout, deadline - time.time()))
+
+            logger.debug('Processing events again in %.3fs', timeout)
+            self._timer = self._loop.call_later(
+                timeout, self._process_events)
+
+
+class EventStream(object):
+    """An asynchronous iterator over events from an event emitter, like a
+    :class:`~spotify.Session` or a :class:`~spotify.Playlist`.
+
+    You normally get an event stream from
+    :meth:`AsyncioEventLoop.session_events` or
+    :meth:`AsyncioEventLoop.playlist_events`. Each item is a tuple of the
+    event and the arguments the event was emitted with::
+
+        >>> stream = event_loop.playlist_events(
+        ...     playlist, spotify.PlaylistEvent.TRACKS_ADDED)
+        >>> async for event, args in stream:
+        ...     playlist, tracks, index = args
+        ...     print('%d tracks added' % len(tracks))
+
+    Events emitted before the iteration starts are kept until they're iterated
+    over. Call :meth:`close` to stop listening for events. The iteration ends
+    when all events received before :meth:`close` was called have been
+    iterated over.
+    """
+
+    def __init__(self, loop, emitter, events):
+        if not events:
+            raise ValueError('At least one event is required')
+        self._loop = loop
+        self._emitter = emitter
+        self._events = events
+        self._items = collections.deque()
+        self._waiters = collections.deque()
+        self._closed = False
+
+        # Keep a reference to the bound method, so that the same object is
+        # passed to on() and off().
+        self._listener = self._on_event
+        for event in events:
+            emitter.on(event, self._listener, event)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        waiter = asyncio.Future(loop=self._loop)
+        if self._items:
+            waiter.set_result(self._items.popleft())
+        elif self._closed:
+            waiter.set_exception(StopAsyncIteration())
+        else:
+            self._waiters.append(waiter)
+        return waiter
+
+    def close(self):
+        """Stop listening for events.
+
+        Must be called from the thread running the :mod:`asyncio` event loop.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for event in self._events:
+            self._emitter.off(event, self._listener)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(StopAsyncIteration())
+
+    def _on_event(self, *args):
+        # May be called from any thread, including internal libspotify
+        # threads. It must not block.
+        event_args, event = args[:-1], args[-1]
+        try:
+            self._loop.call_soon_threadsafe(self._put, (event, event_args))
+        except RuntimeError:
+            # The asyncio event loop has been closed.
+            logger.debug('Event loop closed; dropped %r event', event)
+
+    def _put(self, item):
+        if self._closed:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(item)
+                return
+        self._items.append(item)
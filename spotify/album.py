@@ -4,7 +4,7 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, serialized_accessor, utils
 
 
 __all__ = [
@@ -16,7 +16,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Album(object):
+class Album(utils.PointerEquality):
     """A Spotify album.
 
     You can get an album from a track or an artist, or you can create an
@@ -29,10 +29,27 @@ class Album(object):
         u'Forward / Return'
     """
 
+    __slots__ = ['_session', '_sp_album', '_memo', '__weakref__']
+
+    _sp_attr = '_sp_album'
+
+    @classmethod
+    def _cached(cls, session, sp_album, add_ref=True):
+        """
+        Get :class:`Album` instance for the given ``sp_album``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        return utils.get_cached(
+            session, sp_album, add_ref, lib.sp_album_release,
+            lambda: cls(session, sp_album=sp_album, add_ref=add_ref))
+
     def __init__(self, session, uri=None, sp_album=None, add_ref=True):
         assert uri or sp_album, 'uri or sp_album is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             album = spotify.Link(self._session, uri=uri).as_album()
@@ -44,7 +61,7 @@ class Album(object):
 
         if add_ref:
             lib.sp_album_add_ref(sp_album)
-        self._sp_album = ffi.gc(sp_album, lib.sp_album_release)
+        self._sp_album = release.gc(sp_album, lib.sp_album_release)
 
     def __repr__(self):
         return 'Album(%r)' % self.link.uri
@@ -64,6 +81,20 @@ class Album(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the album when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def is_available(self):
         """Whether the album is available in the current region.
@@ -75,7 +106,8 @@ class Album(object):
         return bool(lib.sp_album_is_available(self._sp_album))
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def artist(self):
         """The artist of the album.
 
@@ -84,7 +116,8 @@ class Album(object):
         sp_artist = lib.sp_album_artist(self._sp_album)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     @serialized
     def cover(self, image_size=None):
@@ -102,7 +135,8 @@ class Album(object):
         if cover_id == ffi.NULL:
             return None
         sp_image = lib.sp_image_create(self._session._sp_session, cover_id)
-        return spotify.Image(self._session, sp_image=sp_image, add_ref=False)
+        return spotify.Image._cached(
+            self._session, sp_image=sp_image, add_ref=False)
 
     def cover_link(self, image_size=None):
         """A :class:`Link` to the album's cover.
@@ -121,7 +155,8 @@ class Album(object):
         return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def name(self):
         """The album's name.
 
@@ -131,6 +166,7 @@ class Album(object):
         return name if name else None
 
     @property
+    @utils.memoized
     def year(self):
         """The album's release year.
 
@@ -141,6 +177,7 @@ class Album(object):
         return lib.sp_album_year(self._sp_album)
 
     @property
+    @utils.memoized
     def type(self):
         """The album's :class:`AlbumType`.
 
@@ -168,8 +205,16 @@ class Album(object):
         return spotify.AlbumBrowser(
             self._session, album=self, callback=callback)
 
+    def browse_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with an
+        :class:`AlbumBrowser` for the album when the browser is loaded.
 
-class AlbumBrowser(object):
+        See :meth:`AlbumBrowser.load_async`.
+        """
+        return self.browse().load_async(timeout=timeout)
+
+
+class AlbumBrowser(utils.PointerEquality):
     """An album browser for a Spotify album.
 
     You can get an album browser from any :class:`Album` instance by calling
@@ -182,6 +227,16 @@ class AlbumBrowser(object):
         7
     """
 
+    __slots__ = [
+        '_session',
+        '_sp_albumbrowse',
+        '_complete_event',
+        '_callback_handles',
+        '__weakref__',
+    ]
+
+    _sp_attr = '_sp_albumbrowse'
+
     def __init__(
             self, session, album=None, callback=None,
             sp_albumbrowse=None, add_ref=True):
@@ -189,7 +244,7 @@ class AlbumBrowser(object):
         assert album or sp_albumbrowse, 'album or sp_albumbrowse is required'
 
         self._session = session
-        self.complete_event = threading.Event()
+        self._complete_event = threading.Event()
         self._callback_handles = set()
 
         if sp_albumbrowse is None:
@@ -206,12 +261,14 @@ class AlbumBrowser(object):
 
         if add_ref:
             lib.sp_albumbrowse_add_ref(sp_albumbrowse)
-        self._sp_albumbrowse = ffi.gc(
+        self._sp_albumbrowse = release.gc(
             sp_albumbrowse, lib.sp_albumbrowse_release)
 
-    complete_event = None
-    """:class:`threading.Event` that is set when the album browser is loaded.
-    """
+    @property
+    def complete_event(self):
+        """:class:`threading.Event` that is set when the album browser is
+        loaded."""
+        return self._complete_event
 
     def __repr__(self):
         if self.is_loaded:
@@ -234,6 +291,20 @@ class AlbumBrowser(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the album browser when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the album browser.
@@ -278,7 +349,8 @@ class AlbumBrowser(object):
         sp_artist = lib.sp_albumbrowse_artist(self._sp_albumbrowse)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     @property
     @serialized
@@ -314,7 +386,7 @@ class AlbumBrowser(object):
 
         @serialized
         def get_track(sp_albumbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_albumbrowse_track(sp_albumbrowse, key),
                 add_ref=True)
@@ -347,6 +419,7 @@ def _albumbrowse_complete_callback(sp_albumbrowse, handle):
     (callback, album_browser) = ffi.from_handle(handle)
     album_browser._callback_handles.remove(handle)
     album_browser.complete_event.set()
+    album_browser._session._notify_loaders()
     if callback is not None:
         callback(album_browser)
 
@@ -4,7 +4,7 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, serialized_accessor, utils
 
 
 __all__ = [
@@ -16,7 +16,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Artist(object):
+class Artist(utils.PointerEquality):
     """A Spotify artist.
 
     You can get artists from tracks and albums, or you can create an
@@ -30,10 +30,27 @@ class Artist(object):
         u'Rob Dougan'
     """
 
+    __slots__ = ['_session', '_sp_artist', '_memo', '__weakref__']
+
+    _sp_attr = '_sp_artist'
+
+    @classmethod
+    def _cached(cls, session, sp_artist, add_ref=True):
+        """
+        Get :class:`Artist` instance for the given ``sp_artist``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        return utils.get_cached(
+            session, sp_artist, add_ref, lib.sp_artist_release,
+            lambda: cls(session, sp_artist=sp_artist, add_ref=add_ref))
+
     def __init__(self, session, uri=None, sp_artist=None, add_ref=True):
         assert uri or sp_artist, 'uri or sp_artist is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             artist = spotify.Link(self._session, uri=uri).as_artist()
@@ -44,13 +61,14 @@ class Artist(object):
 
         if add_ref:
             lib.sp_artist_add_ref(sp_artist)
-        self._sp_artist = ffi.gc(sp_artist, lib.sp_artist_release)
+        self._sp_artist = release.gc(sp_artist, lib.sp_artist_release)
 
     def __repr__(self):
         return 'Artist(%r)' % self.link.uri
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def name(self):
         """The artist's name.
 
@@ -74,6 +92,20 @@ class Artist(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the artist when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @serialized
     def portrait(self, image_size=None):
         """The artist's portrait :class:`Image`.
@@ -91,7 +123,8 @@ class Artist(object):
             return None
         sp_image = lib.sp_image_create(
             self._session._sp_session, portrait_id)
-        return spotify.Image(self._session, sp_image=sp_image, add_ref=False)
+        return spotify.Image._cached(
+            self._session, sp_image=sp_image, add_ref=False)
 
     def portrait_link(self, image_size=None):
         """A :class:`Link` to the artist's portrait.
@@ -130,8 +163,16 @@ class Artist(object):
         return spotify.ArtistBrowser(
             self._session, artist=self, type=type, callback=callback)
 
+    def browse_async(self, type=None, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with an
+        :class:`ArtistBrowser` for the artist when the browser is loaded.
 
-class ArtistBrowser(object):
+        See :meth:`browse` and :meth:`ArtistBrowser.load_async`.
+        """
+        return self.browse(type=type).load_async(timeout=timeout)
+
+
+class ArtistBrowser(utils.PointerEquality):
     """An artist browser for a Spotify artist.
 
     You can get an artist browser from any :class:`Artist` instance by calling
@@ -144,6 +185,16 @@ class ArtistBrowser(object):
         7
     """
 
+    __slots__ = [
+        '_session',
+        '_sp_artistbrowse',
+        '_complete_event',
+        '_callback_handles',
+        '__weakref__',
+    ]
+
+    _sp_attr = '_sp_artistbrowse'
+
     def __init__(
             self, session, artist=None, type=None, callback=None,
             sp_artistbrowse=None, add_ref=True):
@@ -152,7 +203,7 @@ class ArtistBrowser(object):
             'artist or sp_artistbrowse is required')
 
         self._session = session
-        self.complete_event = threading.Event()
+        self._complete_event = threading.Event()
         self._callback_handles = set()
 
         if sp_artistbrowse is None:
@@ -172,12 +223,14 @@ class ArtistBrowser(object):
 
         if add_ref:
             lib.sp_artistbrowse_add_ref(sp_artistbrowse)
-        self._sp_artistbrowse = ffi.gc(
+        self._sp_artistbrowse = release.gc(
             sp_artistbrowse, lib.sp_artistbrowse_release)
 
-    complete_event = None
-    """:class:`threading.Event` that is set when the artist browser is loaded.
-    """
+    @property
+    def complete_event(self):
+        """:class:`threading.Event` that is set when the artist browser is
+        loaded."""
+        return self._complete_event
 
     def __repr__(self):
         if self.is_loaded:
@@ -200,6 +253,20 @@ class ArtistBrowser(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the artist browser when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the artist browser.
@@ -248,7 +315,7 @@ class ArtistBrowser(object):
         def get_image(sp_artistbrowse, key):
             image_id = lib.sp_artistbrowse_portrait(sp_artistbrowse, key)
             sp_image = lib.sp_image_create(image_id)
-            return spotify.Image(
+            return spotify.Image._cached(
                 self._session, sp_image=sp_image, add_ref=False)
 
         return utils.Sequence(
@@ -274,7 +341,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_artistbrowse_track(sp_artistbrowse, key),
                 add_ref=True)
@@ -298,7 +365,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_artistbrowse_tophit_track(
                     sp_artistbrowse, key),
@@ -326,7 +393,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_album(sp_artistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_artistbrowse_album(sp_artistbrowse, key),
                 add_ref=True)
@@ -350,7 +417,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_artist(sp_artistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_artistbrowse_similar_artist(
                     sp_artistbrowse, key),
@@ -384,6 +451,7 @@ def _artistbrowse_complete_callback(sp_artistbrowse, handle):
     (callback, artist_browser) = ffi.from_handle(handle)
     artist_browser._callback_handles.remove(handle)
     artist_browser.complete_event.set()
+    artist_browser._session._notify_loaders()
     if callback is not None:
         callback(artist_browser)
 
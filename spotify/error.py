@@ -24,10 +24,11 @@ class Error(Exception):
 
         Internal method.
         """
-        ignores = set(ignores or [])
-        ignores.add(ErrorType.OK)
-        if error_type not in ignores:
-            raise LibError(error_type)
+        if error_type == ErrorType.OK:
+            return
+        if ignores is not None and error_type in ignores:
+            return
+        raise LibError(error_type)
 
 
 @utils.make_enum('SP_ERROR_')
@@ -35,6 +36,26 @@ class ErrorType(utils.IntEnum):
     pass
 
 
+# Ignores for :meth:`Error.maybe_raise` when checking objects that may still
+# be loading. Shared to avoid creating a new collection on every check.
+_IGNORE_IS_LOADING = frozenset([ErrorType.IS_LOADING])
+
+
+# Mapping from error types to their messages from libspotify. The messages
+# never change, so each is only fetched once. Filled when the error types are
+# added as attributes of :exc:`LibError` below.
+_error_messages = {}
+
+
+@serialized
+def _get_error_message(error_type):
+    message = _error_messages.get(error_type)
+    if message is None:
+        message = utils.to_unicode(lib.sp_error_message(error_type))
+        _error_messages[error_type] = message
+    return message
+
+
 class LibError(Error):
     """A libspotify error.
 
@@ -47,10 +68,11 @@ class LibError(Error):
     error_type = None
     """The :class:`ErrorType` of the error."""
 
-    @serialized
     def __init__(self, error_type):
         self.error_type = error_type
-        message = utils.to_unicode(lib.sp_error_message(error_type))
+        message = _error_messages.get(error_type)
+        if message is None:
+            message = _get_error_message(error_type)
         super(Error, self).__init__(message)
 
     def __eq__(self, other):
@@ -60,11 +82,9 @@ class LibError(Error):
         return not self.__eq__(other)
 
 
-for attr in dir(lib):
-    if attr.startswith('SP_ERROR_'):
-        name = attr.replace('SP_ERROR_', '')
-        error_no = getattr(lib, attr)
-        setattr(LibError, name, LibError(error_no))
+for attr, error_no in utils._get_constants('SP_ERROR_'):
+    name = attr.replace('SP_ERROR_', '')
+    setattr(LibError, name, LibError(error_no))
 
 
 class Timeout(Error):
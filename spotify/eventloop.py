@@ -1,7 +1,10 @@
 from __future__ import unicode_literals
 
+import collections
+import copy
 import logging
 import threading
+import time
 
 try:
     # Python 3
@@ -11,6 +14,7 @@ except ImportError:
     import Queue as queue
 
 import spotify
+from spotify import stats, utils
 
 
 __all__ = [
@@ -40,59 +44,246 @@ class EventLoop(threading.Thread):
     :meth:`~threading.Thread.join` to block until the event loop thread has
     finished, just like for any other thread.
 
+    A slow event listener blocks the event loop thread, so that no other
+    events are processed until it returns. To avoid this, pass ``workers`` to
+    call the event listeners from a pool of that many worker threads instead::
+
+        >>> event_loop = spotify.EventLoop(session, workers=4, budget=0.01)
+
+    Events emitted by the same object, e.g. the same
+    :class:`~spotify.Playlist`, are still passed to the listeners one at a
+    time and in order. Events emitted during an iteration of the event loop
+    are passed to the listeners in the event loop thread until ``budget``
+    seconds, by default 0, have passed since the iteration started. The rest
+    of the events are handed to the worker threads, so that
+    :meth:`~spotify.Session.process_events` returns in about ``budget``
+    seconds, plus the time of the slowest listener called from the event loop
+    thread. Events emitted by other threads are always passed to the
+    listeners in the thread that emitted them.
+
     .. warning::
 
         If you use :class:`EventLoop` to process the libspotify events, any
         event listeners you've registered will be called from the event loop
-        thread. pyspotify itself is thread safe, but you'll need to ensure that
-        you have proper synchronization in your own application code, as always
-        when working with threads.
+        thread, or from its worker threads. pyspotify itself is thread safe,
+        but you'll need to ensure that you have proper synchronization in your
+        own application code, as always when working with threads.
     """
 
     daemon = True
     name = 'SpotifyEventLoop'
 
-    def __init__(self, session):
+    def __init__(self, session, workers=None, budget=0):
         threading.Thread.__init__(self)
 
         self._session = session
         self._runnable = True
-        self._queue = queue.Queue()
+
+        if workers:
+            self._dispatcher = _ListenerDispatcher(workers, budget)
+        else:
+            self._dispatcher = None
+
+        # Notifications are coalesced: however many arrive while the loop is
+        # busy, they are all handled by the next process_events() call.
+        self._wakeup = threading.Condition()
+        self._notified = False
+        self._notified_at = None
+
+        self._stats_lock = threading.Lock()
+        self._stats = stats.EventLoopStats()
 
     def start(self):
         """Start the event loop."""
         self._session.on(
             spotify.SessionEvent.NOTIFY_MAIN_THREAD,
             self._on_notify_main_thread)
+        if self._dispatcher is not None:
+            self._dispatcher.start(self)
+            utils._dispatcher = self._dispatcher
+        self._session._event_loop_thread = self
         threading.Thread.start(self)
 
     def stop(self):
-        """Stop the event loop."""
-        self._runnable = False
+        """Stop the event loop.
+
+        If the event loop has worker threads, they stop after calling the
+        listeners of the events already handed to them.
+        """
         self._session.off(
             spotify.SessionEvent.NOTIFY_MAIN_THREAD,
             self._on_notify_main_thread)
+        if self._session._event_loop_thread is self:
+            self._session._event_loop_thread = None
+        with self._wakeup:
+            self._runnable = False
+            self._wakeup.notify()
+        if self._dispatcher is not None:
+            if utils._dispatcher is self._dispatcher:
+                utils._dispatcher = None
+            self._dispatcher.stop()
+
+    def stats(self):
+        """Get statistics about the event loop's iterations.
+
+        Returns a :class:`~spotify.stats.EventLoopStats` snapshot, with
+        histograms of how long :meth:`~spotify.Session.process_events` takes
+        and how long notifications wait before they are processed, the number
+        of wakeups caused by notifications and by timeouts, and the number of
+        event listeners called per iteration.
+
+        The statistics are always recorded. To detect that the event loop is
+        stuck, e.g. behind a slow event listener, check
+        :attr:`~spotify.stats.EventLoopStats.processing_since`.
+        """
+        with self._stats_lock:
+            snapshot = copy.deepcopy(self._stats)
+        if self._dispatcher is not None:
+            snapshot.offloaded = self._dispatcher.offloaded
+        return snapshot
 
     def run(self):
         logger.debug('Spotify event loop started')
-        timeout = self._session.process_events() / 1000.0
+        timeout = self._process_events()
         while self._runnable:
-            try:
-                logger.debug('Waiting %.3fs for new events', timeout)
-                self._queue.get(timeout=timeout)
-            except queue.Empty:
-                logger.debug('Timeout reached; processing events')
-            else:
+            with self._wakeup:
+                if not self._notified and self._runnable:
+                    logger.debug('Waiting %.3fs for new events', timeout)
+                    self._wakeup.wait(timeout)
+                notified = self._notified
+                notified_at = self._notified_at
+                self._notified = False
+                self._notified_at = None
+            if not self._runnable:
+                break
+            if notified:
                 logger.debug('Notification received; processing events')
-            finally:
-                timeout = self._session.process_events() / 1000.0
+            else:
+                logger.debug('Timeout reached; processing events')
+            timeout = self._process_events(notified, notified_at)
         logger.debug('Spotify event loop stopped')
 
+    def _process_events(self, notified=None, notified_at=None):
+        with self._stats_lock:
+            if notified:
+                self._stats.notification_wakeups += 1
+            elif notified is not None:
+                self._stats.timeout_wakeups += 1
+            self._stats.processing_since = time.time()
+        listeners_called = utils.listeners_called()
+        start = stats._clock()
+        if self._dispatcher is not None:
+            self._dispatcher.begin_iteration(start)
+        try:
+            return self._session.process_events() / 1000.0
+        finally:
+            if self._dispatcher is not None:
+                self._dispatcher.end_iteration()
+            duration = stats._clock() - start
+            listeners = utils.listeners_called() - listeners_called
+            with self._stats_lock:
+                self._stats.iterations += 1
+                self._stats.processing_since = None
+                self._stats.process_events.add(duration)
+                if notified_at is not None:
+                    self._stats.notify_delay.add(start - notified_at)
+                self._stats.listeners += listeners
+                if listeners > self._stats.max_listeners:
+                    self._stats.max_listeners = listeners
+
     def _on_notify_main_thread(self, session):
         # WARNING: This event listener is called from an internal libspotify
-        # thread. It must not block.
-        try:
-            self._queue.put_nowait(1)
-        except queue.Full:
-            logger.warning(
-                'Event loop queue full; dropped notification event')
+        # thread. It must not block. The lock is only held briefly by the
+        # event loop thread, as waiting on the condition releases it.
+        with self._wakeup:
+            self._notified = True
+            if self._notified_at is None:
+                self._notified_at = stats._clock()
+            self._wakeup.notify()
+
+
+class _ListenerDispatcher(object):
+    """Calls the listeners of events emitted by the event loop thread from a
+    pool of worker threads, once the iteration's time budget is spent.
+
+    The events of each emitter are queued and passed to the listeners by one
+    worker thread at a time, so that they are handled in the order they were
+    emitted.
+
+    Internal class.
+    """
+
+    def __init__(self, workers, budget):
+        self._budget = budget
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._ready = queue.Queue()
+        self._event_loop = None
+        self._deadline = None
+        self._threads = [
+            threading.Thread(
+                target=self._work, name='SpotifyEventDispatcher-%d' % i)
+            for i in range(workers)]
+        for thread in self._threads:
+            thread.daemon = True
+        self.offloaded = 0
+
+    def start(self, event_loop):
+        self._event_loop = event_loop
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        for _ in self._threads:
+            self._ready.put(None)
+
+    def begin_iteration(self, start):
+        self._deadline = start + self._budget
+
+    def end_iteration(self):
+        self._deadline = None
+
+    def __call__(self, emitter, event, event_args):
+        if (self._deadline is None or
+                threading.current_thread() is not self._event_loop):
+            return emitter._emit(event, event_args)
+        # Emitters are keyed by identity, as equal wrappers of the same
+        # libspotify object have listeners of their own.
+        key = id(emitter)
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None and stats._clock() < self._deadline:
+                # Nothing from this emitter is waiting for a worker, so the
+                # listeners can be called right away without reordering.
+                inline = True
+            else:
+                inline = False
+                self.offloaded += 1
+                if entry is None:
+                    # The entry keeps the emitter alive, so that its id isn't
+                    # reused while events are pending.
+                    self._pending[key] = (
+                        emitter, collections.deque([(event, event_args)]))
+                    self._ready.put(key)
+                else:
+                    entry[1].append((event, event_args))
+        if inline:
+            emitter._emit(event, event_args)
+
+    def _work(self):
+        while True:
+            key = self._ready.get()
+            if key is None:
+                return
+            while True:
+                with self._lock:
+                    emitter, pending = self._pending[key]
+                    if not pending:
+                        del self._pending[key]
+                        break
+                    event, event_args = pending.popleft()
+                try:
+                    emitter._emit(event, event_args)
+                except Exception:
+                    logger.exception(
+                        'Event listener for %r raised an exception', event)
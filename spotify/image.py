@@ -5,7 +5,7 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
 
 
 __all__ = [
@@ -17,7 +17,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Image(object):
+class Image(utils.PointerEquality):
     """A Spotify image.
 
     You can get images from :meth:`Album.cover`, :meth:`Artist.portrait`, or
@@ -31,6 +31,28 @@ class Image(object):
         u'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEBLAEsAAD'
     """
 
+    __slots__ = [
+        '_session',
+        '_sp_image',
+        '_load_event',
+        '_callback_handles',
+        '__weakref__',
+    ]
+
+    _sp_attr = '_sp_image'
+
+    @classmethod
+    def _cached(cls, session, sp_image, add_ref=True):
+        """
+        Get :class:`Image` instance for the given ``sp_image``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        return utils.get_cached(
+            session, sp_image, add_ref, lib.sp_image_release,
+            lambda: cls(session, sp_image=sp_image, add_ref=add_ref))
+
     def __init__(self, session, uri=None, sp_image=None, add_ref=True):
         assert uri or sp_image, 'uri or sp_image is required'
 
@@ -46,17 +68,19 @@ class Image(object):
 
         if add_ref:
             lib.sp_image_add_ref(sp_image)
-        self._sp_image = ffi.gc(sp_image, lib.sp_image_release)
+        self._sp_image = release.gc(sp_image, lib.sp_image_release)
 
-        self.load_event = threading.Event()
+        self._load_event = threading.Event()
         self._callback_handles = set()
 
     def __repr__(self):
         return 'Image(%r)' % self.link.uri
 
     # FIXME The event is never set.
-    load_event = None
-    """:class:`threading.Event` that is set when the image is loaded."""
+    @property
+    def load_event(self):
+        """:class:`threading.Event` that is set when the image is loaded."""
+        return self._load_event
 
     @serialized
     def add_load_callback(self, callback):
@@ -109,6 +133,20 @@ class Image(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the image when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def format(self):
         """The :class:`ImageFormat` of the image.
@@ -167,6 +205,7 @@ def _image_load_callback(sp_image, handle):
         return
     (callback, image) = ffi.from_handle(handle)
     image._callback_handles.remove(handle)
+    image._session._notify_loaders()
     if callback is not None:
         callback(image)
 
@@ -4,7 +4,7 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
 
 
 __all__ = [
@@ -14,9 +14,11 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class InboxPostResult(object):
+class InboxPostResult(utils.PointerEquality):
     """The result object returned by :meth:`Session.inbox_post_tracks`."""
 
+    _sp_attr = '_sp_inbox'
+
     @serialized
     def __init__(
             self, session, canonical_username=None, tracks=None, message='',
@@ -54,7 +56,7 @@ class InboxPostResult(object):
 
         if add_ref:
             lib.sp_inbox_add_ref(sp_inbox)
-        self._sp_inbox = ffi.gc(sp_inbox, lib.sp_inbox_release)
+        self._sp_inbox = release.gc(sp_inbox, lib.sp_inbox_release)
 
     complete_event = None
     """:class:`threading.Event` that is set when the inbox post is
@@ -85,5 +87,6 @@ def _inboxpost_complete_callback(sp_inbox, handle):
     (callback, inbox_post_result) = ffi.from_handle(handle)
     inbox_post_result._callback_handles.remove(handle)
     inbox_post_result.complete_event.set()
+    inbox_post_result._session._notify_loaders()
     if callback is not None:
         callback(inbox_post_result)
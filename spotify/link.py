@@ -1,7 +1,7 @@
 from __future__ import unicode_literals
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
 
 
 __all__ = [
@@ -10,7 +10,7 @@ __all__ = [
 ]
 
 
-class Link(object):
+class Link(utils.PointerEquality):
     """A Spotify object link.
 
     Call the :meth:`~Session.get_link` method on your :class:`Session` instance
@@ -39,6 +39,10 @@ class Link(object):
         u'Get Lucky'
     """
 
+    __slots__ = ['_session', '_sp_link', '__weakref__']
+
+    _sp_attr = '_sp_link'
+
     def __init__(self, session, uri=None, sp_link=None, add_ref=True):
         assert uri or sp_link, 'uri or sp_link is required'
 
@@ -53,7 +57,7 @@ class Link(object):
 
         if add_ref:
             lib.sp_link_add_ref(sp_link)
-        self._sp_link = ffi.gc(sp_link, lib.sp_link_release)
+        self._sp_link = release.gc(sp_link, lib.sp_link_release)
 
     def __repr__(self):
         return 'Link(%r)' % self.uri
@@ -77,7 +81,8 @@ class Link(object):
         sp_track = lib.sp_link_as_track(self._sp_link)
         if sp_track == ffi.NULL:
             return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return spotify.Track._cached(
+            self._session, sp_track=sp_track, add_ref=True)
 
     def as_track_offset(self):
         """Get the track offset in milliseconds from the link."""
@@ -93,7 +98,8 @@ class Link(object):
         sp_album = lib.sp_link_as_album(self._sp_link)
         if sp_album == ffi.NULL:
             return None
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(
+            self._session, sp_album=sp_album, add_ref=True)
 
     @serialized
     def as_artist(self):
@@ -101,7 +107,8 @@ class Link(object):
         sp_artist = lib.sp_link_as_artist(self._sp_link)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     def as_playlist(self):
         """Make a :class:`Playlist` from the link."""
@@ -120,7 +127,8 @@ class Link(object):
         sp_user = lib.sp_link_as_user(self._sp_link)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self._session, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(
+            self._session, sp_user=sp_user, add_ref=True)
 
     def as_image(self):
         """Make an :class:`Image` from the link."""
@@ -130,7 +138,8 @@ class Link(object):
             self._session._sp_session, self._sp_link)
         if sp_image == ffi.NULL:
             return None
-        return spotify.Image(self._session, sp_image=sp_image, add_ref=False)
+        return spotify.Image._cached(
+            self._session, sp_image=sp_image, add_ref=False)
 
 
 @utils.make_enum('SP_LINKTYPE_')
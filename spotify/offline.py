@@ -15,6 +15,8 @@ class OfflineSyncStatus(object):
     :class:`~spotify.Session` instance.
     """
 
+    __slots__ = ['_sp_offline_sync_status']
+
     def __init__(self, sp_offline_sync_status):
         self._sp_offline_sync_status = sp_offline_sync_status
 
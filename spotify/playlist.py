@@ -6,7 +6,7 @@ import pprint
 import re
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
 
 
 __all__ = [
@@ -24,7 +24,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Playlist(utils.EventEmitter):
+class Playlist(utils.EventEmitter, utils.PointerEquality):
     """A Spotify playlist.
 
     You can get playlists from the :attr:`~Session.playlist_container`,
@@ -40,8 +40,9 @@ class Playlist(utils.EventEmitter):
         u'500C feelgood playlist'
     """
 
+    _sp_attr = '_sp_playlist'
+
     @classmethod
-    @serialized
     def _cached(cls, session, sp_playlist, add_ref=True):
         """
         Get :class:`Playlist` instance for the given ``sp_playlist``. If
@@ -49,11 +50,9 @@ class Playlist(utils.EventEmitter):
 
         Internal method.
         """
-        if sp_playlist in session._cache:
-            return session._cache[sp_playlist]
-        playlist = Playlist(session, sp_playlist=sp_playlist, add_ref=add_ref)
-        session._cache[sp_playlist] = playlist
-        return playlist
+        return utils.get_cached(
+            session, sp_playlist, add_ref, lib.sp_playlist_release,
+            lambda: cls(session, sp_playlist=sp_playlist, add_ref=add_ref))
 
     def __init__(self, session, uri=None, sp_playlist=None, add_ref=True):
         super(Playlist, self).__init__()
@@ -72,17 +71,33 @@ class Playlist(utils.EventEmitter):
 
         if add_ref:
             lib.sp_playlist_add_ref(sp_playlist)
-        self._sp_playlist = ffi.gc(sp_playlist, lib.sp_playlist_release)
+        self._sp_playlist = release.gc(sp_playlist, lib.sp_playlist_release)
 
-        self._sp_playlist_callbacks = _PlaylistCallbacks.get_struct()
-        lib.sp_playlist_add_callbacks(
-            self._sp_playlist, self._sp_playlist_callbacks, ffi.NULL)
+    _sp_playlist_callbacks = None
+    """The ``sp_playlist_callbacks`` struct registered with libspotify, or
+    :class:`None`.
+
+    The callbacks are only registered while the playlist has event listeners
+    or is being loaded, as most playlists never get any listeners. See
+    :meth:`_update_callbacks`.
+
+    Internal attribute.
+    """
+
+    _num_loaders = 0
+    """The number of ongoing :meth:`load` calls and pending :meth:`load_async`
+    futures for the playlist.
+
+    The ``playlist_state_changed`` callback wakes up the loaders, so the
+    callbacks are registered while this is nonzero.
+
+    Internal attribute.
+    """
 
     def __del__(self):
         if not hasattr(self, '_sp_playlist'):
             return
-        lib.sp_playlist_remove_callbacks(
-            self._sp_playlist, self._sp_playlist_callbacks, ffi.NULL)
+        self._remove_callbacks()
 
     def __repr__(self):
         if not self.is_loaded:
@@ -105,7 +120,32 @@ class Playlist(utils.EventEmitter):
 
         The method returns ``self`` to allow for chaining of calls.
         """
-        return utils.load(self._session, self, timeout=timeout)
+        self._begin_loading()
+        try:
+            return utils.load(self._session, self, timeout=timeout)
+        finally:
+            self._end_loading()
+
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the playlist when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        self._begin_loading()
+        try:
+            future = utils.load_async(self._session, self, timeout=timeout)
+        except Exception:
+            self._end_loading()
+            raise
+        future.add_done_callback(lambda future: self._end_loading())
+        return future
 
     @property
     @serialized
@@ -119,7 +159,7 @@ class Playlist(utils.EventEmitter):
 
         @serialized
         def get_track(sp_playlist, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_playlist_track(sp_playlist, key), add_ref=True)
 
@@ -179,7 +219,7 @@ class Playlist(utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlist_owner(self._sp_playlist), add_ref=True)
 
@@ -228,7 +268,8 @@ class Playlist(utils.EventEmitter):
         if not has_image:
             return None
         sp_image = lib.sp_image_create(self._session._sp_session, image_id)
-        return spotify.Image(self._session, sp_image=sp_image, add_ref=False)
+        return spotify.Image._cached(
+            self._session, sp_image=sp_image, add_ref=False)
 
     @property
     def has_pending_changes(self):
@@ -393,19 +434,74 @@ class Playlist(utils.EventEmitter):
 
     @serialized
     def on(self, event, listener, *user_args):
-        if self not in self._session._emitters:
-            self._session._emitters.append(self)
+        self._session._emitters[id(self)] = self
         super(Playlist, self).on(event, listener, *user_args)
+        self._update_callbacks()
     on.__doc__ = utils.EventEmitter.on.__doc__
 
     @serialized
     def off(self, event=None, listener=None):
         super(Playlist, self).off(event, listener)
-        if (self.num_listeners() == 0 and
-                self in self._session._emitters):
-            self._session._emitters.remove(self)
+        if self.num_listeners() == 0:
+            self._session._emitters.pop(id(self), None)
+        self._update_callbacks()
     off.__doc__ = utils.EventEmitter.off.__doc__
 
+    @serialized
+    def _begin_loading(self):
+        """Register the playlist callbacks until :meth:`_end_loading` is
+        called.
+
+        Internal method.
+        """
+        self._num_loaders += 1
+        self._update_callbacks()
+
+    @serialized
+    def _end_loading(self):
+        """Undo a call to :meth:`_begin_loading`.
+
+        Internal method.
+        """
+        self._num_loaders -= 1
+        self._update_callbacks()
+
+    @serialized
+    def _update_callbacks(self):
+        """Register the playlist callbacks with libspotify if the playlist has
+        event listeners or is being loaded, and unregister them if not.
+
+        Internal method.
+        """
+        if self.num_listeners() or self._num_loaders:
+            self._add_callbacks()
+        else:
+            self._remove_callbacks()
+
+    def _add_callbacks(self):
+        """Register the playlist callbacks with libspotify, unless they are
+        registered already.
+
+        Internal method.
+        """
+        if self._sp_playlist_callbacks is not None:
+            return
+        self._sp_playlist_callbacks = _PlaylistCallbacks.get_struct()
+        lib.sp_playlist_add_callbacks(
+            self._sp_playlist, self._sp_playlist_callbacks, ffi.NULL)
+
+    def _remove_callbacks(self):
+        """Unregister the playlist callbacks from libspotify, if they are
+        registered.
+
+        Internal method.
+        """
+        if self._sp_playlist_callbacks is None:
+            return
+        lib.sp_playlist_remove_callbacks(
+            self._sp_playlist, self._sp_playlist_callbacks, ffi.NULL)
+        self._sp_playlist_callbacks = None
+
 
 class PlaylistEvent(object):
     """Playlist events.
@@ -599,7 +695,7 @@ class _PlaylistCallbacks(object):
         playlist = Playlist._cached(
             spotify.session_instance, sp_playlist, add_ref=True)
         tracks = [
-            spotify.Track(
+            spotify.Track._cached(
                 spotify.session_instance, sp_track=sp_tracks[i], add_ref=True)
             for i in range(num_tracks)]
         playlist.emit(
@@ -642,6 +738,7 @@ class _PlaylistCallbacks(object):
         logger.debug('Playlist state changed')
         playlist = Playlist._cached(
             spotify.session_instance, sp_playlist, add_ref=True)
+        spotify.session_instance._notify_loaders()
         playlist.emit(PlaylistEvent.PLAYLIST_STATE_CHANGED, playlist)
 
     @staticmethod
@@ -669,7 +766,7 @@ class _PlaylistCallbacks(object):
         logger.debug('Playlist track created changed')
         playlist = Playlist._cached(
             spotify.session_instance, sp_playlist, add_ref=True)
-        user = spotify.User(
+        user = spotify.User._cached(
             spotify.session_instance, sp_user=sp_user, add_ref=True)
         playlist.emit(
             PlaylistEvent.TRACK_CREATED_CHANGED,
@@ -706,7 +803,7 @@ class _PlaylistCallbacks(object):
             spotify.session_instance, sp_playlist, add_ref=True)
         sp_image = lib.sp_image_create(
             spotify.session_instance._sp_session, image_id)
-        image = spotify.Image(
+        image = spotify.Image._cached(
             spotify.session_instance, sp_image=sp_image, add_ref=False)
         playlist.emit(PlaylistEvent.IMAGE_CHANGED, playlist, image)
 
@@ -731,7 +828,9 @@ class _PlaylistCallbacks(object):
         playlist.emit(PlaylistEvent.SUBSCRIBERS_CHANGED, playlist)
 
 
-class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
+class PlaylistContainer(
+        collections.MutableSequence, utils.EventEmitter,
+        utils.PointerEquality):
     """A Spotify playlist container.
 
     The playlist container can be accessed as a regular Python collection to
@@ -783,8 +882,9 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
         >>> container[0] = playlist
     """
 
+    _sp_attr = '_sp_playlistcontainer'
+
     @classmethod
-    @serialized
     def _cached(cls, session, sp_playlistcontainer, add_ref=True):
         """
         Get :class:`PlaylistContainer` instance for the given
@@ -793,13 +893,12 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
 
         Internal method.
         """
-        if sp_playlistcontainer in session._cache:
-            return session._cache[sp_playlistcontainer]
-        playlist_container = PlaylistContainer(
-            session,
-            sp_playlistcontainer=sp_playlistcontainer, add_ref=add_ref)
-        session._cache[sp_playlistcontainer] = playlist_container
-        return playlist_container
+        return utils.get_cached(
+            session, sp_playlistcontainer, add_ref,
+            lib.sp_playlistcontainer_release,
+            lambda: cls(
+                session, sp_playlistcontainer=sp_playlistcontainer,
+                add_ref=add_ref))
 
     def __init__(self, session, sp_playlistcontainer, add_ref=True):
         super(PlaylistContainer, self).__init__()
@@ -808,7 +907,7 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
 
         if add_ref:
             lib.sp_playlistcontainer_add_ref(sp_playlistcontainer)
-        self._sp_playlistcontainer = ffi.gc(
+        self._sp_playlistcontainer = release.gc(
             sp_playlistcontainer, lib.sp_playlistcontainer_release)
 
         self._sp_playlistcontainer_callbacks = (
@@ -842,6 +941,20 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the playlist container when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     def __len__(self):
         # Required by collections.Sequence
 
@@ -1053,7 +1166,7 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist container."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlistcontainer_owner(self._sp_playlistcontainer),
             add_ref=True)
@@ -1083,17 +1196,15 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
 
     @serialized
     def on(self, event, listener, *user_args):
-        if self not in self._session._emitters:
-            self._session._emitters.append(self)
+        self._session._emitters[id(self)] = self
         super(PlaylistContainer, self).on(event, listener, *user_args)
     on.__doc__ = utils.EventEmitter.on.__doc__
 
     @serialized
     def off(self, event=None, listener=None):
         super(PlaylistContainer, self).off(event, listener)
-        if (self.num_listeners() == 0 and
-                self in self._session._emitters):
-            self._session._emitters.remove(self)
+        if self.num_listeners() == 0:
+            self._session._emitters.pop(id(self), None)
     off.__doc__ = utils.EventEmitter.off.__doc__
 
 
@@ -1231,6 +1342,7 @@ class _PlaylistContainerCallbacks(object):
         logger.debug('Playlist container loaded')
         playlist_container = PlaylistContainer._cached(
             spotify.session_instance, sp_playlistcontainer, add_ref=True)
+        spotify.session_instance._notify_loaders()
         playlist_container.emit(
             PlaylistContainerEvent.CONTAINER_LOADED, playlist_container)
 
@@ -1253,21 +1365,37 @@ class PlaylistTrack(object):
     :class:`PlaylistTrack`.
     """
 
+    __slots__ = ['_session', '_sp_playlist', '_index', '__weakref__']
+
     def __init__(self, session, sp_playlist, index):
         self._session = session
 
         lib.sp_playlist_add_ref(sp_playlist)
-        self._sp_playlist = ffi.gc(sp_playlist, lib.sp_playlist_release)
+        self._sp_playlist = release.gc(sp_playlist, lib.sp_playlist_release)
 
         self._index = index
 
     # TODO Add useful __repr__
 
+    def __eq__(self, other):
+        if isinstance(other, PlaylistTrack):
+            return (
+                self._sp_playlist == other._sp_playlist and
+                self._index == other._index)
+        else:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self._sp_playlist, self._index))
+
     @property
     @serialized
     def track(self):
         """The :class:`~spotify.Track`."""
-        return spotify.Track(
+        return spotify.Track._cached(
             self._session,
             sp_track=lib.sp_playlist_track(self._sp_playlist, self._index),
             add_ref=True)
@@ -1284,7 +1412,7 @@ class PlaylistTrack(object):
     @serialized
     def creator(self):
         """The :class:`~spotify.User` that added the track to the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlist_track_creator(
                 self._sp_playlist, self._index),
@@ -1328,11 +1456,11 @@ class PlaylistUnseenTracks(collections.Sequence):
         self._session = session
 
         lib.sp_playlistcontainer_add_ref(sp_playlistcontainer)
-        self._sp_playlistcontainer = ffi.gc(
+        self._sp_playlistcontainer = release.gc(
             sp_playlistcontainer, lib.sp_playlistcontainer_release)
 
         lib.sp_playlist_add_ref(sp_playlist)
-        self._sp_playlist = ffi.gc(sp_playlist, lib.sp_playlist_release)
+        self._sp_playlist = release.gc(sp_playlist, lib.sp_playlist_release)
 
         self._num_tracks = 0
         self._sp_tracks_len = 0
@@ -1367,7 +1495,8 @@ class PlaylistUnseenTracks(collections.Sequence):
         sp_track = self._sp_tracks[key]
         if sp_track == ffi.NULL:
             return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return spotify.Track._cached(
+            self._session, sp_track=sp_track, add_ref=True)
 
     def __repr__(self):
         return pprint.pformat(list(self))
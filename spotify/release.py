@@ -0,0 +1,161 @@
+from __future__ import unicode_literals
+
+import collections
+import logging
+
+import spotify
+from spotify import ffi
+
+
+__all__ = [
+    'ReleaseStats',
+    'disable_deferred_release',
+    'enable_deferred_release',
+    'release_pending',
+    'release_stats',
+]
+
+logger = logging.getLogger(__name__)
+
+
+# The max number of objects released while holding the global lock once.
+BATCH_SIZE = 100
+
+
+# Whether finalizers of libspotify objects push the objects to the release
+# queue instead of releasing them at once. See :func:`enable_deferred_release`.
+_deferred = False
+
+# Queue of ``(release_func, sp_obj)`` pairs waiting to be released. Appending
+# and popping from a deque is thread safe, so the finalizers, which can run in
+# any thread, never need to take a lock.
+_queue = collections.deque()
+
+# Counters updated while holding the global lock.
+_released = 0
+_batches = 0
+
+
+class ReleaseStats(object):
+    """Statistics about the release of libspotify objects.
+
+    Returned by :func:`release_stats`.
+    """
+
+    def __init__(self, pending, released, batches):
+        self.pending = pending
+        self.released = released
+        self.batches = batches
+
+    pending = None
+    """The number of garbage collected objects waiting to be released."""
+
+    released = None
+    """The number of objects released from the release queue so far."""
+
+    batches = None
+    """The number of batches the released objects were released in."""
+
+    def __repr__(self):
+        return '<ReleaseStats: pending=%d released=%d batches=%d>' % (
+            self.pending, self.released, self.batches)
+
+
+def gc(sp_obj, release_func):
+    """Attach a finalizer calling ``release_func`` to ``sp_obj``, like
+    :meth:`cffi.FFI.gc`.
+
+    If deferred release is enabled both now and when ``sp_obj`` is garbage
+    collected, the call to ``release_func`` is deferred until
+    :func:`release_pending` is called.
+
+    Internal function.
+    """
+    if not _deferred:
+        return ffi.gc(sp_obj, release_func)
+
+    def finalizer(ptr):
+        if _deferred:
+            _queue.append((release_func, ptr))
+        else:
+            release_func(ptr)
+
+    return ffi.gc(sp_obj, finalizer)
+
+
+def enable_deferred_release():
+    """Defer the release of garbage collected libspotify objects.
+
+    By default, libspotify objects are released at once when the Python
+    object wrapping them is garbage collected. Each release takes the global
+    lock, in whatever thread the garbage collection happens to run. Dropping
+    e.g. a large search result then blocks the thread for a while.
+
+    With deferred release enabled, garbage collected objects are instead put
+    in a queue, and released in batches by :func:`release_pending`, which is
+    called by :meth:`~spotify.Session.process_events`. Objects created before
+    deferred release was enabled are released at once, and so are objects
+    garbage collected after it was disabled. Enable it before creating the
+    :class:`~spotify.Session`.
+
+    The queue is always emptied before the session itself is released, so
+    that no object is released after the session it belongs to.
+    """
+    global _deferred
+    _deferred = True
+
+
+def disable_deferred_release():
+    """Stop deferring the release of garbage collected libspotify objects.
+
+    Any objects waiting in the release queue are released at once.
+    """
+    global _deferred
+    _deferred = False
+    release_pending()
+
+
+def release_pending(max_count=None):
+    """Release garbage collected libspotify objects waiting in the release
+    queue.
+
+    The objects are released in batches of up to :attr:`BATCH_SIZE` objects,
+    holding the global lock once per batch. If ``max_count`` is given, at most
+    that many objects are released.
+
+    Returns the number of released objects.
+    """
+    global _released, _batches
+
+    count = 0
+    while _queue and (max_count is None or count < max_count):
+        batch_size = BATCH_SIZE
+        if max_count is not None:
+            batch_size = min(batch_size, max_count - count)
+        with spotify._lock:
+            released = 0
+            try:
+                while released < batch_size:
+                    try:
+                        release_func, sp_obj = _queue.popleft()
+                    except IndexError:
+                        break
+                    released += 1
+                    release_func(sp_obj)
+            finally:
+                _released += released
+                _batches += 1
+                count += released
+    if count:
+        logger.debug('Released %d libspotify objects', count)
+    return count
+
+
+def release_stats():
+    """Get statistics about the release of libspotify objects.
+
+    Returns a :class:`ReleaseStats` snapshot.
+    """
+    with spotify._lock:
+        return ReleaseStats(
+            pending=len(_queue), released=_released, batches=_batches)
@@ -5,7 +5,8 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
+from spotify.error import _IGNORE_IS_LOADING
 
 
 __all__ = [
@@ -17,13 +18,33 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Search(object):
+class Search(utils.PointerEquality):
     """A Spotify search result.
 
     Call the :meth:`~Session.search` method on your :class:`Session` instance
     to do a search and get a :class:`Search` back.
     """
 
+    __slots__ = [
+        '_session',
+        '_sp_search',
+        '_complete_event',
+        '_callback_handles',
+        'callback',
+        'track_offset',
+        'track_count',
+        'album_offset',
+        'album_count',
+        'artist_offset',
+        'artist_count',
+        'playlist_offset',
+        'playlist_count',
+        'search_type',
+        '__weakref__',
+    ]
+
+    _sp_attr = '_sp_search'
+
     def __init__(
             self, session, query='', callback=None,
             track_offset=0, track_count=20,
@@ -49,7 +70,7 @@ class Search(object):
             search_type = SearchType.STANDARD
         self.search_type = search_type
 
-        self.complete_event = threading.Event()
+        self._complete_event = threading.Event()
         self._callback_handles = set()
 
         if sp_search is None:
@@ -70,10 +91,13 @@ class Search(object):
 
         if add_ref:
             lib.sp_search_add_ref(sp_search)
-        self._sp_search = ffi.gc(sp_search, lib.sp_search_release)
+        self._sp_search = release.gc(sp_search, lib.sp_search_release)
 
-    complete_event = None
-    """:class:`threading.Event` that is set when the search is completed."""
+    @property
+    def complete_event(self):
+        """:class:`threading.Event` that is set when the search is completed.
+        """
+        return self._complete_event
 
     def __repr__(self):
         return 'Search(%r)' % self.link.uri
@@ -103,6 +127,20 @@ class Search(object):
         # thread that takes care of all ``process_events()`` calls for us.
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the search when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     @serialized
     def query(self):
@@ -135,13 +173,13 @@ class Search(object):
         Will always return an empty list if the search isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return []
 
         @serialized
         def get_track(sp_search, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_search_track(sp_search, key),
                 add_ref=True)
@@ -172,13 +210,13 @@ class Search(object):
         Will always return an empty list if the search isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return []
 
         @serialized
         def get_album(sp_search, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_search_album(sp_search, key),
                 add_ref=True)
@@ -209,13 +247,13 @@ class Search(object):
         Will always return an empty list if the search isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return []
 
         @serialized
         def get_artist(sp_search, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_search_artist(sp_search, key),
                 add_ref=True)
@@ -248,7 +286,7 @@ class Search(object):
         Will always return an empty list if the search isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return []
 
@@ -326,6 +364,7 @@ def _search_complete_callback(sp_search, handle):
     (callback, search_result) = ffi.from_handle(handle)
     search_result._callback_handles.remove(handle)
     search_result.complete_event.set()
+    search_result._session._notify_loaders()
     if callback is not None:
         callback(search_result)
 
@@ -1,15 +1,27 @@
 from __future__ import unicode_literals
 
+import collections
 import functools
 import logging
 import operator
+import os
+import threading
+import time
 import weakref
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
+from spotify.error import _IGNORE_IS_LOADING
 
+try:
+    # Unix
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
 
 __all__ = [
+    'LoadResult',
     'Session',
     'SessionEvent',
 ]
@@ -57,10 +69,21 @@ class Session(utils.EventEmitter):
         spotify.Error.maybe_raise(lib.sp_session_create(
             self.config._sp_session_config, sp_session_ptr))
 
-        self._sp_session = ffi.gc(sp_session_ptr[0], lib.sp_session_release)
+        self._finalizer = _SessionFinalizer()
+        self._sp_session = ffi.gc(sp_session_ptr[0], self._finalizer)
 
         self._cache = weakref.WeakValueDictionary()
-        self._emitters = []
+        self._emitters = {}
+        self._metadata_generation = 0
+        self._load_condition = threading.Condition()
+        self._load_generation = 0
+        self._load_futures = []
+        self._load_futures_generation = 0
+        self._load_futures_deadline = None
+        self._wakeup_fds = None
+        self._wakeup_pending = False
+        self._next_timeout = None
+        self._event_loop_thread = None
 
         self.offline = Offline(self)
         self.player = Player(self)
@@ -81,16 +104,33 @@ class Session(utils.EventEmitter):
     """
 
     _emitters = None
-    """A list of event emitters with attached listeners.
+    """A mapping from ``id(emitter)`` to event emitters with attached
+    listeners.
 
     When an event emitter has attached event listeners, we must keep the
     emitter alive for as long as the listeners are attached. This is achieved
-    by adding them to this list.
+    by adding them to this mapping.
+
+    The emitters are keyed by identity, not equality, as two wrapper objects
+    around the same sp_* object are equal, but may have different listeners.
+    Adding and removing an emitter is O(1), no matter how many emitters are
+    kept alive.
 
     When creating wrapper objects around sp_* objects we must also return the
     existing wrapper objects instead of creating new ones so that the set of
     event listeners on the wrapper object can be modified. This is achieved
-    with a combination of this list and the :attr:`_cache` mapping.
+    with a combination of this mapping and the :attr:`_cache` mapping.
+
+    Internal attribute.
+    """
+
+    _metadata_generation = 0
+    """A counter which is incremented every time libspotify tells us that
+    metadata has been updated.
+
+    Objects remembering metadata, see :func:`spotify.set_metadata_caching`,
+    compare it with the value they saw when they last checked their state to
+    know when to check it again.
 
     Internal attribute.
     """
@@ -102,6 +142,88 @@ class Session(utils.EventEmitter):
     will generally have no effect.
     """
 
+    _load_condition = None
+    """A :class:`threading.Condition` that threads waiting for objects to load
+    wait on.
+
+    See :meth:`_notify_loaders`.
+
+    Internal attribute.
+    """
+
+    _load_generation = 0
+    """A counter which is incremented every time the threads waiting on
+    :attr:`_load_condition` are notified.
+
+    Internal attribute.
+    """
+
+    _load_futures = None
+    """A list of ``(obj, future, deadline, timeout)`` tuples for objects
+    waited for by :meth:`Track.load_async` and friends, protected by
+    :attr:`_load_condition`.
+
+    See :meth:`_resolve_load_futures`.
+
+    Internal attribute.
+    """
+
+    _wakeup_fds = None
+    """A ``(read_fd, write_fd)`` tuple for the pipe returned by
+    :meth:`fileno`, or :class:`None` if :meth:`fileno` hasn't been called.
+
+    Internal attribute.
+    """
+
+    _wakeup_pending = False
+    """Whether a byte has been written to the :meth:`fileno` pipe since
+    :meth:`process_events` last emptied it. Used to write at most one byte per
+    :meth:`process_events` call.
+
+    The flag is read and written without a lock, as the ``notify_main_thread``
+    callback must not block. This is benign: it is only set by the single
+    libspotify thread calling ``notify_main_thread``, and only cleared by
+    :meth:`process_events` after it has emptied the pipe, right before it
+    processes events. A notification skipped because the flag was still set
+    is thus handled by that :meth:`process_events` call. At worst, a race
+    writes an extra byte, which is read by the next call.
+
+    Internal attribute.
+    """
+
+    _finalizer = None
+    """The :class:`_SessionFinalizer` releasing the session's
+    ``sp_session``, and closing the :meth:`fileno` pipe.
+
+    Internal attribute.
+    """
+
+    _event_loop_thread = None
+    """The thread of the running :class:`~spotify.EventLoop`, or of the
+    :mod:`asyncio` event loop of the running
+    :class:`~spotify.aio.AsyncioEventLoop`, or :class:`None`.
+
+    Threads waiting for objects to load leave processing events to the event
+    loop while it runs.
+
+    Internal attribute.
+    """
+
+    metadata_store = None
+    """A :class:`~spotify.MetadataStore` to add the metadata of loaded tracks
+    to, or :class:`None`.
+
+    Tracks are added when they finish loading in :meth:`Track.load`,
+    :meth:`Track.load_async`, or :meth:`load_all`, and when they are
+    snapshotted with :meth:`Track.snapshot` or :meth:`Track.snapshot_many`.
+    Loading a track that is already loaded doesn't add it again.
+
+    The store is only written to by the session. :meth:`get_track` always
+    returns a live :class:`Track`, and does not read from the store. Use
+    :meth:`MetadataStore.lookup` to get a track's metadata from the store,
+    loading the track only if it isn't stored yet.
+    """
+
     offline = None
     """An :class:`~spotify.session.Offline` instance for controlling offline
     sync."""
@@ -179,7 +301,7 @@ class Session(utils.EventEmitter):
         sp_user = lib.sp_session_user(self._sp_session)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(self, sp_user=sp_user, add_ref=True)
 
     def logout(self):
         """Log out the current user.
@@ -225,15 +347,285 @@ class Session(utils.EventEmitter):
         callbacks can be triggered (from the same thread).
 
         pyspotify provides an :class:`~spotify.EventLoop` that you can use for
-        processing events when needed.
+        processing events when needed. Alternatively, you can wait for
+        :meth:`fileno` to become readable in your own event loop.
+
+        If deferred release of libspotify objects is enabled, this method also
+        releases the objects waiting in the release queue. See
+        :func:`spotify.release.enable_deferred_release`.
+
+        This method also completes the futures returned by ``load_async()``
+        methods, like :meth:`Track.load_async`, when their objects have
+        loaded, failed, or timed out.
         """
+        # Empty the wakeup pipe before processing events, so that
+        # notifications arriving while we process events make it readable
+        # again.
+        self._drain_wakeup_fd()
+
         next_timeout = ffi.new('int *')
 
         spotify.Error.maybe_raise(lib.sp_session_process_events(
             self._sp_session, next_timeout))
 
+        release.release_pending()
+        self._resolve_load_futures()
+
+        self._next_timeout = next_timeout[0]
         return next_timeout[0]
 
+    @property
+    def next_timeout(self):
+        """The number of milliseconds until :meth:`process_events` should be
+        called again, as returned by the last :meth:`process_events` call.
+
+        :class:`None` if :meth:`process_events` hasn't been called yet.
+        """
+        return self._next_timeout
+
+    @property
+    def next_load_deadline(self):
+        """The :func:`time.time` at which the earliest of the futures returned
+        by ``load_async()`` methods, like :meth:`Track.load_async`, times out.
+
+        The futures are only timed out by :meth:`process_events`, so an event
+        loop should call it no later than this. :class:`None` if no futures
+        are waiting for their objects to load.
+        """
+        return self._load_futures_deadline
+
+    @serialized
+    def fileno(self):
+        """Get a file descriptor which is readable when :meth:`process_events`
+        should be called.
+
+        This lets you process libspotify events from an existing
+        :mod:`select`, :mod:`selectors`, or similar based event loop, instead
+        of running an :class:`~spotify.EventLoop` thread::
+
+            >>> import select
+            >>> session = spotify.Session()
+            >>> timeout = 0
+            >>> while True:
+            ...     select.select([session.fileno()], [], [], timeout / 1000.0)
+            ...     timeout = session.process_events()
+
+        The file descriptor is the read end of a pipe. One byte is written to
+        the pipe when the session emits
+        :attr:`~SessionEvent.NOTIFY_MAIN_THREAD`, unless a byte has already
+        been written since the last :meth:`process_events` call, which empties
+        the pipe. Thus, the file descriptor stays readable until
+        :meth:`process_events` is called, and a burst of notifications only
+        wakes up your event loop once. The file descriptor is readable right
+        after it is created, so that you start by processing events.
+
+        You must still call :meth:`process_events` when the timeout it
+        returned, also available as :attr:`next_timeout`, is reached.
+
+        The pipe is created the first time this method is called, and kept
+        open until the session is released. Only supported on Unix.
+        """
+        if self._wakeup_fds is None:
+            if fcntl is None:
+                raise RuntimeError(
+                    'Session.fileno() is only supported on Unix')
+            read_fd, write_fd = os.pipe()
+            for fd in (read_fd, write_fd):
+                flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            self._wakeup_fds = (read_fd, write_fd)
+            self._finalizer.wakeup_fds = self._wakeup_fds
+            self._write_wakeup_fd()
+        return self._wakeup_fds[0]
+
+    def _write_wakeup_fd(self):
+        """Make the :meth:`fileno` file descriptor readable, if it exists.
+
+        Called from the ``notify_main_thread`` callback, which is called from
+        an internal libspotify thread, so it must not block.
+
+        Internal method.
+        """
+        if self._wakeup_fds is None or self._wakeup_pending:
+            return
+        self._wakeup_pending = True
+        try:
+            os.write(self._wakeup_fds[1], b'\0')
+        except OSError:
+            # The pipe is full, so the file descriptor is readable already.
+            pass
+
+    def _drain_wakeup_fd(self):
+        """Read all pending bytes from the :meth:`fileno` pipe, if it exists.
+
+        Internal method.
+        """
+        if self._wakeup_fds is None:
+            return
+        try:
+            while os.read(self._wakeup_fds[0], 512):
+                pass
+        except OSError:
+            # The pipe is empty.
+            pass
+        # Only allow new writes once the pipe is empty, so that a byte
+        # written while we read it can't be lost with the flag still set.
+        self._wakeup_pending = False
+
+    def _add_load_future(self, obj, future, timeout):
+        """Complete ``future`` when ``obj`` is loaded, has failed to load, or
+        ``timeout`` seconds has passed.
+
+        If the object is already loaded or failed, the future is completed at
+        once. Else, it is completed by :meth:`process_events`.
+
+        Internal method.
+        """
+        entry = (obj, future, time.time() + timeout, timeout)
+        if _resolve_load_future(entry, time.time()):
+            return
+        with self._load_condition:
+            self._load_futures.append(entry)
+            if (self._load_futures_deadline is None or
+                    entry[2] < self._load_futures_deadline):
+                self._load_futures_deadline = entry[2]
+
+    def _resolve_load_futures(self):
+        """Complete the futures of all objects waited for with
+        :meth:`_add_load_future` that has loaded, failed, or timed out.
+
+        The objects are only checked if :meth:`_notify_loaders` has been
+        called since the last check, or if the earliest deadline has passed.
+
+        Internal method.
+        """
+        now = time.time()
+        with self._load_condition:
+            if not self._load_futures:
+                return
+            if (self._load_futures_generation == self._load_generation and
+                    now < self._load_futures_deadline):
+                return
+            self._load_futures_generation = self._load_generation
+            entries = self._load_futures
+            self._load_futures = []
+            self._load_futures_deadline = None
+
+        # The futures are completed without holding the lock, as completing a
+        # future calls its done callbacks, which may add new load futures.
+        pending = [
+            entry for entry in entries
+            if not _resolve_load_future(entry, now)]
+
+        if pending:
+            with self._load_condition:
+                self._load_futures.extend(pending)
+                deadline = min(entry[2] for entry in self._load_futures)
+                if (self._load_futures_deadline is None or
+                        deadline < self._load_futures_deadline):
+                    self._load_futures_deadline = deadline
+
+    def _notify_loaders(self):
+        """Wake up all threads waiting for objects to load.
+
+        Called when libspotify tells us that metadata has been updated, that
+        an asynchronous request has completed, or that events should be
+        processed.
+
+        Internal method.
+        """
+        with self._load_condition:
+            self._load_generation += 1
+            self._load_condition.notify_all()
+
+    def _wait_for_load(self, generation, timeout):
+        """Block until :meth:`_notify_loaders` is called or ``timeout``
+        seconds has passed.
+
+        Returns at once if :meth:`_notify_loaders` has been called since
+        ``generation`` was read from :attr:`_load_generation`, so that no
+        notifications are lost.
+
+        Internal method.
+        """
+        with self._load_condition:
+            if self._load_generation == generation:
+                self._load_condition.wait(timeout)
+
+    def load_all(self, objects, timeout=None):
+        """Block until all the objects' data is loaded, has failed to load,
+        or ``timeout`` seconds has passed.
+
+        ``objects`` can be any mix of objects with a ``load()`` method, like
+        :class:`Track`, :class:`Album`, :class:`Artist`, :class:`User`,
+        :class:`Playlist`, :class:`PlaylistContainer`, :class:`AlbumBrowser`,
+        and :class:`ArtistBrowser` objects. They are all waited for in a
+        single loop. Whenever libspotify reports progress, only the objects
+        that are not loaded yet are checked again.
+
+        If ``timeout`` is :class:`None` the default timeout of 10s is used.
+        In contrast to the ``load()`` methods, this method does not raise
+        :exc:`~spotify.Error` or :exc:`~spotify.Timeout`, but returns a
+        :class:`LoadResult` telling which objects loaded, which failed, and
+        which timed out.
+        """
+        if self.connection_state is not spotify.ConnectionState.LOGGED_IN:
+            raise RuntimeError('Session must be logged in to load objects')
+        if timeout is None:
+            timeout = 10
+        deadline = time.time() + timeout
+        pending = list(objects)
+        loaded = []
+        failed = []
+        # Playlists only report that they have loaded while their callbacks
+        # are registered.
+        playlists = [
+            obj for obj in pending if isinstance(obj, spotify.Playlist)]
+        for playlist in playlists:
+            playlist._begin_loading()
+        # Read the generation before checking the objects, so that we don't
+        # sleep through a notification arriving between the check and the
+        # wait.
+        generation = self._load_generation
+        # The number of objects that were loaded already when first checked.
+        initially_loaded = None
+        try:
+            while True:
+                unloaded = []
+                for obj in pending:
+                    try:
+                        is_loaded = _check_loaded(obj)
+                    except spotify.LibError:
+                        failed.append(obj)
+                        continue
+                    if is_loaded:
+                        loaded.append(obj)
+                    else:
+                        unloaded.append(obj)
+                pending = unloaded
+                if initially_loaded is None:
+                    initially_loaded = len(loaded)
+                if not pending:
+                    break
+                next_timeout = utils._process_events_for_loading(self)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._wait_for_load(generation, min(remaining, next_timeout))
+                generation = self._load_generation
+        finally:
+            for playlist in playlists:
+                playlist._end_loading()
+        if self.metadata_store is not None:
+            # Only the tracks that loaded while waiting are stored, so that
+            # already loaded tracks aren't written to the store again.
+            tracks = [
+                obj for obj in loaded[initially_loaded:]
+                if isinstance(obj, spotify.Track)]
+            if tracks:
+                spotify.Track.snapshot_many(tracks)
+        return LoadResult(loaded=loaded, failed=failed, timed_out=pending)
+
     @property
     @serialized
     def playlist_container(self):
@@ -491,6 +883,109 @@ class Session(utils.EventEmitter):
             playlist_offset=playlist_offset, playlist_count=playlist_count,
             search_type=search_type)
 
+    def search_async(
+            self, query,
+            track_offset=0, track_count=20,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None, timeout=None):
+        """
+        Get a :class:`concurrent.futures.Future` that is completed with a
+        :class:`Search` when the search completes.
+
+        See :meth:`search` and :meth:`Search.load_async`.
+        """
+        return self.search(
+            query,
+            track_offset=track_offset, track_count=track_count,
+            album_offset=album_offset, album_count=album_count,
+            artist_offset=artist_offset, artist_count=artist_count,
+            playlist_offset=playlist_offset, playlist_count=playlist_count,
+            search_type=search_type).load_async(timeout=timeout)
+
+
+class _SessionFinalizer(object):
+    """Release an ``sp_session`` after the objects waiting in the release
+    queue, and close the session's :meth:`Session.fileno` pipe, if any.
+
+    Internal class.
+    """
+
+    def __init__(self):
+        self.wakeup_fds = None
+
+    def __call__(self, sp_session):
+        # Objects belonging to the session must not be released after it.
+        release.release_pending()
+        lib.sp_session_release(sp_session)
+        if self.wakeup_fds is not None:
+            for fd in self.wakeup_fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self.wakeup_fds = None
+
+
+def _check_loaded(obj):
+    """Check if ``obj`` has loaded or failed to load.
+
+    Returns :class:`True` if the object is loaded, and :class:`False` if it
+    is still loading. Raises :exc:`~spotify.LibError` if the object's
+    ``error`` attribute, if it has one, reports an error.
+
+    Internal function.
+    """
+    error_type = getattr(obj, 'error', spotify.ErrorType.OK)
+    if (error_type != spotify.ErrorType.OK and
+            error_type not in _IGNORE_IS_LOADING):
+        raise spotify.LibError(error_type)
+    return obj.is_loaded
+
+
+def _resolve_load_future(entry, now):
+    """Complete the future of a :attr:`Session._load_futures` entry if its
+    object has loaded, failed, or timed out.
+
+    Returns :class:`True` if the future is done, including if it has been
+    cancelled. If checking the object raises an exception, e.g. because the
+    object has failed to load, the future's exception is set to it.
+
+    Internal function.
+    """
+    obj, future, deadline, timeout = entry
+    if future.done():
+        return True
+    try:
+        is_loaded = _check_loaded(obj)
+    except Exception as exc:
+        if future.set_running_or_notify_cancel():
+            future.set_exception(exc)
+        return True
+    if is_loaded:
+        if future.set_running_or_notify_cancel():
+            future.set_result(obj)
+    elif now >= deadline:
+        if future.set_running_or_notify_cancel():
+            future.set_exception(spotify.Timeout(timeout))
+    else:
+        return False
+    return True
+
+
+class LoadResult(collections.namedtuple(
+        'LoadResult', ['loaded', 'failed', 'timed_out'])):
+    """The outcome of :meth:`Session.load_all`.
+
+    Each field is a list of the objects passed to :meth:`Session.load_all`:
+    :attr:`loaded` has the objects that loaded, :attr:`failed` the objects
+    whose ``error`` attribute reported an error, and :attr:`timed_out` the
+    objects that still weren't loaded when the timeout was reached.
+    """
+
+    __slots__ = ()
+
 
 class Offline(object):
     """Offline sync controller.
@@ -987,6 +1482,8 @@ class _SessionCallbacks(object):
         if not spotify.session_instance:
             return
         logger.debug('Metadata updated')
+        spotify.session_instance._metadata_generation += 1
+        spotify.session_instance._notify_loaders()
         spotify.session_instance.emit(
             SessionEvent.METADATA_UPDATED, spotify.session_instance)
 
@@ -1017,6 +1514,8 @@ class _SessionCallbacks(object):
         if not spotify.session_instance:
             return
         logger.debug('Notify main thread')
+        spotify.session_instance._notify_loaders()
+        spotify.session_instance._write_wakeup_fd()
         spotify.session_instance.emit(
             SessionEvent.NOTIFY_MAIN_THREAD, spotify.session_instance)
 
@@ -1084,6 +1583,8 @@ class _SessionCallbacks(object):
         if not spotify.session_instance:
             return
         logger.debug('User info updated')
+        spotify.session_instance._metadata_generation += 1
+        spotify.session_instance._notify_loaders()
         spotify.session_instance.emit(
             SessionEvent.USER_INFO_UPDATED, spotify.session_instance)
 
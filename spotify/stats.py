@@ -0,0 +1,298 @@
+from __future__ import unicode_literals
+
+import bisect
+import copy
+import threading
+import time
+
+import spotify
+
+
+__all__ = [
+    'EventLoopStats',
+    'Histogram',
+    'LockStats',
+    'disable_lock_stats',
+    'enable_lock_stats',
+    'lock_report',
+    'reset_lock_stats',
+]
+
+try:
+    # Python 3.3+
+    _clock = time.perf_counter
+except AttributeError:
+    # Python < 3.3
+    _clock = time.time
+
+
+# Protects the statistics for calls made without holding the global lock.
+# Nothing that may run the garbage collector, i.e. allocate objects, may be
+# done while holding it: a finalizer run by the garbage collector may call a
+# serialized function, and thus try to take the lock again in the same
+# thread.
+_stats_lock = threading.Lock()
+
+# Mapping from libspotify function and method names to their
+# :class:`LockStats`.
+_stats = {}
+
+
+class Histogram(object):
+    """A histogram of durations in seconds.
+
+    The buckets grow exponentially from 1 microsecond to about 1 second. The
+    count in ``buckets[i]`` is the number of durations shorter than
+    ``BOUNDS[i]``. The last bucket counts all longer durations.
+    """
+
+    BOUNDS = tuple(0.000001 * 2 ** i for i in range(21))
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+
+    def __repr__(self):
+        return '<Histogram: count=%d mean=%.6fs max=%.6fs>' % (
+            self.count, self.mean, self.max)
+
+    def add(self, value):
+        """Add a duration in seconds to the histogram."""
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect.bisect_right(self.BOUNDS, value)] += 1
+
+    @property
+    def mean(self):
+        """The mean duration, or 0 if the histogram is empty."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, percent):
+        """The upper bound of the bucket containing the given ``percent``
+        percentile.
+
+        Returns :attr:`max` if the percentile is in the last bucket, and 0 if
+        the histogram is empty.
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * percent / 100.0
+        seen = 0
+        for i, bucket in enumerate(self.buckets[:-1]):
+            seen += bucket
+            if seen >= target:
+                return min(self.BOUNDS[i], self.max)
+        return self.max
+
+
+class LockStats(object):
+    """Statistics about the global lock for a single libspotify function or
+    pyspotify method.
+
+    Calls made without holding the lock, because fine grained locking is
+    enabled, are only counted in :attr:`unlocked_calls`.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.unlocked_calls = 0
+        self.wait = Histogram()
+        self.hold = Histogram()
+
+    name = None
+    """The name of the libspotify function or pyspotify method."""
+
+    calls = None
+    """The number of calls made while holding the global lock."""
+
+    unlocked_calls = None
+    """The number of calls made without holding the global lock."""
+
+    wait = None
+    """:class:`Histogram` of the time spent waiting to acquire the lock."""
+
+    hold = None
+    """:class:`Histogram` of the time the lock was held during the call."""
+
+    def __repr__(self):
+        return (
+            '<LockStats %s: calls=%d unlocked_calls=%d '
+            'wait_mean=%.6fs hold_mean=%.6fs>' % (
+                self.name, self.calls, self.unlocked_calls,
+                self.wait.mean, self.hold.mean))
+
+
+class EventLoopStats(object):
+    """Statistics about the iterations of an :class:`~spotify.EventLoop`.
+
+    You get a snapshot of the statistics from :meth:`spotify.EventLoop.stats`.
+    """
+
+    def __init__(self):
+        self.iterations = 0
+        self.notification_wakeups = 0
+        self.timeout_wakeups = 0
+        self.process_events = Histogram()
+        self.notify_delay = Histogram()
+        self.listeners = 0
+        self.max_listeners = 0
+        self.processing_since = None
+        self.offloaded = 0
+
+    iterations = None
+    """The number of :meth:`~spotify.Session.process_events` calls made."""
+
+    notification_wakeups = None
+    """The number of times the event loop woke up because the session emitted
+    :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD`."""
+
+    timeout_wakeups = None
+    """The number of times the event loop woke up because the timeout
+    returned by :meth:`~spotify.Session.process_events` was reached."""
+
+    process_events = None
+    """:class:`Histogram` of the time spent in
+    :meth:`~spotify.Session.process_events`, including the time spent calling
+    event listeners."""
+
+    notify_delay = None
+    """:class:`Histogram` of the time from the first
+    :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` event since the last
+    iteration until :meth:`~spotify.Session.process_events` was called."""
+
+    listeners = None
+    """The number of event listeners called by
+    :meth:`~spotify.utils.EventEmitter.emit` in the event loop thread during
+    all :meth:`~spotify.Session.process_events` calls.
+
+    Listeners called from other threads, including the event loop's worker
+    threads, are not included. Events handed to the worker threads are
+    counted by :attr:`offloaded`."""
+
+    max_listeners = None
+    """The largest number of event listeners called in the event loop thread
+    during a single :meth:`~spotify.Session.process_events` call."""
+
+    processing_since = None
+    """The :func:`time.time` at which the ongoing
+    :meth:`~spotify.Session.process_events` call started, or :class:`None`
+    if the event loop is waiting for events.
+
+    Compare it with the current time to find out if the event loop is stuck,
+    e.g. in a slow event listener."""
+
+    offloaded = None
+    """The number of emitted events handed to the event loop's worker
+    threads. Always 0 if the event loop has no worker threads."""
+
+    @property
+    def mean_listeners(self):
+        """The mean number of event listeners called per
+        :meth:`~spotify.Session.process_events` call."""
+        if not self.iterations:
+            return 0.0
+        return self.listeners / float(self.iterations)
+
+    def __repr__(self):
+        return (
+            '<EventLoopStats: iterations=%d notification_wakeups=%d '
+            'timeout_wakeups=%d process_events_mean=%.6fs '
+            'notify_delay_mean=%.6fs mean_listeners=%.1f>' % (
+                self.iterations, self.notification_wakeups,
+                self.timeout_wakeups, self.process_events.mean,
+                self.notify_delay.mean, self.mean_listeners))
+
+
+def _get_stats(name):
+    # Create the stats before taking the lock, see _stats_lock.
+    stats = LockStats(name)
+    with _stats_lock:
+        return _stats.setdefault(name, stats)
+
+
+def _record(name, accessor, f, args, kwargs):
+    """Call ``f`` like a :func:`spotify.serialized` or
+    :func:`spotify.serialized_accessor` wrapper would, and record its lock
+    statistics under ``name``.
+
+    Installed as the hook of the serialized wrappers by
+    :func:`enable_lock_stats`.
+
+    Internal function.
+    """
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _get_stats(name)
+    if accessor and spotify._fine_grained_locking:
+        with _stats_lock:
+            stats.unlocked_calls += 1
+        return f(*args, **kwargs)
+    start = _clock()
+    with spotify._lock:
+        acquired = _clock()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            stats.calls += 1
+            stats.wait.add(acquired - start)
+            stats.hold.add(_clock() - acquired)
+
+
+def enable_lock_stats():
+    """Start recording global lock statistics.
+
+    When enabled, each serialized call records the time spent waiting for the
+    global lock and the time the lock was held. Calls to libspotify functions
+    are recorded under the function name, e.g. ``sp_track_name``. Calls to
+    pyspotify methods that hold the lock while calling several libspotify
+    functions are recorded under the method's qualified name, e.g.
+    ``spotify.track.Track.name``. Use :func:`lock_report` to get the
+    statistics.
+
+    As the lock is reentrant, libspotify functions called from such a method
+    are recorded with no wait time. The waiting shows up on the method.
+
+    Recording is disabled by default and costs nothing until enabled.
+    """
+    spotify._lock_stats = _record
+
+
+def disable_lock_stats():
+    """Stop recording global lock statistics.
+
+    The statistics recorded so far are kept until :func:`reset_lock_stats` is
+    called.
+    """
+    spotify._lock_stats = None
+
+
+def reset_lock_stats():
+    """Forget all recorded global lock statistics."""
+    with spotify._lock:
+        with _stats_lock:
+            _stats.clear()
+
+
+def lock_report():
+    """Get the recorded global lock statistics.
+
+    Returns a dict mapping libspotify function names and pyspotify method
+    names to :class:`LockStats` snapshots. Only functions and methods that
+    have been called are included.
+    """
+    # The stats are copied while holding the global lock, so that calls
+    # holding it can't update them meanwhile. _stats_lock is not held while
+    # copying, see _stats_lock, so unlocked call counts may be slightly off.
+    with spotify._lock:
+        current = _stats.copy()
+        return dict(
+            (name, copy.deepcopy(stats))
+            for name, stats in current.items()
+            if stats.calls or stats.unlocked_calls)
@@ -0,0 +1,197 @@
+from __future__ import unicode_literals
+
+import collections
+import logging
+import sqlite3
+import threading
+
+import spotify
+
+
+__all__ = [
+    'MetadataStore',
+    'TrackMetadata',
+]
+
+logger = logging.getLogger(__name__)
+
+
+class TrackMetadata(collections.namedtuple(
+        'TrackMetadata', [
+            'uri', 'name', 'duration', 'popularity', 'disc', 'index',
+            'availability', 'starred', 'artist_uris', 'album_uri'])):
+    """An immutable record of a track's metadata, as kept by a
+    :class:`MetadataStore`.
+
+    The fields have the same values as the :class:`TrackSnapshot` fields with
+    the same names, except that the track, artists, and album are represented
+    by their Spotify URIs, so that the record can be used without a session.
+    """
+
+    __slots__ = ()
+
+
+class MetadataStore(object):
+    """A persistent store of track metadata, keyed by Spotify URI.
+
+    The metadata is kept in an SQLite database at ``path``, which is created if
+    it doesn't exist. Use ``':memory:'`` for a store that only lives as long as
+    the object.
+
+    Set the store as the session's :attr:`~Session.metadata_store` to fill it
+    with the metadata of all tracks that are loaded with the ``load()``
+    methods or :meth:`Session.load_all`, or that a :class:`TrackSnapshot` is
+    made of::
+
+        >>> session = spotify.Session()
+        >>> session.metadata_store = spotify.MetadataStore('metadata.db')
+        # ...
+        >>> track = session.get_track('spotify:track:2Foc5Q5nqNiosCNqttzHof')
+        >>> track.load().name
+        u'Get Lucky'
+
+    After a restart, the metadata can be read from the store before the
+    session is logged in, or while it is offline::
+
+        >>> store = spotify.MetadataStore('metadata.db')
+        >>> store.get('spotify:track:2Foc5Q5nqNiosCNqttzHof').name
+        u'Get Lucky'
+
+    The session doesn't read from the store by itself. Use :meth:`lookup`
+    to read a track's metadata from the store, falling back to loading the
+    track with the session.
+
+    The store can be used from multiple threads.
+    """
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS tracks ('
+                'uri TEXT PRIMARY KEY, name TEXT, duration INTEGER, '
+                'popularity INTEGER, disc INTEGER, track_index INTEGER, '
+                'availability INTEGER, starred INTEGER, artist_uris TEXT, '
+                'album_uri TEXT)')
+
+    def __repr__(self):
+        return 'MetadataStore(<%d tracks>)' % len(self)
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._connection.execute(
+                'SELECT COUNT(*) FROM tracks').fetchone()
+        return count
+
+    def __contains__(self, uri):
+        return self.get(uri) is not None
+
+    def get(self, uri):
+        """Get the :class:`TrackMetadata` for the track with the given
+        Spotify URI.
+
+        Returns :class:`None` if the track isn't in the store.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT uri, name, duration, popularity, disc, track_index, '
+                'availability, starred, artist_uris, album_uri '
+                'FROM tracks WHERE uri = ?', (uri,)).fetchone()
+        if row is None:
+            return None
+        (
+            uri, name, duration, popularity, disc, index,
+            availability, starred, artist_uris, album_uri) = row
+        return TrackMetadata(
+            uri=uri,
+            name=name,
+            duration=duration,
+            popularity=popularity,
+            disc=disc,
+            index=index,
+            availability=spotify.TrackAvailability(availability),
+            starred=bool(starred),
+            artist_uris=tuple(artist_uris.split()) if artist_uris else (),
+            album_uri=album_uri)
+
+    def put(self, snapshot):
+        """Store the metadata from a :class:`TrackSnapshot`.
+
+        Returns the stored :class:`TrackMetadata`, or :class:`None` if the
+        snapshot is of a track that wasn't loaded, and thus wasn't stored.
+        """
+        return self.put_many([snapshot])[0]
+
+    def put_many(self, snapshots):
+        """Store the metadata from many :class:`TrackSnapshot` objects.
+
+        All the snapshots are stored in a single transaction. Returns a list
+        of the stored :class:`TrackMetadata` records, with :class:`None` in
+        place of the snapshots of tracks that weren't loaded.
+        """
+        records = [_to_record(snapshot) for snapshot in snapshots]
+        rows = [
+            (
+                record.uri, record.name, record.duration, record.popularity,
+                record.disc, record.index, int(record.availability),
+                int(record.starred), ' '.join(record.artist_uris),
+                record.album_uri)
+            for record in records if record is not None]
+        if rows:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO tracks VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return records
+
+    def lookup(self, session, uri, timeout=None):
+        """Get the :class:`TrackMetadata` for the track with the given
+        Spotify URI, loading the track with the ``session`` if it isn't in the
+        store.
+
+        The loaded track's metadata is added to the store. ``timeout`` is
+        passed on to :meth:`Track.load`.
+        """
+        record = self.get(uri)
+        if record is not None:
+            return record
+        track = session.get_track(uri).load(timeout=timeout)
+        if session.metadata_store is self:
+            # Loading the track has added it to the store already, unless it
+            # was loaded before.
+            record = self.get(uri)
+            if record is not None:
+                return record
+        return self.put(track._snapshot())
+
+    def close(self):
+        """Close the database.
+
+        The store can't be used after it has been closed.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+def _to_record(snapshot):
+    """Convert a :class:`TrackSnapshot` to a :class:`TrackMetadata` record.
+
+    Returns :class:`None` if the snapshot's track wasn't loaded.
+
+    Internal function.
+    """
+    if not snapshot.is_loaded:
+        return None
+    return TrackMetadata(
+        uri=snapshot.track.link.uri,
+        name=snapshot.name,
+        duration=snapshot.duration,
+        popularity=snapshot.popularity,
+        disc=snapshot.disc,
+        index=snapshot.index,
+        availability=snapshot.availability,
+        starred=snapshot.starred,
+        artist_uris=tuple(artist.link.uri for artist in snapshot.artists),
+        album_uri=(
+            snapshot.album.link.uri if snapshot.album is not None else None))
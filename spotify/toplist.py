@@ -4,7 +4,7 @@ import logging
 import threading
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, utils
 
 
 __all__ = [
@@ -16,7 +16,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-class Toplist(object):
+class Toplist(utils.PointerEquality):
     """A Spotify toplist of artists, albums, or tracks that are the currently
     most popular worldwide or in a specific region.
 
@@ -51,6 +51,19 @@ class Toplist(object):
 
     # TODO Add session.toplist() constructor, like session.search()?
 
+    __slots__ = [
+        '_session',
+        '_sp_toplistbrowse',
+        '_complete_event',
+        '_callback_handles',
+        'type',
+        'region',
+        'canonical_username',
+        '__weakref__',
+    ]
+
+    _sp_attr = '_sp_toplistbrowse'
+
     def __init__(
             self, session, type=None, region=None, canonical_username=None,
             callback=None, sp_toplistbrowse=None, add_ref=True):
@@ -64,7 +77,7 @@ class Toplist(object):
         self.region = region
         self.canonical_username = canonical_username
 
-        self.complete_event = threading.Event()
+        self._complete_event = threading.Event()
         self._callback_handles = set()
 
         if sp_toplistbrowse is None:
@@ -87,13 +100,15 @@ class Toplist(object):
 
         if add_ref:
             lib.sp_toplistbrowse_add_ref(sp_toplistbrowse)
-        self._sp_toplistbrowse = ffi.gc(
+        self._sp_toplistbrowse = release.gc(
             sp_toplistbrowse, lib.sp_toplistbrowse_release)
 
-    complete_event = None
-    """:class:`threading.Event` that is set when the toplist request is
-    completed.
-    """
+    @property
+    def complete_event(self):
+        """:class:`threading.Event` that is set when the toplist request is
+        completed.
+        """
+        return self._complete_event
 
     def __repr__(self):
         return 'Toplist(type=%r, region=%r, canonical_username=%r)' % (
@@ -114,6 +129,20 @@ class Toplist(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the toplist when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def error(self):
         """An :class:`ErrorType` associated with the toplist.
@@ -149,7 +178,7 @@ class Toplist(object):
 
         @serialized
         def get_track(sp_toplistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_toplistbrowse_track(sp_toplistbrowse, key),
                 add_ref=True)
@@ -174,7 +203,7 @@ class Toplist(object):
 
         @serialized
         def get_album(sp_toplistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_toplistbrowse_album(sp_toplistbrowse, key),
                 add_ref=True)
@@ -199,7 +228,7 @@ class Toplist(object):
 
         @serialized
         def get_artist(sp_toplistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_toplistbrowse_artist(sp_toplistbrowse, key),
                 add_ref=True)
@@ -222,6 +251,7 @@ def _toplistbrowse_complete_callback(sp_toplistbrowse, handle):
     (callback, toplist) = ffi.from_handle(handle)
     toplist._callback_handles.remove(handle)
     toplist.complete_event.set()
+    toplist._session._notify_loaders()
     if callback is not None:
         callback(toplist)
 
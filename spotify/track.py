@@ -1,7 +1,10 @@
 from __future__ import unicode_literals
 
+import collections
+
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import ffi, lib, release, serialized, serialized_accessor, utils
+from spotify.error import _IGNORE_IS_LOADING
 
 
 __all__ = [
@@ -9,10 +12,11 @@ __all__ = [
     'Track',
     'TrackAvailability',
     'TrackOfflineStatus',
+    'TrackSnapshot',
 ]
 
 
-class Track(object):
+class Track(utils.PointerEquality):
     """A Spotify track.
 
     You can get tracks from playlists or albums, or you can create a
@@ -25,13 +29,30 @@ class Track(object):
         u'Get Lucky'
     """
 
+    __slots__ = ['_session', '_sp_track', '_memo', '__weakref__']
+
+    _sp_attr = '_sp_track'
+
     # TODO Review all maybe_raise() calls to check if they should ignore
     # ErrorType.IS_LOADING
 
+    @classmethod
+    def _cached(cls, session, sp_track, add_ref=True):
+        """
+        Get :class:`Track` instance for the given ``sp_track``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        return utils.get_cached(
+            session, sp_track, add_ref, lib.sp_track_release,
+            lambda: cls(session, sp_track=sp_track, add_ref=add_ref))
+
     def __init__(self, session, uri=None, sp_track=None, add_ref=True):
         assert uri or sp_track, 'uri or sp_track is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             track = spotify.Link(self._session, uri=uri).as_track()
@@ -43,7 +64,7 @@ class Track(object):
 
         if add_ref:
             lib.sp_track_add_ref(sp_track)
-        self._sp_track = ffi.gc(sp_track, lib.sp_track_release)
+        self._sp_track = release.gc(sp_track, lib.sp_track_release)
 
     def __repr__(self):
         return 'Track(%r)' % self.link.uri
@@ -67,9 +88,69 @@ class Track(object):
         After ``timeout`` seconds with no results :exc:`~spotify.Timeout` is
         raised. If ``timeout`` is :class:`None` the default timeout is used.
 
+        If the session has a :attr:`~Session.metadata_store` and the track
+        wasn't loaded already, the loaded track's metadata is added to the
+        store.
+
         The method returns ``self`` to allow for chaining of calls.
         """
-        return utils.load(self._session, self, timeout=timeout)
+        store_metadata = self._needs_storing()
+        utils.load(self._session, self, timeout=timeout)
+        if store_metadata:
+            self._store_metadata()
+        return self
+
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the track when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`. If the session
+        has a :attr:`~Session.metadata_store` and the track wasn't loaded
+        already, the loaded track's metadata is added to the store before the
+        future's result is returned.
+        """
+        store_metadata = self._needs_storing()
+        future = utils.load_async(self._session, self, timeout=timeout)
+        if store_metadata:
+            future.add_done_callback(self._store_metadata_when_loaded)
+        return future
+
+    def _needs_storing(self):
+        """Whether the track should be added to the session's metadata store
+        once it is loaded.
+
+        Tracks are only stored when they go from not loaded to loaded, so that
+        loading an already loaded track doesn't write to the store again.
+
+        Internal method.
+        """
+        return (
+            self._session.metadata_store is not None and not self.is_loaded)
+
+    def _store_metadata_when_loaded(self, future):
+        """Add the track's metadata to the session's metadata store if
+        ``future`` from :meth:`load_async` was completed with the track.
+
+        Internal method.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self._store_metadata()
+
+    def _store_metadata(self):
+        """Add the track's metadata to the session's metadata store, if it
+        has one.
+
+        Internal method.
+        """
+        store = self._session.metadata_store
+        if store is not None:
+            store.put(self._snapshot())
 
     @property
     def offline_status(self):
@@ -81,7 +162,7 @@ class Track(object):
         Will always return :class:`None` if the track isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return None
         return TrackOfflineStatus(
@@ -94,7 +175,7 @@ class Track(object):
         Will always return :class:`None` if the track isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return None
         return TrackAvailability(lib.sp_track_get_availability(
@@ -136,10 +217,10 @@ class Track(object):
         See :attr:`is_autolinked`.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return None
-        return Track(
+        return Track._cached(
             self._session,
             sp_track=lib.sp_track_get_playable(
                 self._session._sp_session, self._sp_track),
@@ -166,7 +247,7 @@ class Track(object):
         Will always return :class:`None` if the track isn't loaded.
         """
         spotify.Error.maybe_raise(
-            self.error, ignores=[spotify.ErrorType.IS_LOADING])
+            self.error, ignores=_IGNORE_IS_LOADING)
         if not self.is_loaded:
             return None
         return bool(lib.sp_track_is_placeholder(self._sp_track))
@@ -194,7 +275,7 @@ class Track(object):
             bool(value)))
 
     @property
-    @serialized
+    @serialized_accessor
     def artists(self):
         """The artists performing on the track.
 
@@ -204,9 +285,9 @@ class Track(object):
         if not self.is_loaded:
             return []
 
-        @serialized
+        @serialized_accessor
         def get_artist(sp_track, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_track_artist(sp_track, key),
                 add_ref=True)
@@ -219,7 +300,8 @@ class Track(object):
             getitem_func=get_artist)
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def album(self):
         """The album of the track.
 
@@ -229,10 +311,12 @@ class Track(object):
         sp_album = lib.sp_track_album(self._sp_track)
         if sp_album == ffi.NULL:
             return None
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(
+            self._session, sp_album=sp_album, add_ref=True)
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def name(self):
         """The track's name.
 
@@ -243,6 +327,7 @@ class Track(object):
         return name if name else None
 
     @property
+    @utils.memoized
     def duration(self):
         """The track's duration in milliseconds.
 
@@ -253,6 +338,7 @@ class Track(object):
         return duration if duration else None
 
     @property
+    @utils.memoized
     def popularity(self):
         """The track's popularity in the range 0-100, 0 if undefined.
 
@@ -264,6 +350,7 @@ class Track(object):
         return lib.sp_track_popularity(self._sp_track)
 
     @property
+    @utils.memoized
     def disc(self):
         """The track's disc number. 1 or higher.
 
@@ -275,6 +362,7 @@ class Track(object):
         return disc if disc else None
 
     @property
+    @utils.memoized
     def index(self):
         """The track's index number. 1 or higher.
 
@@ -285,6 +373,103 @@ class Track(object):
         index = lib.sp_track_index(self._sp_track)
         return index if index else None
 
+    def snapshot(self):
+        """Read the track's metadata at once.
+
+        Returns a :class:`TrackSnapshot` with the name, duration, popularity,
+        disc, index, availability, starred state, artists, and album of the
+        track. All fields are read while holding the global lock once,
+        instead of once per attribute, so they are consistent with each
+        other.
+
+        If the track isn't loaded, all fields but :attr:`~TrackSnapshot.track`
+        and :attr:`~TrackSnapshot.is_loaded` are :class:`None`, and
+        :attr:`~TrackSnapshot.artists` is an empty tuple.
+
+        If the session has a :attr:`~Session.metadata_store`, the snapshot of
+        a loaded track is also added to the store.
+        """
+        snapshot = self._snapshot()
+        store = self._session.metadata_store
+        if store is not None:
+            store.put(snapshot)
+        return snapshot
+
+    @serialized
+    def _snapshot(self):
+        """Read the track's metadata into a :class:`TrackSnapshot`.
+
+        Internal method.
+        """
+        sp_track = self._sp_track
+        spotify.Error.maybe_raise(
+            lib.sp_track_error(sp_track), ignores=_IGNORE_IS_LOADING)
+        if not lib.sp_track_is_loaded(sp_track):
+            return TrackSnapshot(
+                track=self, is_loaded=False, name=None, duration=None,
+                popularity=None, disc=None, index=None, availability=None,
+                starred=None, artists=(), album=None)
+
+        sp_session = self._session._sp_session
+        artists = tuple(
+            spotify.Artist._cached(
+                self._session,
+                sp_artist=lib.sp_track_artist(sp_track, i),
+                add_ref=True)
+            for i in range(lib.sp_track_num_artists(sp_track)))
+        sp_album = lib.sp_track_album(sp_track)
+        if sp_album == ffi.NULL:
+            album = None
+        else:
+            album = spotify.Album._cached(
+                self._session, sp_album=sp_album, add_ref=True)
+
+        return TrackSnapshot(
+            track=self,
+            is_loaded=True,
+            name=utils.to_unicode(lib.sp_track_name(sp_track)) or None,
+            duration=lib.sp_track_duration(sp_track) or None,
+            popularity=lib.sp_track_popularity(sp_track),
+            disc=lib.sp_track_disc(sp_track) or None,
+            index=lib.sp_track_index(sp_track) or None,
+            availability=TrackAvailability(
+                lib.sp_track_get_availability(sp_session, sp_track)),
+            starred=bool(lib.sp_track_is_starred(sp_session, sp_track)),
+            artists=artists,
+            album=album)
+
+    @classmethod
+    def snapshot_many(cls, tracks):
+        """Read the metadata of many tracks at once.
+
+        Returns a list with a :class:`TrackSnapshot` for each of the
+        ``tracks``, in the same order. The global lock is held while all the
+        tracks are read, so keep the number of tracks reasonable to avoid
+        blocking the thread processing events for too long.
+
+        If a track has failed to load, the list has :class:`None` in its
+        place instead of a snapshot, and the rest of the tracks are still
+        read. Check the track's :attr:`error` for the reason.
+
+        If the session has a :attr:`~Session.metadata_store`, the snapshots
+        of loaded tracks are added to the store in a single transaction.
+        """
+        tracks = list(tracks)
+        snapshots = []
+        with spotify._lock:
+            for track in tracks:
+                try:
+                    snapshots.append(track._snapshot())
+                except spotify.Error:
+                    snapshots.append(None)
+        if tracks:
+            store = tracks[0]._session.metadata_store
+            if store is not None:
+                store.put_many([
+                    snapshot for snapshot in snapshots
+                    if snapshot is not None])
+        return snapshots
+
     @property
     def link(self):
         """A :class:`Link` to the track."""
@@ -306,6 +491,8 @@ class LocalTrack(Track):
     there are more details in Hallon's docs.
     """
 
+    __slots__ = []
+
     def __init__(
             self, session, artist=None, title=None, album=None, length=None):
         artist = utils.to_char_or_null(artist)
@@ -320,6 +507,21 @@ class LocalTrack(Track):
             session, sp_track=sp_track, add_ref=False)
 
 
+class TrackSnapshot(collections.namedtuple(
+        'TrackSnapshot', [
+            'track', 'is_loaded', 'name', 'duration', 'popularity', 'disc',
+            'index', 'availability', 'starred', 'artists', 'album'])):
+    """An immutable record of a track's metadata.
+
+    Returned by :meth:`Track.snapshot` and :meth:`Track.snapshot_many`. The
+    fields have the same values as the :class:`Track` attributes with the same
+    names had when the snapshot was made, except that :attr:`artists` is a
+    tuple.
+    """
+
+    __slots__ = ()
+
+
 @utils.make_enum('SP_TRACK_AVAILABILITY_')
 class TrackAvailability(utils.IntEnum):
     pass
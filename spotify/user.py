@@ -1,7 +1,7 @@
 from __future__ import unicode_literals
 
 import spotify
-from spotify import ffi, lib, serialized, utils
+from spotify import lib, release, serialized_accessor, utils
 
 
 __all__ = [
@@ -9,7 +9,7 @@ __all__ = [
 ]
 
 
-class User(object):
+class User(utils.PointerEquality):
     """A Spotify user.
 
     You can get users from the session, or you can create a :class:`User`
@@ -22,10 +22,27 @@ class User(object):
         u'jodal'
     """
 
+    __slots__ = ['_session', '_sp_user', '_memo', '__weakref__']
+
+    _sp_attr = '_sp_user'
+
+    @classmethod
+    def _cached(cls, session, sp_user, add_ref=True):
+        """
+        Get :class:`User` instance for the given ``sp_user``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        return utils.get_cached(
+            session, sp_user, add_ref, lib.sp_user_release,
+            lambda: cls(session, sp_user=sp_user, add_ref=add_ref))
+
     def __init__(self, session, uri=None, sp_user=None, add_ref=True):
         assert uri or sp_user, 'uri or sp_user is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             user = spotify.Link(self._session, uri=uri).as_user()
@@ -37,19 +54,21 @@ class User(object):
 
         if add_ref:
             lib.sp_user_add_ref(sp_user)
-        self._sp_user = ffi.gc(sp_user, lib.sp_user_release)
+        self._sp_user = release.gc(sp_user, lib.sp_user_release)
 
     def __repr__(self):
         return 'User(%r)' % self.link.uri
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def canonical_name(self):
         """The user's canonical username."""
         return utils.to_unicode(lib.sp_user_canonical_name(self._sp_user))
 
     @property
-    @serialized
+    @utils.memoized
+    @serialized_accessor
     def display_name(self):
         """The user's displayable username."""
         return utils.to_unicode(lib.sp_user_display_name(self._sp_user))
@@ -69,6 +88,20 @@ class User(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Get a :class:`concurrent.futures.Future` that is completed with
+        the user when it is loaded.
+
+        If loading fails, the future's exception is a :exc:`~spotify.LibError`.
+        After ``timeout`` seconds with no results, the future's exception is a
+        :exc:`~spotify.Timeout`. If ``timeout`` is :class:`None` the default
+        timeout is used.
+
+        The future is completed by :meth:`~spotify.Session.process_events`,
+        e.g. when called by an :class:`~spotify.EventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def link(self):
         """A :class:`Link` to the user."""
@@ -1,13 +1,21 @@
 from __future__ import unicode_literals
 
+import bisect
 import collections
 import functools
 import pprint
 import sys
+import threading
 import time
 
+try:
+    # Python 3.2+, or Python 2 with the "futures" backport from PyPI
+    from concurrent import futures
+except ImportError:
+    futures = None
+
 import spotify
-from spotify import ffi, lib, serialized
+from spotify import ffi, lib, release, serialized
 
 
 PY2 = sys.version_info[0] == 2
@@ -22,11 +30,37 @@ else:
     binary_type = bytes
 
 
+# The number of listeners called by EventEmitter.emit() in each thread, as
+# the "value" attribute, for spotify.EventLoop.stats(). As each thread only
+# updates its own count, no lock is needed, and the event loop only counts
+# the listeners called in its own thread.
+_listeners_called = threading.local()
+
+# A function called with the emitter, event, and event args instead of
+# calling the listeners in EventEmitter.emit(), or None. Set by
+# spotify.EventLoop to call listeners in worker threads.
+_dispatcher = None
+
+
+def listeners_called():
+    """Get the number of event listeners called by
+    :meth:`EventEmitter.emit` in the current thread.
+
+    Internal function.
+    """
+    return getattr(_listeners_called, 'value', 0)
+
+
 class EventEmitter(object):
     """Mixin for adding event emitter functionality to a class."""
 
     def __init__(self):
-        self._listeners = collections.defaultdict(list)
+        # Mapping from events to tuples of listeners. The tuples are replaced,
+        # never changed, so emit() can use them without taking a lock or
+        # making a copy, even if listeners are added or removed meanwhile.
+        # The mapping is only allocated while there are listeners, as most
+        # emitters never get any.
+        self._listeners = None
 
     @serialized
     def on(self, event, listener, *user_args):
@@ -39,8 +73,10 @@ class EventEmitter(object):
         If the listener function returns :class:`False`, it is removed and will
         not be called the next time the ``event`` is emitted.
         """
-        self._listeners[event].append(
-            _Listener(callback=listener, user_args=user_args))
+        if self._listeners is None:
+            self._listeners = {}
+        self._listeners[event] = self._listeners.get(event, ()) + (
+            _Listener(callback=listener, user_args=user_args),)
 
     @serialized
     def off(self, event=None, listener=None):
@@ -52,17 +88,25 @@ class EventEmitter(object):
         If ``event`` is :class:`None`, all listeners for all events on this
         object will be removed.
         """
+        if not self._listeners:
+            return
         if event is None:
-            events = self._listeners.keys()
+            events = list(self._listeners.keys())
         else:
             events = [event]
         for event in events:
             if listener is None:
-                self._listeners[event] = []
+                listeners = ()
+            else:
+                listeners = tuple(
+                    l for l in self._listeners.get(event, ())
+                    if l.callback is not listener)
+            if listeners:
+                self._listeners[event] = listeners
             else:
-                self._listeners[event] = [
-                    l for l in self._listeners[event]
-                    if l.callback is not listener]
+                self._listeners.pop(event, None)
+        if not self._listeners:
+            self._listeners = None
 
     def emit(self, event, *event_args):
         """Call the registered listeners for ``event``.
@@ -70,10 +114,46 @@ class EventEmitter(object):
         The listeners will be called with any extra arguments passed to
         :meth:`emit` first, and then the extra arguments passed to :meth:`on`
         """
-        listeners = self._listeners[event][:]
+        listeners = self._listeners
+        if listeners is None or event not in listeners:
+            return
+        if _dispatcher is not None:
+            _dispatcher(self, event, event_args)
+        else:
+            self._emit(event, event_args)
+
+    def _emit(self, event, event_args):
+        """Call the registered listeners for ``event`` in this thread.
+
+        Internal method.
+        """
+        listeners = self._listeners
+        if listeners is None:
+            return
+        listeners = listeners.get(event, ())
+        try:
+            _listeners_called.value += len(listeners)
+        except AttributeError:
+            _listeners_called.value = len(listeners)
+        # Most listeners are registered without user args, so the event args
+        # are only copied into a new tuple when there are user args to add.
+        if len(listeners) == 1:
+            # Fast path for the common case of a single listener.
+            (listener,) = listeners
+            if listener.user_args:
+                result = listener.callback(
+                    *(event_args + listener.user_args))
+            else:
+                result = listener.callback(*event_args)
+            if result is False:
+                self.off(event, listener.callback)
+            return
         for listener in listeners:
-            args = list(event_args) + list(listener.user_args)
-            result = listener.callback(*args)
+            if listener.user_args:
+                result = listener.callback(
+                    *(event_args + listener.user_args))
+            else:
+                result = listener.callback(*event_args)
             if result is False:
                 self.off(event, listener.callback)
 
@@ -83,10 +163,13 @@ class EventEmitter(object):
         Return the total number of listeners for all events on this object if
         ``event`` is :class:`None`.
         """
-        if event is not None:
-            return len(self._listeners[event])
+        listeners = self._listeners
+        if listeners is None:
+            return 0
+        elif event is not None:
+            return len(listeners.get(event, ()))
         else:
-            return sum(len(l) for l in self._listeners.values())
+            return sum(len(l) for l in listeners.values())
 
     def call(self, event, *event_args):
         """Call the single registered listener for ``event``.
@@ -97,15 +180,17 @@ class EventEmitter(object):
         Raises :exc:`AssertionError` if there is none or multiple listeners for
         ``event``. Returns the listener's return value on success.
         """
+        listeners = self._listeners.get(event, ()) if self._listeners else ()
         # XXX It would be a lot better for debugging if this error was raised
         # when registering the second listener instead of when the event is
         # emitted.
-        assert self.num_listeners(event) == 1, (
+        assert len(listeners) == 1, (
             'Expected exactly 1 event listener, found %d listeners' %
-            self.num_listeners(event))
-        listener = self._listeners[event][0]
-        args = list(event_args) + list(listener.user_args)
-        return listener.callback(*args)
+            len(listeners))
+        (listener,) = listeners
+        if listener.user_args:
+            return listener.callback(*(event_args + listener.user_args))
+        return listener.callback(*event_args)
 
 
 class _Listener(collections.namedtuple(
@@ -120,12 +205,30 @@ class IntEnum(int):
     :pep:`435` and introduced in Python 3.4.
     """
 
+    # Values from 0 up to this limit are looked up in a per class list
+    # instead of a dict, as that is the most common case and the fastest. The
+    # list is only extended by add(), when the class is defined, so that
+    # looking up values from multiple threads never changes it.
+    _TABLE_SIZE_LIMIT = 256
+
     def __new__(cls, value):
+        try:
+            if value >= 0:
+                return cls._table[value]
+        except (AttributeError, IndexError, TypeError):
+            pass
+        return cls._get_instance(value)
+
+    @classmethod
+    def _get_instance(cls, value):
         if not hasattr(cls, '_values'):
             cls._values = {}
-        if value not in cls._values:
-            cls._values[value] = int.__new__(cls, value)
-        return cls._values[value]
+        instance = cls._values.get(value)
+        if instance is None:
+            # If several threads create an instance for the same value at
+            # once, setdefault() makes them all use the same one.
+            instance = cls._values.setdefault(value, int.__new__(cls, value))
+        return instance
 
     def __repr__(self):
         if hasattr(self, '_name'):
@@ -138,6 +241,41 @@ class IntEnum(int):
         attr = cls(value)
         attr._name = name
         setattr(cls, name, attr)
+        if 0 <= attr < cls._TABLE_SIZE_LIMIT:
+            if not hasattr(cls, '_table'):
+                cls._table = []
+            # Fill any gap with instances for unknown values, so that the
+            # table can be indexed by all values up to its length.
+            for i in range(len(cls._table), attr + 1):
+                cls._table.append(cls._get_instance(i))
+
+
+# Index of all libspotify constants, i.e. the attributes of the CFFI library
+# starting with ``SP_``, as a pair of name and value lists sorted by name.
+# Built on first use by :func:`_get_constants`, so that creating enums doesn't
+# walk through the thousands of attributes of the CFFI library each time.
+_constants = None
+
+
+def _get_constants(prefix):
+    """Get ``(name, value)`` pairs for all libspotify constants with names
+    starting with ``prefix``, sorted by name.
+
+    Internal function.
+    """
+    global _constants
+    if _constants is None:
+        constants = sorted(
+            (attr, getattr(lib, attr))
+            for attr in dir(lib) if attr.startswith('SP_'))
+        _constants = (
+            [name for name, _ in constants],
+            [value for _, value in constants])
+    names, values = _constants
+    start = end = bisect.bisect_left(names, prefix)
+    while end < len(names) and names[end].startswith(prefix):
+        end += 1
+    return list(zip(names[start:end], values[start:end]))
 
 
 def make_enum(lib_prefix, enum_prefix=''):
@@ -150,10 +288,9 @@ def make_enum(lib_prefix, enum_prefix=''):
     """
 
     def wrapper(cls):
-        for attr in dir(lib):
-            if attr.startswith(lib_prefix):
-                name = attr.replace(lib_prefix, enum_prefix)
-                cls.add(name, getattr(lib, attr))
+        for attr, value in _get_constants(lib_prefix):
+            name = attr.replace(lib_prefix, enum_prefix)
+            cls.add(name, value)
         return cls
     return wrapper
 
@@ -196,6 +333,72 @@ def get_with_growing_buffer(func, *args):
     return to_unicode(buffer_)
 
 
+@serialized
+def get_cached(session, sp_obj, add_ref, release_func, create):
+    """Get the wrapper object for ``sp_obj`` from the session's cache, or
+    create it by calling ``create`` and add it to the cache.
+
+    If ``add_ref`` is false, the caller passes on a reference to ``sp_obj``.
+    If a cached wrapper is found, it already holds a reference, so the passed
+    reference is released by calling ``release_func``.
+
+    Used by the ``_cached()`` constructors of the wrapper classes.
+    """
+    obj = session._cache.get(sp_obj)
+    if obj is not None:
+        if not add_ref:
+            release_func(sp_obj)
+        return obj
+    obj = create()
+    session._cache[sp_obj] = obj
+    return obj
+
+
+def memoized(f):
+    """Remember the return value of the wrapped method on a loaded object if
+    metadata caching is enabled.
+
+    The wrapped method must take no arguments but ``self``. The object must
+    have an ``is_loaded`` property, a ``_session``, and a ``_memo`` attribute
+    initialized to :class:`None`. If the object has an ``error`` property, it
+    is part of the object's state too.
+
+    Values are remembered for as long as the object's state stays the same.
+    The state is only checked again when the session's
+    ``_metadata_generation`` has changed since the last check, so that reads
+    between metadata updates don't call libspotify at all. Metadata updates
+    concerning other objects thus don't make the object forget its values.
+
+    See :func:`spotify.set_metadata_caching`.
+
+    Internal function.
+    """
+    name = f.__name__
+
+    @functools.wraps(f)
+    def wrapper(self):
+        if not spotify._metadata_caching:
+            return f(self)
+        generation = self._session._metadata_generation
+        memo = self._memo
+        if memo is None or memo[0] != generation:
+            state = (self.is_loaded, getattr(self, 'error', None))
+            if not state[0]:
+                self._memo = None
+                return f(self)
+            if memo is None or memo[1] != state:
+                memo = self._memo = (generation, state, {})
+            else:
+                memo = self._memo = (generation, state, memo[2])
+        values = memo[2]
+        try:
+            return values[name]
+        except KeyError:
+            value = values[name] = f(self)
+            return value
+    return wrapper
+
+
 def load(session, obj, timeout=None):
     """Block until the object's data is loaded.
 
@@ -209,27 +412,125 @@ def load(session, obj, timeout=None):
     no timeout, since no timeout would cause programs to potentially hang
     forever without any information to help debug the issue.
 
+    Between checks of :attr:`is_loaded`, the calling thread processes events
+    and then sleeps until libspotify reports updated metadata, an
+    asynchronous request completes, libspotify asks for events to be
+    processed, or the timeout returned by
+    :meth:`~spotify.Session.process_events` is reached. If an
+    :class:`~spotify.EventLoop` is running in another thread, the calling
+    thread leaves processing events to it, and only sleeps.
+
     The method returns ``self`` to allow for chaining of calls.
     """
+    from spotify.error import _IGNORE_IS_LOADING
+
     if session.connection_state is not spotify.ConnectionState.LOGGED_IN:
         raise RuntimeError('Session must be logged in to load objects')
     if timeout is None:
         timeout = 10
     deadline = time.time() + timeout
+    # Read the generation before checking the object, so that we don't sleep
+    # through a notification arriving between the check and the wait.
+    generation = session._load_generation
     while not obj.is_loaded:
-        # TODO Consider sleeping for the time returned by process_events()
-        # instead of making a tight loop.
-        session.process_events()
+        next_timeout = _process_events_for_loading(session)
         spotify.Error.maybe_raise(
-            getattr(obj, 'error', 0), ignores=[spotify.ErrorType.IS_LOADING])
-        if time.time() > deadline:
+            getattr(obj, 'error', 0), ignores=_IGNORE_IS_LOADING)
+        remaining = deadline - time.time()
+        if remaining <= 0:
             raise spotify.Timeout(timeout)
-        time.sleep(0.001)
+        session._wait_for_load(generation, min(remaining, next_timeout))
+        generation = session._load_generation
     spotify.Error.maybe_raise(
-        getattr(obj, 'error', 0), ignores=[spotify.ErrorType.IS_LOADING])
+        getattr(obj, 'error', 0), ignores=_IGNORE_IS_LOADING)
     return obj
 
 
+def _process_events_for_loading(session):
+    """Process events on behalf of a thread waiting for objects to load.
+
+    Returns the number of seconds the thread should sleep before checking the
+    objects again, unless it is woken up earlier.
+
+    If an event loop is processing events in another thread, the events are
+    left to it, so that threads waiting for objects don't all call
+    :meth:`~spotify.Session.process_events` too. The waiting threads are
+    woken up when the event loop's processing reports progress, and check
+    their objects at least as often as the event loop wakes up.
+
+    Internal function.
+    """
+    event_loop = session._event_loop_thread
+    if (event_loop is None or
+            event_loop is threading.current_thread() or
+            not event_loop.is_alive()):
+        return session.process_events() / 1000.0
+    next_timeout = session.next_timeout
+    if next_timeout is None:
+        return float('inf')
+    return next_timeout / 1000.0
+
+
+def load_async(session, obj, timeout=None):
+    """Get a :class:`concurrent.futures.Future` for the object's data being
+    loaded.
+
+    The ``obj`` must at least have the :attr:`is_loaded` attribute. If it also
+    has an :meth:`error` method, it will be checked for errors.
+
+    The future's result is the ``obj`` itself. If loading fails, the future's
+    exception is a :exc:`~spotify.LibError`. After ``timeout`` seconds with no
+    results, the future's exception is a :exc:`~spotify.Timeout`. If
+    unspecified, the ``timeout`` defaults to 10s.
+
+    The future is completed by :meth:`~spotify.Session.process_events`, so
+    events must be processed, e.g. by an :class:`~spotify.EventLoop`, for the
+    future to ever complete.
+
+    On Python 2, this requires the ``futures`` package from PyPI.
+    """
+    if futures is None:
+        raise RuntimeError(
+            'Loading objects asynchronously requires concurrent.futures. '
+            'On Python 2, install the "futures" package from PyPI.')
+    if session.connection_state is not spotify.ConnectionState.LOGGED_IN:
+        raise RuntimeError('Session must be logged in to load objects')
+    if timeout is None:
+        timeout = 10
+    future = futures.Future()
+    session._add_load_future(obj, future, timeout)
+    return future
+
+
+class PointerEquality(object):
+    """Mixin for classes wrapping a libspotify object, making instances equal
+    and hash equal if they wrap the same libspotify object.
+
+    Subclasses must set :attr:`_sp_attr` to the name of the attribute holding
+    the pointer to the libspotify object. Instances of classes using different
+    attributes are never equal.
+    """
+
+    __slots__ = ()
+
+    _sp_attr = None
+    """Name of the attribute holding the pointer to the libspotify object."""
+
+    def __eq__(self, other):
+        if (isinstance(other, PointerEquality) and
+                other._sp_attr == self._sp_attr):
+            return getattr(self, self._sp_attr) == getattr(
+                other, other._sp_attr)
+        else:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(getattr(self, self._sp_attr))
+
+
 class Sequence(collections.Sequence):
     """Helper class for making sequences from a length and getitem function.
 
@@ -242,7 +543,7 @@ class Sequence(collections.Sequence):
             self, sp_obj, add_ref_func, release_func, len_func, getitem_func):
 
         add_ref_func(sp_obj)
-        self._sp_obj = ffi.gc(sp_obj, release_func)
+        self._sp_obj = release.gc(sp_obj, release_func)
         self._len_func = len_func
         self._getitem_func = getitem_func
 
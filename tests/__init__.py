@@ -16,7 +16,9 @@ import cffi
 # Import the module so that ffi.verify() is run before cffi.verifier is used
 import spotify  # noqa
 
-cffi.verifier.cleanup_tmpdir()
+if hasattr(spotify.ffi, 'verifier'):
+    # The out-of-line CFFI module wasn't found, so ffi.verify() was used
+    cffi.verifier.cleanup_tmpdir()
 
 
 # TODO Review all use of ffi.cast() in the tests. Lots of `ffi.cast('sp_foo *',
@@ -49,7 +51,10 @@ def create_session():
     """Creates a :class:`spotify.Session` mock for testing."""
     session = mock.Mock()
     session._cache = weakref.WeakValueDictionary()
-    session._emitters = []
+    session._emitters = {}
+    session._metadata_generation = 0
+    session.metadata_store = None
+    session._event_loop_thread = None
     return session
 
 
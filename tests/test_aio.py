@@ -0,0 +1,337 @@
+from __future__ import unicode_literals
+
+import itertools
+import sys
+import threading
+import time
+import unittest
+
+try:
+    # Python 3.2+, or the futures package from PyPI
+    from concurrent import futures
+except ImportError:
+    futures = None
+
+import spotify
+from spotify import utils
+from tests import mock
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    import spotify.aio
+else:
+    asyncio = None
+
+
+@unittest.skipIf(asyncio is None, 'asyncio support requires Python 3.5+')
+class AsyncioEventLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.session = mock.Mock()
+        self.session.process_events.return_value = 1000
+        self.session.next_load_deadline = None
+        self.event_loop = spotify.aio.AsyncioEventLoop(
+            self.session, loop=self.loop)
+
+    def tearDown(self):
+        self.event_loop.stop()
+        self.loop.close()
+
+    def run_briefly(self):
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_loop(self):
+        self.assertIs(self.event_loop.loop, self.loop)
+
+    def test_loop_defaults_to_running_loop(self):
+        event_loops = []
+
+        self.loop.call_soon(
+            lambda: event_loops.append(
+                spotify.aio.AsyncioEventLoop(self.session)))
+        self.run_briefly()
+
+        self.assertIs(event_loops[0].loop, self.loop)
+
+    def test_requires_loop_when_no_loop_is_running(self):
+        with self.assertRaises(RuntimeError):
+            spotify.aio.AsyncioEventLoop(self.session)
+
+    def test_start_listens_for_notify_main_thread(self):
+        self.event_loop.start()
+
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.event_loop._notify_listener)
+
+    def test_start_processes_events(self):
+        self.event_loop.start()
+        self.run_briefly()
+
+        self.session.process_events.assert_called_once_with()
+
+    def test_processes_events_again_after_timeout(self):
+        self.session.process_events.return_value = 10
+        self.event_loop.start()
+
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertGreater(self.session.process_events.call_count, 2)
+
+    def test_processes_events_before_earliest_load_deadline(self):
+        self.session.next_load_deadline = time.time() + 0.02
+        self.event_loop.start()
+
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertGreater(self.session.process_events.call_count, 1)
+
+    @mock.patch('spotify.aio._RETRY_TIMEOUT', 0.01)
+    def test_processes_events_again_after_process_events_fails(self):
+        self.session.process_events.side_effect = itertools.chain(
+            [spotify.LibError(spotify.ErrorType.OTHER_PERMANENT)],
+            itertools.repeat(10))
+        self.event_loop.start()
+
+        with mock.patch('spotify.aio.logger') as logger_mock:
+            self.loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(logger_mock.exception.call_count, 1)
+        self.assertGreater(self.session.process_events.call_count, 1)
+
+    def test_notify_main_thread_from_other_thread_processes_events(self):
+        self.event_loop.start()
+        self.run_briefly()
+        self.session.process_events.reset_mock()
+
+        thread = threading.Thread(
+            target=self.event_loop._on_notify_main_thread,
+            args=(self.session,))
+        thread.start()
+        thread.join()
+        self.run_briefly()
+
+        self.session.process_events.assert_called_once_with()
+
+    def test_makes_loaders_leave_processing_events_to_the_loop(self):
+        self.event_loop.start()
+        self.run_briefly()
+
+        self.assertIs(
+            self.session._event_loop_thread, threading.current_thread())
+
+        self.event_loop.stop()
+
+        self.assertIsNone(self.session._event_loop_thread)
+
+    def test_stop_from_other_thread_makes_loaders_process_events(self):
+        self.event_loop.start()
+        self.run_briefly()
+
+        thread = threading.Thread(target=self.event_loop.stop)
+        thread.start()
+        thread.join()
+
+        self.assertIsNone(self.session._event_loop_thread)
+
+    def test_stop_keeps_flag_set_by_other_event_loop(self):
+        self.event_loop.start()
+        self.run_briefly()
+        other_thread = threading.Thread()
+        self.session._event_loop_thread = other_thread
+
+        self.event_loop.stop()
+
+        self.assertIs(self.session._event_loop_thread, other_thread)
+
+    def test_stop_stops_processing_events(self):
+        self.session.process_events.return_value = 10
+        self.event_loop.start()
+        self.run_briefly()
+
+        self.event_loop.stop()
+        self.session.process_events.reset_mock()
+        self.event_loop._on_notify_main_thread(self.session)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.event_loop._notify_listener)
+
+    def test_notify_main_thread_after_loop_is_closed_is_ignored(self):
+        self.event_loop.start()
+        self.loop.close()
+
+        self.event_loop._on_notify_main_thread(self.session)
+
+    @unittest.skipIf(futures is None, 'requires concurrent.futures')
+    def test_load(self):
+        obj = mock.Mock()
+        future = futures.Future()
+        obj.load_async.return_value = future
+
+        awaitable = self.event_loop.load(obj, timeout=5)
+        threading.Thread(target=future.set_result, args=(obj,)).start()
+        result = self.loop.run_until_complete(awaitable)
+
+        obj.load_async.assert_called_once_with(timeout=5)
+        self.assertIs(result, obj)
+
+    @unittest.skipIf(futures is None, 'requires concurrent.futures')
+    def test_load_fails(self):
+        obj = mock.Mock()
+        future = futures.Future()
+        future.set_exception(spotify.LibError(spotify.ErrorType.IS_LOADING))
+        obj.load_async.return_value = future
+
+        with self.assertRaises(spotify.LibError):
+            self.loop.run_until_complete(self.event_loop.load(obj))
+
+    @unittest.skipIf(futures is None, 'requires concurrent.futures')
+    def test_search(self):
+        search = mock.sentinel.search
+        future = futures.Future()
+        future.set_result(search)
+        self.session.search_async.return_value = future
+
+        result = self.loop.run_until_complete(
+            self.event_loop.search('alice', track_count=5))
+
+        self.session.search_async.assert_called_once_with(
+            'alice', track_count=5)
+        self.assertIs(result, search)
+
+    @unittest.skipIf(futures is None, 'requires concurrent.futures')
+    def test_browse(self):
+        artist = mock.Mock()
+        browser = mock.sentinel.browser
+        future = futures.Future()
+        future.set_result(browser)
+        artist.browse_async.return_value = future
+
+        result = self.loop.run_until_complete(self.event_loop.browse(
+            artist, type=spotify.ArtistBrowserType.NO_TRACKS))
+
+        artist.browse_async.assert_called_once_with(
+            type=spotify.ArtistBrowserType.NO_TRACKS)
+        self.assertIs(result, browser)
+
+    def test_session_events(self):
+        stream = self.event_loop.session_events(
+            spotify.SessionEvent.LOGGED_IN)
+
+        self.assertIsInstance(stream, spotify.aio.EventStream)
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.LOGGED_IN, stream._listener,
+            spotify.SessionEvent.LOGGED_IN)
+
+    def test_playlist_events(self):
+        playlist = mock.Mock()
+
+        stream = self.event_loop.playlist_events(
+            playlist, spotify.PlaylistEvent.TRACKS_ADDED)
+
+        self.assertIsInstance(stream, spotify.aio.EventStream)
+        playlist.on.assert_called_once_with(
+            spotify.PlaylistEvent.TRACKS_ADDED, stream._listener,
+            spotify.PlaylistEvent.TRACKS_ADDED)
+
+
+@unittest.skipIf(asyncio is None, 'asyncio support requires Python 3.5+')
+class EventStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.emitter = utils.EventEmitter()
+        self.stream = spotify.aio.EventStream(
+            self.loop, self.emitter, ('foo', 'bar'))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def next_event(self):
+        return self.loop.run_until_complete(asyncio.wait_for(
+            self.stream.__anext__(), 1))
+
+    def test_requires_events(self):
+        with self.assertRaises(ValueError):
+            spotify.aio.EventStream(self.loop, self.emitter, ())
+
+    def test_listens_for_events(self):
+        self.assertEqual(self.emitter.num_listeners('foo'), 1)
+        self.assertEqual(self.emitter.num_listeners('bar'), 1)
+
+    def test_is_its_own_iterator(self):
+        self.assertIs(self.stream.__aiter__(), self.stream)
+
+    def test_events_emitted_before_iteration_are_kept(self):
+        self.emitter.emit('foo', 1, 2)
+        self.emitter.emit('bar')
+
+        self.assertEqual(self.next_event(), ('foo', (1, 2)))
+        self.assertEqual(self.next_event(), ('bar', ()))
+
+    def test_events_emitted_while_waiting(self):
+        waiter = self.stream.__anext__()
+        self.loop.call_soon(self.emitter.emit, 'foo', 'x')
+
+        result = self.loop.run_until_complete(waiter)
+
+        self.assertEqual(result, ('foo', ('x',)))
+
+    def test_events_emitted_from_other_thread(self):
+        waiter = self.stream.__anext__()
+        thread = threading.Thread(target=self.emitter.emit, args=('bar', 3))
+        thread.start()
+
+        result = self.loop.run_until_complete(asyncio.wait_for(waiter, 1))
+        thread.join()
+
+        self.assertEqual(result, ('bar', (3,)))
+
+    def test_close_stops_listening(self):
+        self.stream.close()
+
+        self.assertEqual(self.emitter.num_listeners(), 0)
+
+    def test_close_ends_iteration_after_pending_events(self):
+        self.emitter.emit('foo')
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.stream.close()
+
+        self.assertEqual(self.next_event(), ('foo', ()))
+        with self.assertRaises(StopAsyncIteration):
+            self.next_event()
+
+    def test_close_ends_waiting_iteration(self):
+        waiter = self.stream.__anext__()
+
+        self.stream.close()
+
+        with self.assertRaises(StopAsyncIteration):
+            self.loop.run_until_complete(waiter)
+
+    def test_events_after_close_are_ignored(self):
+        self.stream.close()
+        self.stream._put(('foo', ()))
+
+        with self.assertRaises(StopAsyncIteration):
+            self.next_event()
+
+    def test_async_for(self):
+        namespace = {}
+        exec(
+            'async def collect(stream):\n'
+            '    return [item async for item in stream]\n', namespace)
+        self.emitter.emit('foo', 1)
+        self.emitter.emit('bar', 2)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.stream.close()
+
+        collect = namespace['collect']
+        result = self.loop.run_until_complete(collect(self.stream))
+
+        self.assertEqual(result, [('foo', (1,)), ('bar', (2,))])
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 from spotify import utils
@@ -58,6 +59,64 @@ class AlbumTest(unittest.TestCase):
 
         lib_mock.sp_album_release.assert_called_with(sp_album)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+
+        self.assertFalse(hasattr(album, '__dict__'))
+        self.assertIs(weakref.ref(album)(), album)
+
+    def test_eq_if_same_sp_album(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album1 = spotify.Album(self.session, sp_album=sp_album)
+        album2 = spotify.Album(self.session, sp_album=sp_album)
+
+        self.assertIsNot(album1, album2)
+        self.assertTrue(album1 == album2)
+        self.assertFalse(album1 != album2)
+        self.assertEqual(hash(album1), hash(album2))
+        self.assertEqual(len(set([album1, album2])), 1)
+
+    def test_not_eq_if_different_sp_album(self, lib_mock):
+        album1 = spotify.Album(
+            self.session, sp_album=spotify.ffi.new('int *'))
+        album2 = spotify.Album(
+            self.session, sp_album=spotify.ffi.new('int *'))
+
+        self.assertFalse(album1 == album2)
+        self.assertTrue(album1 != album2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+
+        self.assertFalse(album == sp_album)
+        self.assertTrue(album != 'foo')
+
+    def test_cached_album(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+
+        result1 = spotify.Album._cached(self.session, sp_album)
+        result2 = spotify.Album._cached(self.session, sp_album)
+
+        self.assertIsInstance(result1, spotify.Album)
+        self.assertIs(result1, result2)
+        lib_mock.sp_album_add_ref.assert_called_once_with(sp_album)
+
+    def test_cached_album_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+
+        result1 = spotify.Album._cached(
+            self.session, sp_album, add_ref=False)
+        result2 = spotify.Album._cached(
+            self.session, sp_album, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_album_add_ref.call_count, 0)
+        lib_mock.sp_album_release.assert_called_once_with(sp_album)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -290,6 +349,24 @@ class AlbumBrowserTest(unittest.TestCase):
         self.assertFalse(result.complete_event.is_set())
         albumbrowse_complete_cb(sp_albumbrowse, userdata)
         self.assertTrue(result.complete_event.is_set())
+        self.session._notify_loaders.assert_called_once_with()
+
+    @mock.patch('spotify.utils.load_async')
+    def test_browse_async(self, load_async_mock, lib_mock):
+        load_async_mock.return_value = mock.sentinel.future
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast(
+            'sp_albumbrowse *', spotify.ffi.new('int *'))
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+
+        result = album.browse_async(timeout=5)
+
+        self.assertIs(result, mock.sentinel.future)
+        browser = load_async_mock.call_args[0][1]
+        self.assertIsInstance(browser, spotify.AlbumBrowser)
+        self.assertEqual(browser._sp_albumbrowse, sp_albumbrowse)
+        load_async_mock.assert_called_with(self.session, browser, timeout=5)
 
     def test_create_from_album_with_callback(self, lib_mock):
         sp_album = spotify.ffi.new('int *')
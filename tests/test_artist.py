@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 from spotify import utils
@@ -60,6 +61,64 @@ class ArtistTest(unittest.TestCase):
 
         lib_mock.sp_artist_release.assert_called_with(sp_artist)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+
+        self.assertFalse(hasattr(artist, '__dict__'))
+        self.assertIs(weakref.ref(artist)(), artist)
+
+    def test_eq_if_same_sp_artist(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist1 = spotify.Artist(self.session, sp_artist=sp_artist)
+        artist2 = spotify.Artist(self.session, sp_artist=sp_artist)
+
+        self.assertIsNot(artist1, artist2)
+        self.assertTrue(artist1 == artist2)
+        self.assertFalse(artist1 != artist2)
+        self.assertEqual(hash(artist1), hash(artist2))
+        self.assertEqual(len(set([artist1, artist2])), 1)
+
+    def test_not_eq_if_different_sp_artist(self, lib_mock):
+        artist1 = spotify.Artist(
+            self.session, sp_artist=spotify.ffi.new('int *'))
+        artist2 = spotify.Artist(
+            self.session, sp_artist=spotify.ffi.new('int *'))
+
+        self.assertFalse(artist1 == artist2)
+        self.assertTrue(artist1 != artist2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+
+        self.assertFalse(artist == sp_artist)
+        self.assertTrue(artist != 'foo')
+
+    def test_cached_artist(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+
+        result1 = spotify.Artist._cached(self.session, sp_artist)
+        result2 = spotify.Artist._cached(self.session, sp_artist)
+
+        self.assertIsInstance(result1, spotify.Artist)
+        self.assertIs(result1, result2)
+        lib_mock.sp_artist_add_ref.assert_called_once_with(sp_artist)
+
+    def test_cached_artist_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+
+        result1 = spotify.Artist._cached(
+            self.session, sp_artist, add_ref=False)
+        result2 = spotify.Artist._cached(
+            self.session, sp_artist, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_artist_add_ref.call_count, 0)
+        lib_mock.sp_artist_release.assert_called_once_with(sp_artist)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
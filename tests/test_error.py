@@ -4,6 +4,7 @@ import unittest
 
 import spotify
 from spotify import utils
+from tests import mock
 
 
 class ErrorTest(unittest.TestCase):
@@ -29,6 +30,24 @@ class ErrorTest(unittest.TestCase):
             spotify.ErrorType.BAD_API_VERSION,
             ignores=(spotify.ErrorType.BAD_API_VERSION,))
 
+    def test_maybe_raise_does_not_raise_if_ok_and_ignores_is_given(self):
+        spotify.Error.maybe_raise(
+            spotify.ErrorType.OK, ignores=spotify.error._IGNORE_IS_LOADING)
+
+    def test_maybe_raise_does_not_raise_if_loading_is_ignored(self):
+        spotify.Error.maybe_raise(
+            spotify.ErrorType.IS_LOADING,
+            ignores=spotify.error._IGNORE_IS_LOADING)
+
+    def test_maybe_raise_raises_error_not_in_shared_ignores(self):
+        with self.assertRaises(spotify.LibError):
+            spotify.Error.maybe_raise(
+                spotify.ErrorType.BAD_API_VERSION,
+                ignores=spotify.error._IGNORE_IS_LOADING)
+
+    def test_shared_ignores_cannot_be_changed(self):
+        self.assertIsInstance(spotify.error._IGNORE_IS_LOADING, frozenset)
+
 
 class LibErrorTest(unittest.TestCase):
 
@@ -68,6 +87,25 @@ class LibErrorTest(unittest.TestCase):
             spotify.LibError.BAD_API_VERSION,
             spotify.LibError(spotify.ErrorType.BAD_API_VERSION))
 
+    @mock.patch('spotify.error.lib', spec=spotify.lib)
+    def test_error_message_is_only_fetched_once(self, lib_mock):
+        lib_mock.sp_error_message.return_value = spotify.ffi.new(
+            'char[]', b'Some error')
+        self.addCleanup(spotify.error._error_messages.pop, 9999, None)
+
+        error1 = spotify.LibError(9999)
+        error2 = spotify.LibError(9999)
+
+        lib_mock.sp_error_message.assert_called_once_with(9999)
+        self.assertEqual('%s' % error1, 'Some error')
+        self.assertEqual('%s' % error2, 'Some error')
+
+    @mock.patch('spotify.error.lib', spec=spotify.lib)
+    def test_known_error_messages_are_fetched_at_import(self, lib_mock):
+        spotify.LibError(spotify.ErrorType.BAD_API_VERSION)
+
+        self.assertEqual(lib_mock.sp_error_message.call_count, 0)
+
 
 class ErrorTypeTest(unittest.TestCase):
 
@@ -1,16 +1,11 @@
 from __future__ import unicode_literals
 
+import threading
 import time
 import unittest
 
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2
-    import Queue as queue
-
 import spotify
+from spotify import eventloop, utils
 from tests import mock
 
 
@@ -64,25 +59,370 @@ class EventLoopTest(unittest.TestCase):
         self.session.process_events.assert_called_once_with()
 
     def test_processes_events_if_no_notify_main_thread_before_timeout(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.get = lambda timeout: time.sleep(timeout)
         self.loop.start()
 
         time.sleep(0.25)
         self.loop.stop()
         self.assertGreaterEqual(self.session.process_events.call_count, 3)
 
-    def test_puts_on_queue_on_notify_main_thread(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
+    def test_notify_main_thread_wakes_up_loop(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
 
         self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+
+    def test_burst_of_notifications_is_coalesced(self):
+        processing = threading.Event()
+
+        def process_events():
+            processing.set()
+            time.sleep(0.05)
+            return 10000
+
+        self.session.process_events.side_effect = process_events
+        self.loop.start()
+        processing.wait(1)
+
+        for _ in range(100):
+            self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.2)
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+
+    def test_on_notify_main_thread_sets_notified_flag(self):
+        self.assertFalse(self.loop._notified)
+
+        self.loop._on_notify_main_thread(self.session)
+
+        self.assertTrue(self.loop._notified)
+
+    def test_start_makes_loaders_leave_processing_events_to_the_loop(self):
+        self.loop.start()
+
+        self.assertIs(self.session._event_loop_thread, self.loop)
+
+    def test_stop_makes_loaders_process_events_again(self):
+        self.loop.start()
+
+        self.loop.stop()
+
+        self.assertIsNone(self.session._event_loop_thread)
+
+    def test_stop_wakes_up_waiting_loop(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
+
+        self.loop.stop()
+        self.loop.join(1)
+
+        self.assertFalse(self.loop.is_alive())
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def test_stats_is_empty_when_created(self):
+        stats = self.loop.stats()
+
+        self.assertIsInstance(stats, spotify.stats.EventLoopStats)
+        self.assertEqual(stats.iterations, 0)
+        self.assertIsNone(stats.processing_since)
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+    def test_stats_is_a_snapshot(self):
+        stats = self.loop.stats()
 
-    def test_on_notify_main_thread_fails_nicely_if_queue_is_full(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.put_nowait.side_effect = queue.Full
+        self.loop._process_events()
+
+        self.assertEqual(stats.iterations, 0)
+        self.assertEqual(self.loop.stats().iterations, 1)
+
+    def test_stats_records_process_events_duration(self):
+        self.session.process_events.side_effect = (
+            lambda: time.sleep(0.01) or 100)
+
+        self.loop._process_events()
+
+        stats = self.loop.stats()
+        self.assertEqual(stats.iterations, 1)
+        self.assertEqual(stats.process_events.count, 1)
+        self.assertGreaterEqual(stats.process_events.max, 0.005)
+
+    def test_stats_counts_wakeups(self):
+        self.loop._process_events()
+        self.loop._process_events(notified=True)
+        self.loop._process_events(notified=False)
+        self.loop._process_events(notified=False)
+
+        stats = self.loop.stats()
+        self.assertEqual(stats.iterations, 4)
+        self.assertEqual(stats.notification_wakeups, 1)
+        self.assertEqual(stats.timeout_wakeups, 2)
+
+    def test_stats_records_delay_from_notification_to_processing(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
 
         self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        stats = self.loop.stats()
+        self.assertEqual(stats.notification_wakeups, 1)
+        self.assertEqual(stats.notify_delay.count, 1)
+        self.assertLess(stats.notify_delay.max, 0.05)
+
+    def test_stats_counts_listeners_called(self):
+        emitter = spotify.utils.EventEmitter()
+        emitter.on('foo', lambda: None)
+        emitter.on('foo', lambda: None)
+
+        def process_events():
+            emitter.emit('foo')
+            emitter.emit('bar')
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        self.loop._process_events()
+        self.loop._process_events()
+
+        stats = self.loop.stats()
+        self.assertEqual(stats.listeners, 4)
+        self.assertEqual(stats.max_listeners, 2)
+        self.assertEqual(stats.mean_listeners, 2.0)
+
+    def test_stats_does_not_count_listeners_called_by_other_threads(self):
+        emitter = spotify.utils.EventEmitter()
+        emitter.on('foo', lambda: None)
+
+        def process_events():
+            emitter.emit('foo')
+            thread = threading.Thread(target=emitter.emit, args=('foo',))
+            thread.start()
+            thread.join()
+            return 100
+
+        self.session.process_events.side_effect = process_events
+
+        self.loop._process_events()
+
+        self.assertEqual(self.loop.stats().listeners, 1)
+
+    def test_stats_processing_since_is_set_while_processing(self):
+        result = []
+
+        def process_events():
+            result.append(self.loop.stats().processing_since)
+            return 100
+
+        self.session.process_events.side_effect = process_events
+        before = time.time()
+
+        self.loop._process_events()
+
+        self.assertGreaterEqual(result[0], before)
+        self.assertIsNone(self.loop.stats().processing_since)
+
+
+class EventLoopWithWorkersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock(spec=spotify.Session)
+        self.session.process_events.return_value = 100
+        self.loop = spotify.EventLoop(self.session, workers=2)
+
+    def tearDown(self):
+        self.loop.stop()
+        while self.loop.is_alive():
+            self.loop.join(1)
+
+    def test_without_workers_there_is_no_dispatcher(self):
+        self.assertIsNone(spotify.EventLoop(self.session)._dispatcher)
+
+    def test_start_installs_dispatcher(self):
+        self.loop.start()
+
+        self.assertIs(utils._dispatcher, self.loop._dispatcher)
+
+    def test_stop_removes_dispatcher(self):
+        self.loop.start()
+
+        self.loop.stop()
+
+        self.assertIsNone(utils._dispatcher)
+
+    def test_listeners_are_called_from_worker_threads(self):
+        emitter = utils.EventEmitter()
+        threads = []
+        emitter.on('foo', lambda: threads.append(threading.current_thread()))
+        done = threading.Event()
+        emitter.on('foo', done.set)
+
+        def process_events():
+            emitter.emit('foo')
+            return 10000
+
+        self.session.process_events.side_effect = process_events
+        self.loop.start()
+        done.wait(1)
+
+        self.assertEqual(len(threads), 1)
+        self.assertIn('SpotifyEventDispatcher', threads[0].name)
+        self.assertEqual(self.loop.stats().offloaded, 1)
+
+    def test_slow_listeners_do_not_block_the_loop(self):
+        emitter = utils.EventEmitter()
+        emitter.on('foo', lambda: time.sleep(0.2))
+
+        def process_events():
+            emitter.emit('foo')
+            return 10000
+
+        self.session.process_events.side_effect = process_events
+        self.loop.start()
+        time.sleep(0.05)
+        self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        stats = self.loop.stats()
+        self.assertEqual(stats.iterations, 2)
+        self.assertLess(stats.process_events.max, 0.1)
+
+
+class PointerEqualEmitter(utils.EventEmitter, utils.PointerEquality):
+
+    _sp_attr = '_sp_obj'
+
+    def __init__(self, sp_obj):
+        utils.EventEmitter.__init__(self)
+        self._sp_obj = sp_obj
+
+
+class ListenerDispatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = eventloop._ListenerDispatcher(workers=2, budget=0)
+        self.dispatcher.start(threading.current_thread())
+        self.emitter = utils.EventEmitter()
+
+    def tearDown(self):
+        self.dispatcher.stop()
+        for thread in self.dispatcher._threads:
+            thread.join(1)
+
+    def test_calls_listeners_inline_outside_iterations(self):
+        listener = mock.Mock()
+        self.emitter.on('foo', listener)
+
+        self.dispatcher(self.emitter, 'foo', (1,))
+
+        listener.assert_called_once_with(1)
+        self.assertEqual(self.dispatcher.offloaded, 0)
+
+    def test_calls_listeners_inline_within_budget(self):
+        self.dispatcher._budget = 10
+        listener = mock.Mock()
+        self.emitter.on('foo', listener)
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        self.dispatcher(self.emitter, 'foo', (1,))
+
+        listener.assert_called_once_with(1)
+        self.assertEqual(self.dispatcher.offloaded, 0)
+
+    def test_calls_listeners_inline_for_emits_from_other_threads(self):
+        listener = mock.Mock()
+        self.emitter.on('foo', listener)
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        thread = threading.Thread(
+            target=self.dispatcher, args=(self.emitter, 'foo', (1,)))
+        thread.start()
+        thread.join()
+
+        listener.assert_called_once_with(1)
+        self.assertEqual(self.dispatcher.offloaded, 0)
+
+    def test_keeps_order_of_events_from_same_emitter(self):
+        result = []
+        done = threading.Event()
+
+        def listener(i):
+            time.sleep(0.001)
+            result.append(i)
+            if i == 19:
+                done.set()
+
+        self.emitter.on('foo', listener)
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        for i in range(20):
+            self.dispatcher(self.emitter, 'foo', (i,))
+        done.wait(1)
+
+        self.assertEqual(result, list(range(20)))
+        self.assertEqual(self.dispatcher.offloaded, 20)
+
+    def test_keeps_order_after_budget_is_renewed(self):
+        self.dispatcher._budget = 10
+        result = []
+        done = threading.Event()
+        self.emitter.on('foo', lambda i: result.append(i))
+        self.emitter.on('bar', lambda: time.sleep(0.05) or done.set())
+        self.dispatcher.begin_iteration(spotify.stats._clock() - 20)
+        self.dispatcher(self.emitter, 'bar', ())
+        self.dispatcher(self.emitter, 'foo', (1,))
+
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+        self.dispatcher(self.emitter, 'foo', (2,))
+        done.wait(1)
+        time.sleep(0.01)
+
+        self.assertEqual(result, [1, 2])
+
+    def test_equal_emitters_get_their_own_events(self):
+        result = []
+        done = threading.Semaphore(0)
+        sp_obj = spotify.ffi.new('int *')
+        emitter1 = PointerEqualEmitter(sp_obj)
+        emitter2 = PointerEqualEmitter(sp_obj)
+        self.assertEqual(emitter1, emitter2)
+        emitter1.on('foo', lambda: result.append(1) or done.release())
+        emitter2.on('foo', lambda: result.append(2) or done.release())
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        self.dispatcher(emitter1, 'foo', ())
+        self.dispatcher(emitter2, 'foo', ())
+        done.acquire()
+        done.acquire()
+
+        self.assertEqual(sorted(result), [1, 2])
+        self.assertEqual(self.dispatcher._pending, {})
+
+    def test_different_emitters_are_handled_concurrently(self):
+        barrier = threading.Semaphore(0)
+        done = threading.Event()
+        other_emitter = utils.EventEmitter()
+        self.emitter.on('foo', lambda: barrier.acquire())
+        other_emitter.on('foo', lambda: barrier.release() or done.set())
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        self.dispatcher(self.emitter, 'foo', ())
+        self.dispatcher(other_emitter, 'foo', ())
+
+        self.assertTrue(done.wait(1))
+
+    @mock.patch('spotify.eventloop.logger')
+    def test_failing_listener_is_logged(self, logger_mock):
+        done = threading.Event()
+        self.emitter.on('foo', mock.Mock(side_effect=Exception('oops')))
+        self.emitter.on('bar', done.set)
+        self.dispatcher.begin_iteration(spotify.stats._clock())
+
+        self.dispatcher(self.emitter, 'foo', ())
+        self.dispatcher(self.emitter, 'bar', ())
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+        self.assertTrue(done.wait(1))
+        self.assertEqual(logger_mock.exception.call_count, 1)
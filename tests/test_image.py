@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -58,6 +59,64 @@ class ImageTest(unittest.TestCase):
 
         lib_mock.sp_image_release.assert_called_with(sp_image)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+        image = spotify.Image(self.session, sp_image=sp_image)
+
+        self.assertFalse(hasattr(image, '__dict__'))
+        self.assertIs(weakref.ref(image)(), image)
+
+    def test_eq_if_same_sp_image(self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+        image1 = spotify.Image(self.session, sp_image=sp_image)
+        image2 = spotify.Image(self.session, sp_image=sp_image)
+
+        self.assertIsNot(image1, image2)
+        self.assertTrue(image1 == image2)
+        self.assertFalse(image1 != image2)
+        self.assertEqual(hash(image1), hash(image2))
+        self.assertEqual(len(set([image1, image2])), 1)
+
+    def test_not_eq_if_different_sp_image(self, lib_mock):
+        image1 = spotify.Image(
+            self.session, sp_image=spotify.ffi.new('int *'))
+        image2 = spotify.Image(
+            self.session, sp_image=spotify.ffi.new('int *'))
+
+        self.assertFalse(image1 == image2)
+        self.assertTrue(image1 != image2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+        image = spotify.Image(self.session, sp_image=sp_image)
+
+        self.assertFalse(image == sp_image)
+        self.assertTrue(image != 'foo')
+
+    def test_cached_image(self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+
+        result1 = spotify.Image._cached(self.session, sp_image)
+        result2 = spotify.Image._cached(self.session, sp_image)
+
+        self.assertIsInstance(result1, spotify.Image)
+        self.assertIs(result1, result2)
+        lib_mock.sp_image_add_ref.assert_called_once_with(sp_image)
+
+    def test_cached_image_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+
+        result1 = spotify.Image._cached(
+            self.session, sp_image, add_ref=False)
+        result2 = spotify.Image._cached(
+            self.session, sp_image, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_image_add_ref.call_count, 0)
+        lib_mock.sp_image_release.assert_called_once_with(sp_image)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -247,11 +306,10 @@ class ImageTest(unittest.TestCase):
         self.assertIsNone(result)
 
     def test_data_uri_fails_if_unknown_image_format(self, lib_mock):
+        lib_mock.sp_image_format.return_value = int(
+            spotify.ImageFormat.UNKNOWN)
         sp_image = spotify.ffi.new('int *')
         image = spotify.Image(self.session, sp_image=sp_image)
-        image.__dict__['format'] = mock.Mock(
-            return_value=spotify.ImageFormat.UNKNOWN)
-        image.__dict__['data'] = mock.Mock(return_value=b'01234\x006789')
 
         with self.assertRaises(ValueError):
             image.data_uri
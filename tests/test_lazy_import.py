@@ -0,0 +1,123 @@
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+import unittest
+
+import spotify
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Max time in seconds spent importing pyspotify's own submodules in a process
+# that only imports spotify, builds a config, and parses links.
+IMPORT_TIME_BUDGET = 0.2
+
+# Submodules that a process which only builds configs and parses links should
+# not need to import.
+HEAVY_SUBMODULES = [
+    'spotify.album',
+    'spotify.artist',
+    'spotify.playlist',
+    'spotify.search',
+    'spotify.toplist',
+]
+
+# Modules providing the CFFI library. ``spotify._spotify_build`` is only
+# imported when the ``spotify._spotify`` module hasn't been built.
+FFI_MODULES = ['spotify._spotify', 'spotify._spotify_build']
+
+
+def import_times(code):
+    """Run ``code`` in a new interpreter and return a dict mapping the names
+    of the imported pyspotify submodules to their own import time in
+    seconds."""
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_DIR, stderr=subprocess.STDOUT)
+    result = {}
+    for line in output.decode('utf-8').splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name.startswith('spotify.') and name not in FFI_MODULES:
+            result[name] = int(self_us) / 1000000.0
+    return result
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 7), 'Lazy imports requires Python 3.7 or newer')
+class LazyImportTest(unittest.TestCase):
+
+    def test_import_does_not_import_submodules(self):
+        times = import_times('import spotify')
+
+        self.assertEqual(times, {})
+
+    def test_config_and_link_does_not_import_heavy_submodules(self):
+        times = import_times(
+            'import spotify; spotify.Config(); spotify.Link; spotify.LinkType')
+
+        self.assertIn('spotify.config', times)
+        self.assertIn('spotify.link', times)
+        for name in HEAVY_SUBMODULES:
+            self.assertNotIn(name, times)
+
+    def test_config_and_link_import_time_is_within_budget(self):
+        times = import_times(
+            'import spotify; spotify.Config(); spotify.Link; spotify.LinkType')
+
+        self.assertLess(sum(times.values()), IMPORT_TIME_BUDGET, times)
+
+    def test_lazy_attribute_is_submodule_attribute(self):
+        from spotify import playlist
+
+        self.assertIs(spotify.Playlist, playlist.Playlist)
+        self.assertIn('Playlist', vars(spotify))
+
+    def test_lazy_submodule(self):
+        from spotify import stats
+
+        self.assertIs(spotify.stats, stats)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            spotify.NoSuchThing
+
+    def test_dir_includes_lazy_attributes(self):
+        names = dir(spotify)
+
+        self.assertIn('Playlist', names)
+        self.assertIn('Toplist', names)
+        self.assertIn('stats', names)
+
+
+class SubmoduleExportsTest(unittest.TestCase):
+
+    def test_exports_match_submodule_all(self):
+        for module_name, names in spotify._SUBMODULE_EXPORTS.items():
+            full_name = 'spotify.%s' % module_name
+            __import__(full_name)
+            module = sys.modules[full_name]
+
+            self.assertEqual(
+                sorted(names), sorted(module.__all__), module_name)
+
+
+class StarImportTest(unittest.TestCase):
+
+    def test_star_import_exports_public_names(self):
+        namespace = {}
+        exec('from spotify import *', namespace)
+
+        for name in ['Session', 'Track', 'EventLoop', 'ffi', 'lib']:
+            self.assertIn(name, namespace)
+            self.assertIs(namespace[name], getattr(spotify, name))
+        self.assertIn('set_fine_grained_locking', namespace)
+        self.assertNotIn('_lock', namespace)
+
+    def test_all_includes_all_lazy_attributes(self):
+        for name in spotify._LAZY_ATTRIBUTES:
+            self.assertIn(name, spotify.__all__)
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -54,6 +55,41 @@ class LinkTest(unittest.TestCase):
 
         lib_mock.sp_link_release.assert_called_with(sp_link)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_link = spotify.ffi.new('int *')
+        link = spotify.Link(self.session, sp_link=sp_link)
+
+        self.assertFalse(hasattr(link, '__dict__'))
+        self.assertIs(weakref.ref(link)(), link)
+
+    def test_eq_if_same_sp_link(self, lib_mock):
+        sp_link = spotify.ffi.new('int *')
+        link1 = spotify.Link(self.session, sp_link=sp_link)
+        link2 = spotify.Link(self.session, sp_link=sp_link)
+
+        self.assertIsNot(link1, link2)
+        self.assertTrue(link1 == link2)
+        self.assertFalse(link1 != link2)
+        self.assertEqual(hash(link1), hash(link2))
+        self.assertEqual(len(set([link1, link2])), 1)
+
+    def test_not_eq_if_different_sp_link(self, lib_mock):
+        link1 = spotify.Link(
+            self.session, sp_link=spotify.ffi.new('int *'))
+        link2 = spotify.Link(
+            self.session, sp_link=spotify.ffi.new('int *'))
+
+        self.assertFalse(link1 == link2)
+        self.assertTrue(link1 != link2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_link = spotify.ffi.new('int *')
+        link = spotify.Link(self.session, sp_link=sp_link)
+
+        self.assertFalse(link == sp_link)
+        self.assertTrue(link != 'foo')
+
     def test_repr(self, lib_mock):
         sp_link = spotify.ffi.new('int *')
         lib_mock.sp_link_create_from_string.return_value = sp_link
@@ -1,10 +1,11 @@
 from __future__ import unicode_literals
 
+import threading
 import unittest
 import time
 
 import spotify
-from spotify.utils import load
+from spotify.utils import load, load_async
 import tests
 from tests import mock
 
@@ -21,6 +22,9 @@ class Foo(object):
     def load(self, timeout=None):
         return load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        return load_async(self._session, self, timeout=timeout)
+
 
 class FooWithError(Foo):
     def error(self):
@@ -34,6 +38,7 @@ class LoadableTest(unittest.TestCase):
     def setUp(self):
         self.session = tests.create_session()
         self.session.connection_state = spotify.ConnectionState.LOGGED_IN
+        self.session.process_events.return_value = 1000
 
     def test_load_raises_error_if_not_logged_in(
             self, is_loaded_mock, time_mock):
@@ -61,7 +66,72 @@ class LoadableTest(unittest.TestCase):
         foo.load()
 
         self.assertEqual(self.session.process_events.call_count, 2)
-        self.assertEqual(time_mock.sleep.call_count, 2)
+        self.assertEqual(self.session._wait_for_load.call_count, 2)
+        self.assertEqual(time_mock.sleep.call_count, 0)
+
+    def test_load_waits_no_longer_than_the_process_events_timeout(
+            self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, True]
+        time_mock.time.side_effect = [100.0, 100.0]
+        self.session.process_events.return_value = 250
+        self.session._load_generation = 7
+
+        foo = Foo(self.session)
+        foo.load(timeout=10)
+
+        self.session._wait_for_load.assert_called_once_with(7, 0.25)
+
+    def test_load_waits_no_longer_than_the_load_timeout(
+            self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, True]
+        time_mock.time.side_effect = [100.0, 109.5]
+        self.session.process_events.return_value = 1000
+        self.session._load_generation = 7
+
+        foo = Foo(self.session)
+        foo.load(timeout=10)
+
+        self.session._wait_for_load.assert_called_once_with(7, 0.5)
+
+    def test_load_leaves_processing_events_to_running_event_loop(
+            self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, False, True]
+        time_mock.time.side_effect = time.time
+        self.session._event_loop_thread = mock.Mock(spec=threading.Thread)
+        self.session._event_loop_thread.is_alive.return_value = True
+        self.session.next_timeout = 250
+        self.session._load_generation = 7
+
+        foo = Foo(self.session)
+        foo.load(timeout=10)
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.assertEqual(self.session._wait_for_load.call_count, 2)
+        self.assertEqual(
+            self.session._wait_for_load.call_args, mock.call(7, 0.25))
+
+    def test_load_processes_events_if_event_loop_has_died(
+            self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, True]
+        time_mock.time.side_effect = time.time
+        self.session._event_loop_thread = mock.Mock(spec=threading.Thread)
+        self.session._event_loop_thread.is_alive.return_value = False
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def test_load_processes_events_if_called_from_event_loop_thread(
+            self, is_loaded_mock, time_mock):
+        is_loaded_mock.side_effect = [False, True]
+        time_mock.time.side_effect = time.time
+        self.session._event_loop_thread = threading.current_thread()
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.assertEqual(self.session.process_events.call_count, 1)
 
     def test_load_raises_exception_on_error(self, is_loaded_mock, time_mock):
         is_loaded_mock.side_effect = [False, False, True]
@@ -73,7 +143,7 @@ class LoadableTest(unittest.TestCase):
             foo.load()
 
         self.assertEqual(self.session.process_events.call_count, 1)
-        self.assertEqual(time_mock.sleep.call_count, 0)
+        self.assertEqual(self.session._wait_for_load.call_count, 0)
 
     def test_load_raises_exception_on_error_even_if_already_loaded(
             self, is_loaded_mock, time_mock):
@@ -95,7 +165,7 @@ class LoadableTest(unittest.TestCase):
         foo.load()
 
         self.assertEqual(self.session.process_events.call_count, 2)
-        self.assertEqual(time_mock.sleep.call_count, 2)
+        self.assertEqual(self.session._wait_for_load.call_count, 2)
 
     def test_load_returns_self(self, is_loaded_mock, time_mock):
         is_loaded_mock.return_value = True
@@ -104,3 +174,41 @@ class LoadableTest(unittest.TestCase):
         result = foo.load()
 
         self.assertEqual(result, foo)
+
+
+class LoadAsyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.session.connection_state = spotify.ConnectionState.LOGGED_IN
+
+    def test_load_async_raises_error_if_not_logged_in(self):
+        self.session.connection_state = spotify.ConnectionState.LOGGED_OUT
+        foo = Foo(self.session)
+
+        with self.assertRaises(RuntimeError):
+            foo.load_async()
+
+    @mock.patch('spotify.utils.futures', None)
+    def test_load_async_raises_error_if_futures_is_missing(self):
+        foo = Foo(self.session)
+
+        with self.assertRaises(RuntimeError):
+            foo.load_async()
+
+    def test_load_async_returns_future_added_to_session(self):
+        foo = Foo(self.session)
+
+        future = foo.load_async(timeout=5)
+
+        self.session._add_load_future.assert_called_once_with(
+            foo, future, 5)
+        self.assertFalse(future.done())
+
+    def test_load_async_defaults_to_ten_seconds_timeout(self):
+        foo = Foo(self.session)
+
+        future = foo.load_async()
+
+        self.session._add_load_future.assert_called_once_with(
+            foo, future, 10)
@@ -51,8 +51,6 @@ class PlaylistTest(unittest.TestCase):
         sp_playlist = playlist._sp_playlist
 
         lib_mock.sp_playlist_add_ref.assert_called_with(sp_playlist)
-        lib_mock.sp_playlist_add_callbacks.assert_called_with(
-            sp_playlist, mock.ANY, mock.ANY)
 
         playlist = None  # noqa
         tests.gc_collect()
@@ -74,6 +72,37 @@ class PlaylistTest(unittest.TestCase):
         self.assertIsInstance(result1, spotify.Playlist)
         self.assertIs(result1, result2)
 
+    def test_cached_playlist_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_playlist = spotify.ffi.new('int *')
+
+        result1 = spotify.Playlist._cached(
+            self.session, sp_playlist, add_ref=False)
+        result2 = spotify.Playlist._cached(
+            self.session, sp_playlist, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_playlist_add_ref.call_count, 0)
+        lib_mock.sp_playlist_release.assert_called_once_with(sp_playlist)
+
+    def test_eq_if_same_sp_playlist(self, lib_mock):
+        sp_playlist = spotify.ffi.new('int *')
+        playlist1 = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        playlist2 = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        self.assertTrue(playlist1 == playlist2)
+        self.assertFalse(playlist1 != playlist2)
+        self.assertEqual(hash(playlist1), hash(playlist2))
+
+    def test_not_eq_if_different_sp_playlist(self, lib_mock):
+        playlist1 = spotify.Playlist(
+            self.session, sp_playlist=spotify.ffi.new('int *'))
+        playlist2 = spotify.Playlist(
+            self.session, sp_playlist=spotify.ffi.new('int *'))
+
+        self.assertFalse(playlist1 == playlist2)
+        self.assertTrue(playlist1 != playlist2)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         lib_mock.sp_playlist_is_loaded.return_value = 1
@@ -126,6 +155,70 @@ class PlaylistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, playlist, timeout=10)
 
+    @mock.patch('spotify.utils.load')
+    def test_load_registers_callbacks_while_loading(
+            self, load_mock, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        registered = []
+        load_mock.side_effect = lambda *args, **kwargs: registered.append(
+            playlist._sp_playlist_callbacks)
+
+        playlist.load(10)
+
+        self.assertEqual(load_mock.call_count, 1)
+        self.assertIsNotNone(registered[0])
+        self.assertEqual(
+            len(self.removed_callbacks(lib_mock, registered[0])), 1)
+        self.assertIsNone(playlist._sp_playlist_callbacks)
+
+    @mock.patch('spotify.utils.load')
+    def test_load_keeps_callbacks_if_playlist_has_listeners(
+            self, load_mock, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+
+        sp_playlist_callbacks = playlist._sp_playlist_callbacks
+
+        playlist.load(10)
+
+        self.assertEqual(self.removed_callbacks(
+            lib_mock, sp_playlist_callbacks), [])
+        self.assertIs(playlist._sp_playlist_callbacks, sp_playlist_callbacks)
+
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async_registers_callbacks_until_future_is_done(
+            self, load_async_mock, lib_mock):
+        future = mock.Mock()
+        load_async_mock.return_value = future
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        result = playlist.load_async(10)
+
+        self.assertIs(result, future)
+        load_async_mock.assert_called_once_with(
+            self.session, playlist, timeout=10)
+        self.assertIsNotNone(playlist._sp_playlist_callbacks)
+
+        done_callback = future.add_done_callback.call_args[0][0]
+        done_callback(future)
+
+        self.assertIsNone(playlist._sp_playlist_callbacks)
+
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async_failing_does_not_keep_callbacks(
+            self, load_async_mock, lib_mock):
+        load_async_mock.side_effect = RuntimeError
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        with self.assertRaises(RuntimeError):
+            playlist.load_async(10)
+
+        self.assertIsNone(playlist._sp_playlist_callbacks)
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_tracks(self, track_lib_mock, lib_mock):
         sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
@@ -148,6 +241,20 @@ class PlaylistTest(unittest.TestCase):
         lib_mock.sp_playlist_track.assert_called_with(sp_playlist, 0)
         track_lib_mock.sp_track_add_ref.assert_called_with(sp_track)
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_tracks_reuses_track_wrappers(self, track_lib_mock, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
+        lib_mock.sp_playlist_num_tracks.return_value = 1
+        lib_mock.sp_playlist_track.return_value = sp_track
+        sp_playlist = spotify.ffi.new('int *')
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        item1 = playlist.tracks[0]
+        item2 = playlist.tracks[0]
+
+        self.assertIs(item1, item2)
+        self.assertEqual(track_lib_mock.sp_track_add_ref.call_count, 1)
+
     def test_tracks_if_no_tracks(self, lib_mock):
         lib_mock.sp_playlist_num_tracks.return_value = 0
         sp_playlist = spotify.ffi.new('int *')
@@ -509,6 +616,22 @@ class PlaylistTest(unittest.TestCase):
         lib_mock.sp_playlist_remove_tracks.assert_called_with(
             sp_playlist, [sp_track], 1)
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_remove_tracks_with_duplicate_wrappers(
+            self, track_lib_mock, lib_mock):
+        lib_mock.sp_playlist_remove_tracks.return_value = int(
+            spotify.ErrorType.OK)
+        sp_track = spotify.ffi.new('int *')
+        track1 = spotify.Track(self.session, sp_track=sp_track)
+        track2 = spotify.Track(self.session, sp_track=sp_track)
+        sp_playlist = spotify.ffi.new('int *')
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.remove_tracks([track1, track2])
+
+        lib_mock.sp_playlist_remove_tracks.assert_called_with(
+            sp_playlist, [sp_track], 1)
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_remove_tracks_fails_if_error(self, track_lib_mock, lib_mock):
         lib_mock.sp_playlist_remove_tracks.return_value = int(
@@ -759,13 +882,66 @@ class PlaylistTest(unittest.TestCase):
         lib_mock.sp_playlist_is_in_ram.assert_called_with(
             self.session._sp_session, sp_playlist)
 
+    def removed_callbacks(self, lib_mock, sp_playlist_callbacks):
+        # Other playlists may be garbage collected during the test, so only
+        # the calls for the given callbacks struct are returned.
+        calls = lib_mock.sp_playlist_remove_callbacks.call_args_list
+        return [call for call in calls if call[0][1] is sp_playlist_callbacks]
+
+    def test_callbacks_are_not_registered_without_listeners(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+
+        spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        self.assertEqual(lib_mock.sp_playlist_add_callbacks.call_count, 0)
+
+    def test_first_on_call_registers_callbacks(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+        playlist.on(spotify.PlaylistEvent.TRACKS_MOVED, lambda *args: None)
+
+        lib_mock.sp_playlist_add_callbacks.assert_called_once_with(
+            sp_playlist, playlist._sp_playlist_callbacks, spotify.ffi.NULL)
+
+    def test_last_off_call_unregisters_callbacks(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+        playlist.on(spotify.PlaylistEvent.TRACKS_MOVED, lambda *args: None)
+        sp_playlist_callbacks = playlist._sp_playlist_callbacks
+
+        playlist.off(spotify.PlaylistEvent.TRACKS_ADDED)
+
+        self.assertEqual(self.removed_callbacks(
+            lib_mock, sp_playlist_callbacks), [])
+
+        playlist.off(spotify.PlaylistEvent.TRACKS_MOVED)
+
+        self.assertEqual(
+            self.removed_callbacks(lib_mock, sp_playlist_callbacks),
+            [mock.call(sp_playlist, sp_playlist_callbacks, spotify.ffi.NULL)])
+        self.assertIsNone(playlist._sp_playlist_callbacks)
+
+    def test_callbacks_are_registered_again_after_last_off(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+        playlist.off()
+
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+
+        self.assertEqual(lib_mock.sp_playlist_add_callbacks.call_count, 2)
+        self.assertIsNotNone(playlist._sp_playlist_callbacks)
+
     def test_first_on_call_adds_ref_to_obj_on_session(self, lib_mock):
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
         playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
 
         playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
 
-        self.assertIn(playlist, self.session._emitters)
+        self.assertIs(self.session._emitters[id(playlist)], playlist)
 
     def test_last_off_call_removes_ref_to_obj_from_session(self, lib_mock):
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
@@ -774,7 +950,7 @@ class PlaylistTest(unittest.TestCase):
         playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
         playlist.off(spotify.PlaylistEvent.TRACKS_ADDED)
 
-        self.assertNotIn(playlist, self.session._emitters)
+        self.assertNotIn(id(playlist), self.session._emitters)
 
     def test_other_off_calls_keeps_ref_to_obj_on_session(self, lib_mock):
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
@@ -784,11 +960,24 @@ class PlaylistTest(unittest.TestCase):
         playlist.on(spotify.PlaylistEvent.TRACKS_MOVED, lambda *args: None)
         playlist.off(spotify.PlaylistEvent.TRACKS_ADDED)
 
-        self.assertIn(playlist, self.session._emitters)
+        self.assertIs(self.session._emitters[id(playlist)], playlist)
 
         playlist.off(spotify.PlaylistEvent.TRACKS_MOVED)
 
-        self.assertNotIn(playlist, self.session._emitters)
+        self.assertNotIn(id(playlist), self.session._emitters)
+
+    def test_equal_playlists_with_listeners_are_all_kept_alive(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist1 = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        playlist2 = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        self.assertEqual(playlist1, playlist2)
+
+        playlist1.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+        playlist2.on(spotify.PlaylistEvent.TRACKS_ADDED, lambda *args: None)
+        playlist1.off()
+
+        self.assertNotIn(id(playlist1), self.session._emitters)
+        self.assertIs(self.session._emitters[id(playlist2)], playlist2)
 
 
 @mock.patch('spotify.playlist.lib', spec=spotify.lib)
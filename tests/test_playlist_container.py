@@ -51,12 +51,25 @@ class PlaylistContainerTest(unittest.TestCase):
         self.assertIsInstance(result1, spotify.PlaylistContainer)
         self.assertIs(result1, result2)
 
+    def test_cached_container_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_playlistcontainer = spotify.ffi.new('int *')
+
+        result1 = spotify.PlaylistContainer._cached(
+            self.session, sp_playlistcontainer, add_ref=False)
+        result2 = spotify.PlaylistContainer._cached(
+            self.session, sp_playlistcontainer, add_ref=False)
+
+        self.assertIs(result1, result2)
+        lib_mock.sp_playlistcontainer_release.assert_called_once_with(
+            sp_playlistcontainer)
+
     @mock.patch('spotify.User', spec=spotify.User)
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, user_mock, lib_mock):
         link_instance_mock = link_mock.return_value
         link_instance_mock.uri = 'foo'
-        user_instance_mock = user_mock.return_value
+        user_instance_mock = user_mock._cached.return_value
         user_instance_mock.link = link_instance_mock
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 0
         sp_playlistcontainer = spotify.ffi.new('int *')
@@ -928,7 +941,7 @@ class PlaylistContainerTest(unittest.TestCase):
 
     @mock.patch('spotify.User', spec=spotify.User)
     def test_owner(self, user_mock, lib_mock):
-        user_mock.return_value = mock.sentinel.user
+        user_mock._cached.return_value = mock.sentinel.user
         sp_user = spotify.ffi.new('int *')
         lib_mock.sp_playlistcontainer_owner.return_value = sp_user
         sp_playlistcontainer = spotify.ffi.new('int *')
@@ -939,7 +952,7 @@ class PlaylistContainerTest(unittest.TestCase):
 
         lib_mock.sp_playlistcontainer_owner.assert_called_with(
             sp_playlistcontainer)
-        user_mock.assert_called_with(
+        user_mock._cached.assert_called_with(
             self.session, sp_user=sp_user, add_ref=True)
         self.assertEqual(result, mock.sentinel.user)
 
@@ -980,7 +993,7 @@ class PlaylistContainerTest(unittest.TestCase):
         with self.assertRaises(spotify.Error):
             playlist_container.clear_unseen_tracks(playlist)
 
-    def test_first_on_call_adds_obj_emitters_list(self, lib_mock):
+    def test_first_on_call_adds_obj_to_emitters(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.new('int *')
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
@@ -988,11 +1001,13 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container.on(
             spotify.PlaylistContainerEvent.PLAYLIST_ADDED, lambda *args: None)
 
-        self.assertIn(playlist_container, self.session._emitters)
+        self.assertIs(
+            self.session._emitters[id(playlist_container)],
+            playlist_container)
 
         playlist_container.off()
 
-    def test_last_off_call_removes_obj_from_emitters_list(self, lib_mock):
+    def test_last_off_call_removes_obj_from_emitters(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.new('int *')
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
@@ -1002,9 +1017,9 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container.off(
             spotify.PlaylistContainerEvent.PLAYLIST_ADDED)
 
-        self.assertNotIn(playlist_container, self.session._emitters)
+        self.assertNotIn(id(playlist_container), self.session._emitters)
 
-    def test_other_off_calls_keeps_obj_in_emitters_list(self, lib_mock):
+    def test_other_off_calls_keeps_obj_in_emitters(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.new('int *')
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
@@ -1016,12 +1031,14 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container.off(
             spotify.PlaylistContainerEvent.PLAYLIST_ADDED)
 
-        self.assertIn(playlist_container, self.session._emitters)
+        self.assertIs(
+            self.session._emitters[id(playlist_container)],
+            playlist_container)
 
         playlist_container.off(
             spotify.PlaylistContainerEvent.PLAYLIST_MOVED)
 
-        self.assertNotIn(playlist_container, self.session._emitters)
+        self.assertNotIn(id(playlist_container), self.session._emitters)
 
 
 @mock.patch('spotify.playlist.lib', spec=spotify.lib)
@@ -0,0 +1,167 @@
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+import spotify
+from spotify import release
+import tests
+from tests import mock
+
+
+class ReleaseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.release_func = mock.Mock()
+
+    def tearDown(self):
+        release.disable_deferred_release()
+
+    def test_releases_at_once_by_default(self):
+        sp_obj = spotify.ffi.new('int *')
+
+        obj = release.gc(sp_obj, self.release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+
+        self.release_func.assert_called_once_with(sp_obj)
+        self.assertEqual(release.release_stats().pending, 0)
+
+    def test_queues_release_when_deferred(self):
+        release.enable_deferred_release()
+        sp_obj = spotify.ffi.new('int *')
+
+        obj = release.gc(sp_obj, self.release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+
+        self.assertEqual(self.release_func.call_count, 0)
+        self.assertEqual(release.release_stats().pending, 1)
+
+    def test_uses_plain_finalizer_when_not_deferred(self):
+        sp_obj = spotify.ffi.new('int *')
+
+        with mock.patch('spotify.release.ffi') as ffi_mock:
+            release.gc(sp_obj, self.release_func)
+
+        ffi_mock.gc.assert_called_once_with(sp_obj, self.release_func)
+
+    def test_releases_objects_created_before_enabling_at_once(self):
+        sp_obj = spotify.ffi.new('int *')
+        obj = release.gc(sp_obj, self.release_func)
+
+        release.enable_deferred_release()
+        obj = None  # noqa
+        tests.gc_collect()
+
+        self.release_func.assert_called_once_with(sp_obj)
+        self.assertEqual(release.release_stats().pending, 0)
+
+    def test_release_pending_releases_queued_objects(self):
+        release.enable_deferred_release()
+        sp_obj = spotify.ffi.new('int *')
+        obj = release.gc(sp_obj, self.release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+        before = release.release_stats()
+
+        result = release.release_pending()
+
+        self.assertEqual(result, 1)
+        self.release_func.assert_called_once_with(sp_obj)
+        after = release.release_stats()
+        self.assertEqual(after.pending, 0)
+        self.assertEqual(after.released, before.released + 1)
+        self.assertEqual(after.batches, before.batches + 1)
+
+    def test_release_pending_releases_in_batches(self):
+        release.enable_deferred_release()
+        objs = [
+            release.gc(spotify.ffi.new('int *'), self.release_func)
+            for _ in range(release.BATCH_SIZE + 1)]
+        objs = None  # noqa
+        tests.gc_collect()
+        before = release.release_stats()
+
+        result = release.release_pending()
+
+        self.assertEqual(result, release.BATCH_SIZE + 1)
+        self.assertEqual(
+            self.release_func.call_count, release.BATCH_SIZE + 1)
+        self.assertEqual(
+            release.release_stats().batches, before.batches + 2)
+
+    def test_release_pending_holds_lock_while_releasing(self):
+        release.enable_deferred_release()
+        lock_held = []
+
+        def release_func(sp_obj):
+            acquired = []
+            thread = threading.Thread(
+                target=lambda: acquired.append(spotify._lock.acquire(False)))
+            thread.start()
+            thread.join()
+            if acquired[0]:
+                spotify._lock.release()
+            lock_held.append(not acquired[0])
+
+        obj = release.gc(spotify.ffi.new('int *'), release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+        release.release_pending()
+
+        self.assertEqual(lock_held, [True])
+
+    def test_release_pending_with_max_count(self):
+        release.enable_deferred_release()
+        objs = [
+            release.gc(spotify.ffi.new('int *'), self.release_func)
+            for _ in range(3)]
+        objs = None  # noqa
+        tests.gc_collect()
+
+        result = release.release_pending(max_count=2)
+
+        self.assertEqual(result, 2)
+        self.assertEqual(self.release_func.call_count, 2)
+        self.assertEqual(release.release_stats().pending, 1)
+
+    def test_disable_releases_pending_objects(self):
+        release.enable_deferred_release()
+        sp_obj = spotify.ffi.new('int *')
+        obj = release.gc(sp_obj, self.release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+
+        release.disable_deferred_release()
+
+        self.release_func.assert_called_once_with(sp_obj)
+        self.assertEqual(release.release_stats().pending, 0)
+
+    def test_release_stats_has_useful_repr(self):
+        self.assertIn('pending=0', repr(release.release_stats()))
+
+
+@mock.patch('spotify.track.lib', spec=spotify.lib)
+class DeferredTrackReleaseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+
+    def tearDown(self):
+        release.disable_deferred_release()
+
+    def test_releases_sp_track_when_pending_objects_are_released(
+            self, lib_mock):
+        release.enable_deferred_release()
+        sp_track = spotify.ffi.new('int *')
+
+        track = spotify.Track(self.session, sp_track=sp_track)
+        track = None  # noqa
+        tests.gc_collect()
+
+        self.assertEqual(lib_mock.sp_track_release.call_count, 0)
+
+        release.release_pending()
+
+        lib_mock.sp_track_release.assert_called_with(sp_track)
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -47,6 +48,7 @@ class SearchTest(unittest.TestCase):
         userdata = lib_mock.sp_search_create.call_args[0][12]
         search_complete_cb(sp_search, userdata)
         self.assertTrue(result.complete_event.wait(3))
+        self.session._notify_loaders.assert_called_once_with()
 
     def test_search_with_callback(self, lib_mock):
         sp_search = spotify.ffi.cast('sp_search *', spotify.ffi.new('int *'))
@@ -101,6 +103,14 @@ class SearchTest(unittest.TestCase):
 
         lib_mock.sp_search_release.assert_called_with(sp_search)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_search = spotify.ffi.new('int *')
+        search = spotify.Search(self.session, sp_search=sp_search)
+
+        self.assertFalse(hasattr(search, '__dict__'))
+        self.assertIs(weakref.ref(search)(), search)
+
     def test_complete_event_is_unset_by_default(self, lib_mock):
         sp_search = spotify.ffi.new('int *')
         search = spotify.Search(self.session, sp_search=sp_search)
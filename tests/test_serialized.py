@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+import spotify
+from tests import mock
+
+
+def lock_is_held():
+    """Check if the global lock is held, by trying to acquire it from another
+    thread."""
+    result = []
+
+    def try_acquire():
+        acquired = spotify._lock.acquire(False)
+        if acquired:
+            spotify._lock.release()
+        result.append(not acquired)
+
+    thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class SerializedTest(unittest.TestCase):
+
+    def tearDown(self):
+        spotify.set_fine_grained_locking(False)
+
+    def test_holds_lock_while_calling_function(self):
+        func = spotify.serialized(lock_is_held)
+
+        self.assertTrue(func())
+
+    def test_holds_lock_even_if_fine_grained_locking_is_enabled(self):
+        spotify.set_fine_grained_locking(True)
+        func = spotify.serialized(lock_is_held)
+
+        self.assertTrue(func())
+
+    def test_wraps_function(self):
+        func = spotify.serialized(lock_is_held)
+
+        self.assertEqual(func.__name__, 'lock_is_held')
+        self.assertIs(func.__wrapped__, lock_is_held)
+
+
+class SerializedAccessorTest(unittest.TestCase):
+
+    def tearDown(self):
+        spotify.set_fine_grained_locking(False)
+
+    def test_holds_lock_by_default(self):
+        func = spotify.serialized_accessor(lock_is_held)
+
+        self.assertTrue(func())
+
+    def test_does_not_hold_lock_if_fine_grained_locking_is_enabled(self):
+        spotify.set_fine_grained_locking(True)
+        func = spotify.serialized_accessor(lock_is_held)
+
+        self.assertFalse(func())
+
+    def test_holds_lock_again_if_fine_grained_locking_is_disabled(self):
+        func = spotify.serialized_accessor(lock_is_held)
+
+        spotify.set_fine_grained_locking(True)
+        spotify.set_fine_grained_locking(False)
+
+        self.assertTrue(func())
+
+    def test_wraps_function(self):
+        func = spotify.serialized_accessor(lock_is_held)
+
+        self.assertEqual(func.__name__, 'lock_is_held')
+        self.assertIs(func.__wrapped__, lock_is_held)
+
+
+class SerializeAccessToLibraryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cffi_lib = mock.Mock(spec=[
+            'sp_track_name', 'sp_session_process_events', 'SP_ERROR_OK'])
+        self.cffi_lib.sp_track_name.side_effect = lock_is_held
+        self.cffi_lib.sp_session_process_events.side_effect = lock_is_held
+        self.cffi_lib.SP_ERROR_OK = 0
+
+        self.lib = spotify._serialize_access_to_library(self.cffi_lib)
+
+    def tearDown(self):
+        spotify.set_fine_grained_locking(False)
+
+    def test_serializes_all_functions_by_default(self):
+        self.assertTrue(self.lib.sp_track_name())
+        self.assertTrue(self.lib.sp_session_process_events())
+
+    def test_only_serializes_non_accessors_with_fine_grained_locking(self):
+        spotify.set_fine_grained_locking(True)
+
+        self.assertFalse(self.lib.sp_track_name())
+        self.assertTrue(self.lib.sp_session_process_events())
+
+    def test_does_not_modify_cffi_library(self):
+        self.assertIs(
+            self.lib.sp_track_name.__wrapped__, self.cffi_lib.sp_track_name)
+        self.assertIsNot(self.lib.sp_track_name, self.cffi_lib.sp_track_name)
+
+    def test_constants_are_looked_up_on_cffi_library(self):
+        self.assertEqual(self.lib.SP_ERROR_OK, 0)
+
+    def test_dir_includes_functions_and_constants(self):
+        names = dir(self.lib)
+
+        self.assertIn('sp_track_name', names)
+        self.assertIn('SP_ERROR_OK', names)
+        self.assertNotIn('_lib', names)
+
+    def test_accessor_functions_exist_in_library(self):
+        for name in spotify._ACCESSOR_FUNCTIONS:
+            self.assertTrue(hasattr(spotify.lib, name), name)
@@ -2,9 +2,19 @@
 
 from __future__ import unicode_literals
 
+import itertools
+import os
+import select
+import threading
 import unittest
 
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
 import spotify
+from spotify import session as session_module
 from spotify.session import _SessionCallbacks
 import tests
 from tests import mock
@@ -76,6 +86,37 @@ class SessionTest(unittest.TestCase):
 
         lib_mock.sp_session_release.assert_called_with(sp_session)
 
+    def test_releases_pending_objects_before_sp_session(self, lib_mock):
+        sp_session = spotify.ffi.NULL
+
+        def func(sp_session_config, sp_session_ptr):
+            sp_session_ptr[0] = sp_session
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_create.side_effect = func
+        config = spotify.Config()
+        config.application_key = b'\x01' * 321
+        tests.gc_collect()  # Release sessions from other tests
+        calls = []
+
+        def release_func(sp_obj):
+            calls.append('sp_track_release')
+
+        lib_mock.sp_session_release.side_effect = (
+            lambda sp_session: calls.append('sp_session_release'))
+
+        session = spotify.Session(config=config)
+        spotify.release.enable_deferred_release()
+        self.addCleanup(spotify.release.disable_deferred_release)
+        obj = spotify.release.gc(spotify.ffi.new('int *'), release_func)
+        obj = None  # noqa
+        tests.gc_collect()
+        session = None  # noqa
+        spotify.session_instance = None
+        tests.gc_collect()
+
+        self.assertEqual(calls, ['sp_track_release', 'sp_session_release'])
+
     def test_login_raises_error_if_no_password_and_no_blob(self, lib_mock):
         lib_mock.sp_session_login.return_value = spotify.ErrorType.OK
         session = create_session(lib_mock)
@@ -300,6 +341,412 @@ class SessionTest(unittest.TestCase):
         with self.assertRaises(spotify.Error):
             session.process_events()
 
+    @mock.patch('spotify.release.release_pending')
+    def test_process_events_releases_pending_objects(
+            self, release_pending_mock, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        # Finalize sessions of earlier tests, as releasing them also releases
+        # pending objects.
+        tests.gc_collect()
+        release_pending_mock.reset_mock()
+        session = create_session(lib_mock)
+
+        session.process_events()
+
+        release_pending_mock.assert_called_once_with()
+
+    def test_next_timeout_is_none_before_process_events(self, lib_mock):
+        session = create_session(lib_mock)
+
+        self.assertIsNone(session.next_timeout)
+
+    def test_next_timeout_is_from_last_process_events(self, lib_mock):
+        def func(sp_session, int_ptr):
+            int_ptr[0] = 5500
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_process_events.side_effect = func
+        session = create_session(lib_mock)
+
+        session.process_events()
+
+        self.assertEqual(session.next_timeout, 5500)
+
+    def create_wakeup_fd(self, session):
+        fd = session.fileno()
+        # The pipe is closed when the session is released.
+        self.addCleanup(tests.gc_collect)
+        return fd
+
+    def is_readable(self, fd):
+        return bool(select.select([fd], [], [], 0)[0])
+
+    def test_fileno_returns_same_fd_every_time(self, lib_mock):
+        session = create_session(lib_mock)
+
+        fd = self.create_wakeup_fd(session)
+
+        self.assertIsInstance(fd, int)
+        self.assertEqual(session.fileno(), fd)
+
+    def test_fileno_is_readable_when_created(self, lib_mock):
+        session = create_session(lib_mock)
+
+        fd = self.create_wakeup_fd(session)
+
+        self.assertTrue(self.is_readable(fd))
+
+    def test_process_events_empties_fileno(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        fd = self.create_wakeup_fd(session)
+
+        session.process_events()
+
+        self.assertFalse(self.is_readable(fd))
+
+    def test_notify_main_thread_makes_fileno_readable(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        fd = self.create_wakeup_fd(session)
+        session.process_events()
+
+        _SessionCallbacks.notify_main_thread(session._sp_session)
+
+        self.assertTrue(self.is_readable(fd))
+
+    def test_notify_main_thread_writes_once_per_process_events(
+            self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        fd = self.create_wakeup_fd(session)
+        session.process_events()
+
+        for _ in range(3):
+            _SessionCallbacks.notify_main_thread(session._sp_session)
+
+        self.assertEqual(len(os.read(fd, 512)), 1)
+
+    def test_notify_main_thread_without_fileno_does_nothing(self, lib_mock):
+        session = create_session(lib_mock)
+
+        _SessionCallbacks.notify_main_thread(session._sp_session)
+
+        self.assertIsNone(session._wakeup_fds)
+
+    def test_releasing_session_closes_fileno_pipe(self, lib_mock):
+        tests.gc_collect()  # Release sessions from other tests
+        session = create_session(lib_mock)
+        session.fileno()
+        read_fd, write_fd = session._wakeup_fds
+        spotify.session_instance = None
+
+        session = None  # noqa
+        tests.gc_collect()
+
+        for fd in (read_fd, write_fd):
+            with self.assertRaises(OSError):
+                os.fstat(fd)
+
+    def test_notify_loaders_increments_load_generation(self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+
+        session._notify_loaders()
+
+        self.assertEqual(session._load_generation, generation + 1)
+
+    def test_wait_for_load_returns_when_loaders_are_notified(self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+        timer = threading.Timer(0.01, session._notify_loaders)
+        timer.start()
+
+        session._wait_for_load(generation, 10)
+
+        self.assertEqual(session._load_generation, generation + 1)
+        timer.join()
+
+    def test_wait_for_load_does_not_wait_if_already_notified(self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+        session._notify_loaders()
+        session._load_condition = mock.MagicMock()
+
+        session._wait_for_load(generation, 10)
+
+        self.assertEqual(session._load_condition.wait.call_count, 0)
+
+    def create_loadable(self, is_loaded, error=spotify.ErrorType.OK):
+        obj = mock.Mock(spec=['is_loaded', 'error'])
+        type(obj).is_loaded = mock.PropertyMock(side_effect=is_loaded)
+        obj.error = error
+        return obj
+
+    def test_load_all_fails_if_not_logged_in(self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_OUT)
+
+        with self.assertRaises(RuntimeError):
+            session.load_all([])
+
+    def test_load_all(self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        loaded_at_once = self.create_loadable([True])
+        loaded_later = self.create_loadable([False, False, True])
+        failing = self.create_loadable(
+            [False], error=spotify.ErrorType.OTHER_PERMANENT)
+        playlist = mock.Mock(spec=['is_loaded'])
+        playlist.is_loaded = True
+
+        result = session.load_all(
+            [loaded_at_once, loaded_later, failing, playlist])
+
+        self.assertIsInstance(result, spotify.LoadResult)
+        self.assertEqual(
+            result.loaded, [loaded_at_once, playlist, loaded_later])
+        self.assertEqual(result.failed, [failing])
+        self.assertEqual(result.timed_out, [])
+        self.assertEqual(lib_mock.sp_session_process_events.call_count, 2)
+
+    def test_load_all_only_checks_unloaded_objects_again(self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        loaded = self.create_loadable([True])
+        loaded_later = self.create_loadable(
+            [False, False, False, True])
+        is_loaded_mock = vars(type(loaded))['is_loaded']
+        is_loaded_later_mock = vars(type(loaded_later))['is_loaded']
+
+        session.load_all([loaded, loaded_later])
+
+        self.assertEqual(is_loaded_mock.call_count, 1)
+        self.assertEqual(is_loaded_later_mock.call_count, 4)
+
+    def test_load_all_does_not_fail_on_is_loading_error(self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        obj = self.create_loadable(
+            [False, True], error=spotify.ErrorType.IS_LOADING)
+
+        result = session.load_all([obj])
+
+        self.assertEqual(result.loaded, [obj])
+        self.assertEqual(result.failed, [])
+
+    def test_load_all_reports_timed_out_objects(self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        loaded = self.create_loadable([True])
+        unloaded = self.create_loadable(itertools.repeat(False))
+
+        result = session.load_all([loaded, unloaded], timeout=0)
+
+        self.assertEqual(result.loaded, [loaded])
+        self.assertEqual(result.failed, [])
+        self.assertEqual(result.timed_out, [unloaded])
+
+    @mock.patch('spotify.Track.snapshot_many')
+    def test_load_all_adds_loaded_tracks_to_metadata_store(
+            self, snapshot_many_mock, lib_mock):
+        session = create_session(lib_mock)
+        session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        track = mock.Mock(spec=spotify.Track)
+        track.error = spotify.ErrorType.OK
+        type(track).is_loaded = mock.PropertyMock(side_effect=[False, True])
+        failed_track = mock.Mock(spec=spotify.Track)
+        failed_track.error = spotify.ErrorType.OTHER_PERMANENT
+
+        session.load_all([track, failed_track, self.create_loadable([True])])
+
+        snapshot_many_mock.assert_called_once_with([track])
+
+    @mock.patch('spotify.Track.snapshot_many')
+    def test_load_all_does_not_store_tracks_that_were_loaded_already(
+            self, snapshot_many_mock, lib_mock):
+        session = create_session(lib_mock)
+        session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        track = mock.Mock(spec=spotify.Track)
+        track.error = spotify.ErrorType.OK
+        track.is_loaded = True
+
+        session.load_all([track])
+
+        self.assertEqual(snapshot_many_mock.call_count, 0)
+
+    @mock.patch('spotify.Track.snapshot_many')
+    def test_load_all_without_metadata_store_does_not_snapshot_tracks(
+            self, snapshot_many_mock, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        track = mock.Mock(spec=spotify.Track)
+        track.error = spotify.ErrorType.OK
+        track.is_loaded = True
+
+        session.load_all([track])
+
+        self.assertEqual(snapshot_many_mock.call_count, 0)
+
+    def test_load_all_registers_playlist_callbacks_while_loading(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        lib_mock.sp_session_connectionstate.return_value = int(
+            spotify.ConnectionState.LOGGED_IN)
+        lib_mock.sp_session_process_events.return_value = int(
+            spotify.ErrorType.OK)
+        playlist = mock.Mock(spec=spotify.Playlist)
+        playlist.error = spotify.ErrorType.OK
+        playlist.is_loaded = True
+
+        session.load_all([playlist, self.create_loadable([True])])
+
+        playlist._begin_loading.assert_called_once_with()
+        playlist._end_loading.assert_called_once_with()
+
+    def test_add_load_future_completes_future_at_once_if_loaded(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        obj = self.create_loadable([True])
+        future = futures.Future()
+
+        session._add_load_future(obj, future, 10)
+
+        self.assertIs(future.result(0), obj)
+        self.assertEqual(session._load_futures, [])
+
+    def test_next_load_deadline_is_earliest_load_future_deadline(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        self.assertIsNone(session.next_load_deadline)
+
+        with mock.patch('spotify.session.time') as time_mock:
+            time_mock.time.return_value = 100.0
+            session._add_load_future(
+                self.create_loadable(itertools.repeat(False)),
+                futures.Future(), 10)
+            session._add_load_future(
+                self.create_loadable(itertools.repeat(False)),
+                futures.Future(), 5)
+
+        self.assertEqual(session.next_load_deadline, 105.0)
+
+    def test_process_events_completes_load_futures(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        obj = self.create_loadable([False, True])
+        future = futures.Future()
+        session._add_load_future(obj, future, 10)
+        self.assertFalse(future.done())
+
+        session._notify_loaders()
+        session.process_events()
+
+        self.assertIs(future.result(0), obj)
+        self.assertEqual(session._load_futures, [])
+
+    def test_process_events_does_not_check_objects_if_not_notified(
+            self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        obj = self.create_loadable([False])
+        future = futures.Future()
+        session._add_load_future(obj, future, 10)
+
+        session.process_events()
+
+        self.assertFalse(future.done())
+        self.assertEqual(len(session._load_futures), 1)
+
+    def test_load_future_fails_if_object_fails_to_load(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        obj = self.create_loadable([False])
+        future = futures.Future()
+        session._add_load_future(obj, future, 10)
+        obj.error = spotify.ErrorType.OTHER_PERMANENT
+
+        session._notify_loaders()
+        session.process_events()
+
+        error = future.exception(0)
+        self.assertIsInstance(error, spotify.LibError)
+        self.assertEqual(
+            error.error_type, spotify.ErrorType.OTHER_PERMANENT)
+
+    def test_load_future_fails_if_checking_object_raises(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        broken = self.create_loadable([False, ValueError('foo')])
+        obj = self.create_loadable([False, True])
+        broken_future = futures.Future()
+        future = futures.Future()
+        session._add_load_future(broken, broken_future, 10)
+        session._add_load_future(obj, future, 10)
+
+        session._notify_loaders()
+        session.process_events()
+
+        self.assertIsInstance(broken_future.exception(0), ValueError)
+        self.assertIs(future.result(0), obj)
+        self.assertEqual(session._load_futures, [])
+
+    def test_load_future_fails_if_timeout_is_reached(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        obj = self.create_loadable(itertools.repeat(False))
+        future = futures.Future()
+        session._add_load_future(obj, future, 0)
+
+        session.process_events()
+
+        self.assertIsInstance(future.exception(0), spotify.Timeout)
+        self.assertEqual(session._load_futures, [])
+
+    def test_cancelled_load_future_is_dropped(self, lib_mock):
+        lib_mock.sp_session_process_events.return_value = (
+            spotify.ErrorType.OK)
+        session = create_session(lib_mock)
+        obj = self.create_loadable([False, True])
+        future = futures.Future()
+        session._add_load_future(obj, future, 10)
+        future.cancel()
+
+        session._notify_loaders()
+        session.process_events()
+
+        self.assertTrue(future.cancelled())
+        self.assertEqual(session._load_futures, [])
+
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
     def test_playlist_container(self, playlist_lib_mock, lib_mock):
         lib_mock.sp_session_playlistcontainer.return_value = spotify.ffi.new(
@@ -646,6 +1093,59 @@ class SessionTest(unittest.TestCase):
             playlist_offset=0, playlist_count=20,
             search_type=None)
 
+    @mock.patch('spotify.Search')
+    def test_search_async(self, search_mock, lib_mock):
+        session = create_session(lib_mock)
+        search_instance_mock = search_mock.return_value
+        search_instance_mock.load_async.return_value = mock.sentinel.future
+
+        result = session.search_async('alice', track_count=7, timeout=5)
+
+        self.assertIs(result, mock.sentinel.future)
+        search_mock.assert_called_with(
+            session, query='alice', callback=None,
+            track_offset=0, track_count=7,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None)
+        search_instance_mock.load_async.assert_called_with(timeout=5)
+
+
+class CheckLoadedTest(unittest.TestCase):
+
+    def test_is_false_while_loading(self):
+        obj = mock.Mock(spec=['is_loaded', 'error'])
+        obj.is_loaded = False
+        obj.error = spotify.ErrorType.IS_LOADING
+
+        self.assertFalse(session_module._check_loaded(obj))
+
+    def test_is_true_when_loaded(self):
+        obj = mock.Mock(spec=['is_loaded'])
+        obj.is_loaded = True
+
+        self.assertTrue(session_module._check_loaded(obj))
+
+    def test_raises_lib_error_if_failed(self):
+        obj = mock.Mock(spec=['is_loaded', 'error'])
+        obj.is_loaded = True
+        obj.error = spotify.ErrorType.OTHER_PERMANENT
+
+        with self.assertRaises(spotify.LibError) as ctx:
+            session_module._check_loaded(obj)
+
+        self.assertEqual(
+            ctx.exception.error_type, spotify.ErrorType.OTHER_PERMANENT)
+
+
+class LoadResultTest(unittest.TestCase):
+
+    def test_has_no_instance_dict(self):
+        result = spotify.LoadResult(loaded=[], failed=[], timed_out=[])
+
+        self.assertFalse(hasattr(result, '__dict__'))
+
 
 @mock.patch('spotify.session.lib', spec=spotify.lib)
 class OfflineTest(unittest.TestCase):
@@ -1045,6 +1545,23 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_metadata_updated_callback_increments_metadata_generation(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._metadata_generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._metadata_generation, generation + 1)
+
+    def test_metadata_updated_callback_notifies_loaders(self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._load_generation, generation + 1)
+
     def test_connection_error_callback(self, lib_mock):
         callback = mock.Mock()
         session = create_session(lib_mock)
@@ -1074,6 +1591,14 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_notify_main_thread_callback_notifies_loaders(self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+
+        _SessionCallbacks.notify_main_thread(session._sp_session)
+
+        self.assertEqual(session._load_generation, generation + 1)
+
     def test_music_delivery_callback(self, lib_mock):
         sp_audioformat = spotify.ffi.new('sp_audioformat *')
         sp_audioformat.channels = 2
@@ -1161,6 +1686,15 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_user_info_updated_callback_increments_metadata_generation(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._metadata_generation
+
+        _SessionCallbacks.user_info_updated(session._sp_session)
+
+        self.assertEqual(session._metadata_generation, generation + 1)
+
     def test_start_playback_callback(self, lib_mock):
         callback = mock.Mock()
         session = create_session(lib_mock)
@@ -0,0 +1,259 @@
+from __future__ import unicode_literals
+
+import gc
+import threading
+import time
+import unittest
+
+import spotify
+from spotify import stats
+from tests import mock
+
+
+class HistogramTest(unittest.TestCase):
+
+    def test_is_empty_when_created(self):
+        histogram = stats.Histogram()
+
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertEqual(histogram.max, 0.0)
+        self.assertEqual(histogram.percentile(50), 0.0)
+
+    def test_add_updates_count_mean_and_max(self):
+        histogram = stats.Histogram()
+
+        histogram.add(0.001)
+        histogram.add(0.003)
+
+        self.assertEqual(histogram.count, 2)
+        self.assertAlmostEqual(histogram.mean, 0.002)
+        self.assertEqual(histogram.max, 0.003)
+
+    def test_add_puts_value_in_bucket_by_upper_bound(self):
+        histogram = stats.Histogram()
+
+        histogram.add(0.0000005)
+        histogram.add(0.0000015)
+        histogram.add(10)
+
+        self.assertEqual(histogram.buckets[0], 1)
+        self.assertEqual(histogram.buckets[1], 1)
+        self.assertEqual(histogram.buckets[-1], 1)
+        self.assertEqual(sum(histogram.buckets), 3)
+
+    def test_percentile_returns_bucket_upper_bound(self):
+        histogram = stats.Histogram()
+
+        for _ in range(99):
+            histogram.add(0.0000015)
+        histogram.add(0.5)
+
+        self.assertEqual(histogram.percentile(50), 0.000002)
+        self.assertEqual(histogram.percentile(100), 0.5)
+
+
+class EventLoopStatsTest(unittest.TestCase):
+
+    def test_is_empty_when_created(self):
+        event_loop_stats = stats.EventLoopStats()
+
+        self.assertEqual(event_loop_stats.iterations, 0)
+        self.assertEqual(event_loop_stats.notification_wakeups, 0)
+        self.assertEqual(event_loop_stats.timeout_wakeups, 0)
+        self.assertEqual(event_loop_stats.process_events.count, 0)
+        self.assertEqual(event_loop_stats.notify_delay.count, 0)
+        self.assertEqual(event_loop_stats.listeners, 0)
+        self.assertEqual(event_loop_stats.mean_listeners, 0.0)
+        self.assertIsNone(event_loop_stats.processing_since)
+
+    def test_mean_listeners(self):
+        event_loop_stats = stats.EventLoopStats()
+        event_loop_stats.iterations = 4
+        event_loop_stats.listeners = 6
+
+        self.assertEqual(event_loop_stats.mean_listeners, 1.5)
+
+    def test_repr(self):
+        self.assertIn('iterations=0', repr(stats.EventLoopStats()))
+
+
+class LockStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        cffi_lib = mock.Mock(spec=['sp_track_name', 'sp_session_login'])
+        cffi_lib.sp_track_name.return_value = mock.sentinel.name
+        cffi_lib.sp_session_login.return_value = 0
+        self.lib = spotify._serialize_access_to_library(cffi_lib)
+        self.serialized_login = self.lib.sp_session_login
+
+        patcher = mock.patch.object(spotify, 'lib', self.lib)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        stats.disable_lock_stats()
+        stats.reset_lock_stats()
+        spotify.set_fine_grained_locking(False)
+
+    def test_records_nothing_by_default(self):
+        self.lib.sp_session_login()
+
+        self.assertNotIn('sp_session_login', stats.lock_report())
+
+    def test_disable_stops_recording(self):
+        stats.enable_lock_stats()
+        stats.disable_lock_stats()
+
+        self.lib.sp_session_login()
+
+        self.assertNotIn('sp_session_login', stats.lock_report())
+
+    def test_enable_twice_records_calls_once(self):
+        stats.enable_lock_stats()
+        stats.enable_lock_stats()
+
+        self.lib.sp_session_login()
+
+        self.assertEqual(stats.lock_report()['sp_session_login'].calls, 1)
+
+    def test_records_calls_wait_and_hold_time(self):
+        stats.enable_lock_stats()
+
+        result = self.lib.sp_track_name(mock.sentinel.sp_track)
+
+        self.assertEqual(result, mock.sentinel.name)
+        report = stats.lock_report()
+        self.assertEqual(report['sp_track_name'].calls, 1)
+        self.assertEqual(report['sp_track_name'].unlocked_calls, 0)
+        self.assertEqual(report['sp_track_name'].wait.count, 1)
+        self.assertEqual(report['sp_track_name'].hold.count, 1)
+        self.assertNotIn('sp_session_login', report)
+
+    def test_only_counts_unlocked_calls_with_fine_grained_locking(self):
+        spotify.set_fine_grained_locking(True)
+        stats.enable_lock_stats()
+
+        self.lib.sp_track_name(mock.sentinel.sp_track)
+
+        report = stats.lock_report()
+        self.assertEqual(report['sp_track_name'].calls, 0)
+        self.assertEqual(report['sp_track_name'].unlocked_calls, 1)
+        self.assertEqual(report['sp_track_name'].hold.count, 0)
+
+    def test_report_is_a_snapshot(self):
+        stats.enable_lock_stats()
+        self.lib.sp_session_login()
+
+        report = stats.lock_report()
+        self.lib.sp_session_login()
+
+        self.assertEqual(report['sp_session_login'].calls, 1)
+
+    def test_reset_forgets_recorded_stats(self):
+        stats.enable_lock_stats()
+        self.lib.sp_session_login()
+
+        stats.reset_lock_stats()
+
+        self.assertEqual(stats.lock_report(), {})
+
+        self.lib.sp_session_login()
+
+        self.assertEqual(stats.lock_report()['sp_session_login'].calls, 1)
+
+    def test_records_serialized_methods_by_qualified_name(self):
+        stats.enable_lock_stats()
+
+        spotify.serialized(serialized_function)()
+
+        name = spotify._qualified_name(serialized_function)
+        self.assertEqual(name, 'tests.test_stats.serialized_function')
+        self.assertEqual(stats.lock_report()[name].calls, 1)
+
+    def test_records_serialized_accessors_as_unlocked_calls(self):
+        spotify.set_fine_grained_locking(True)
+        stats.enable_lock_stats()
+
+        spotify.serialized_accessor(serialized_function)()
+
+        name = spotify._qualified_name(serialized_function)
+        report = stats.lock_report()
+        self.assertEqual(report[name].calls, 0)
+        self.assertEqual(report[name].unlocked_calls, 1)
+
+    def test_records_wait_time_of_contending_threads(self):
+        stats.enable_lock_stats()
+        locked = threading.Event()
+
+        @spotify.serialized
+        def hold_lock():
+            locked.set()
+            time.sleep(0.05)
+
+        @spotify.serialized
+        def wait_for_lock():
+            self.lib.sp_session_login()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        locked.wait()
+        wait_for_lock()
+        thread.join()
+
+        report = stats.lock_report()
+        hold = report[spotify._qualified_name(hold_lock)]
+        self.assertGreater(hold.hold.max, 0.04)
+        wait = report[spotify._qualified_name(wait_for_lock)]
+        self.assertEqual(wait.calls, 1)
+        self.assertGreater(wait.wait.max, 0.02)
+        # The lock is already held when the libspotify function is called.
+        self.assertLess(report['sp_session_login'].wait.max, 0.02)
+
+    def test_finalizer_calling_serialized_function_during_report(self):
+        spotify.set_fine_grained_locking(True)
+        stats.enable_lock_stats()
+        for _ in range(100):
+            self.lib.sp_session_login()
+        finalized = []
+
+        class Cycle(object):
+            def __init__(self):
+                self.cycle = self
+
+            def __del__(self):
+                finalized.append(True)
+
+                # Record under a new name, and as an unlocked call.
+                def function():
+                    pass
+                function.__name__ = function.__qualname__ = str(
+                    'finalizer_%d' % len(finalized))
+                spotify.serialized(function)()
+                spotify.serialized_accessor(serialized_function)()
+                if len(finalized) < 200:
+                    # Leave garbage for the next collection.
+                    Cycle()
+
+        def report():
+            threshold = gc.get_threshold()
+            # Collect garbage at almost every allocation.
+            gc.set_threshold(1)
+            try:
+                Cycle()
+                while len(finalized) < 200:
+                    stats.lock_report()
+            finally:
+                gc.set_threshold(*threshold)
+
+        thread = threading.Thread(target=report)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(finalized), 200)
+
+
+def serialized_function():
+    pass
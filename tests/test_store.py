@@ -0,0 +1,169 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+def create_snapshot(uri='spotify:track:foo', is_loaded=True):
+    track = mock.Mock()
+    track.link.uri = uri
+    if not is_loaded:
+        return spotify.TrackSnapshot(
+            track=track, is_loaded=False, name=None, duration=None,
+            popularity=None, disc=None, index=None, availability=None,
+            starred=None, artists=(), album=None)
+    artist1 = mock.Mock()
+    artist1.link.uri = 'spotify:artist:abc'
+    artist2 = mock.Mock()
+    artist2.link.uri = 'spotify:artist:def'
+    album = mock.Mock()
+    album.link.uri = 'spotify:album:ghi'
+    return spotify.TrackSnapshot(
+        track=track, is_loaded=True, name='Foo Bar', duration=210000,
+        popularity=50, disc=1, index=3,
+        availability=spotify.TrackAvailability.AVAILABLE, starred=False,
+        artists=(artist1, artist2), album=album)
+
+
+class MetadataStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = spotify.MetadataStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_is_empty_initially(self):
+        self.assertEqual(len(self.store), 0)
+        self.assertIsNone(self.store.get('spotify:track:foo'))
+        self.assertNotIn('spotify:track:foo', self.store)
+
+    def test_put_and_get(self):
+        result = self.store.put(create_snapshot())
+
+        self.assertEqual(len(self.store), 1)
+        self.assertIn('spotify:track:foo', self.store)
+        record = self.store.get('spotify:track:foo')
+        self.assertEqual(record, result)
+        self.assertIsInstance(record, spotify.TrackMetadata)
+        self.assertEqual(record.uri, 'spotify:track:foo')
+        self.assertEqual(record.name, 'Foo Bar')
+        self.assertEqual(record.duration, 210000)
+        self.assertEqual(record.popularity, 50)
+        self.assertEqual(record.disc, 1)
+        self.assertEqual(record.index, 3)
+        self.assertIs(record.availability, spotify.TrackAvailability.AVAILABLE)
+        self.assertIs(record.starred, False)
+        self.assertEqual(
+            record.artist_uris, ('spotify:artist:abc', 'spotify:artist:def'))
+        self.assertEqual(record.album_uri, 'spotify:album:ghi')
+
+    def test_put_replaces_existing_record(self):
+        self.store.put(create_snapshot())
+        self.store.put(create_snapshot()._replace(name='Baz'))
+
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.get('spotify:track:foo').name, 'Baz')
+
+    def test_put_ignores_unloaded_tracks(self):
+        result = self.store.put(create_snapshot(is_loaded=False))
+
+        self.assertIsNone(result)
+        self.assertEqual(len(self.store), 0)
+
+    def test_put_many(self):
+        result = self.store.put_many([
+            create_snapshot('spotify:track:foo'),
+            create_snapshot('spotify:track:bar', is_loaded=False),
+            create_snapshot('spotify:track:baz'),
+        ])
+
+        self.assertEqual(len(result), 3)
+        self.assertIsNone(result[1])
+        self.assertEqual(len(self.store), 2)
+        self.assertIn('spotify:track:foo', self.store)
+        self.assertIn('spotify:track:baz', self.store)
+
+    def test_repr(self):
+        self.store.put(create_snapshot())
+
+        self.assertEqual(repr(self.store), 'MetadataStore(<1 tracks>)')
+
+    def test_lookup_returns_stored_record_without_loading(self):
+        session = tests.create_session()
+        self.store.put(create_snapshot())
+
+        result = self.store.lookup(session, 'spotify:track:foo')
+
+        self.assertEqual(result.name, 'Foo Bar')
+        self.assertEqual(session.get_track.call_count, 0)
+
+    def test_lookup_loads_and_stores_missing_track(self):
+        session = tests.create_session()
+        track = session.get_track.return_value.load.return_value
+        track._snapshot.return_value = create_snapshot()
+
+        result = self.store.lookup(session, 'spotify:track:foo', timeout=5)
+
+        session.get_track.assert_called_once_with('spotify:track:foo')
+        session.get_track.return_value.load.assert_called_once_with(
+            timeout=5)
+        self.assertEqual(result.name, 'Foo Bar')
+        self.assertIn('spotify:track:foo', self.store)
+
+    def test_lookup_does_not_store_track_stored_by_loading_it(self):
+        session = tests.create_session()
+        session.metadata_store = self.store
+        store_put = self.store.put
+
+        def load(timeout=None):
+            store_put(create_snapshot())
+            return track
+
+        track = session.get_track.return_value
+        track.load.side_effect = load
+
+        with mock.patch.object(self.store, 'put') as put_mock:
+            result = self.store.lookup(session, 'spotify:track:foo')
+
+        self.assertEqual(result.name, 'Foo Bar')
+        self.assertEqual(put_mock.call_count, 0)
+
+    def test_lookup_stores_track_loaded_before_for_session_store(self):
+        session = tests.create_session()
+        session.metadata_store = self.store
+        track = session.get_track.return_value.load.return_value
+        track._snapshot.return_value = create_snapshot()
+
+        result = self.store.lookup(session, 'spotify:track:foo')
+
+        self.assertEqual(result.name, 'Foo Bar')
+        self.assertIn('spotify:track:foo', self.store)
+
+
+class PersistentMetadataStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'metadata.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_records_survive_reopening(self):
+        store = spotify.MetadataStore(self.path)
+        store.put(create_snapshot())
+        store.close()
+
+        store = spotify.MetadataStore(self.path)
+        record = store.get('spotify:track:foo')
+        store.close()
+
+        self.assertEqual(record.name, 'Foo Bar')
+        self.assertEqual(record.album_uri, 'spotify:album:ghi')
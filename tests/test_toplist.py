@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -131,6 +132,15 @@ class ToplistTest(unittest.TestCase):
 
         lib_mock.sp_toplistbrowse_release.assert_called_with(sp_toplistbrowse)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_toplistbrowse = spotify.ffi.new('int *')
+        toplist = spotify.Toplist(
+            self.session, sp_toplistbrowse=sp_toplistbrowse)
+
+        self.assertFalse(hasattr(toplist, '__dict__'))
+        self.assertIs(weakref.ref(toplist)(), toplist)
+
     def test_repr(self, lib_mock):
         sp_toplistbrowse = spotify.ffi.new('int *')
         lib_mock.sp_toplistbrowse_create.return_value = sp_toplistbrowse
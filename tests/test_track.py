@@ -1,6 +1,12 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
+
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
 
 import spotify
 import tests
@@ -66,6 +72,64 @@ class TrackTest(unittest.TestCase):
 
         lib_mock.sp_track_release.assert_called_with(sp_track)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertFalse(hasattr(track, '__dict__'))
+        self.assertIs(weakref.ref(track)(), track)
+
+    def test_eq_if_same_sp_track(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track1 = spotify.Track(self.session, sp_track=sp_track)
+        track2 = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertIsNot(track1, track2)
+        self.assertTrue(track1 == track2)
+        self.assertFalse(track1 != track2)
+        self.assertEqual(hash(track1), hash(track2))
+        self.assertEqual(len(set([track1, track2])), 1)
+
+    def test_not_eq_if_different_sp_track(self, lib_mock):
+        track1 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+        track2 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+
+        self.assertFalse(track1 == track2)
+        self.assertTrue(track1 != track2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertFalse(track == sp_track)
+        self.assertTrue(track != 'foo')
+
+    def test_cached_track(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+
+        result1 = spotify.Track._cached(self.session, sp_track)
+        result2 = spotify.Track._cached(self.session, sp_track)
+
+        self.assertIsInstance(result1, spotify.Track)
+        self.assertIs(result1, result2)
+        lib_mock.sp_track_add_ref.assert_called_once_with(sp_track)
+
+    def test_cached_track_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+
+        result1 = spotify.Track._cached(
+            self.session, sp_track, add_ref=False)
+        result2 = spotify.Track._cached(
+            self.session, sp_track, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_track_add_ref.call_count, 0)
+        lib_mock.sp_track_release.assert_called_once_with(sp_track)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -103,9 +167,97 @@ class TrackTest(unittest.TestCase):
         sp_track = spotify.ffi.new('int *')
         track = spotify.Track(self.session, sp_track=sp_track)
 
-        track.load(10)
+        result = track.load(10)
 
         load_mock.assert_called_with(self.session, track, timeout=10)
+        self.assertIs(result, track)
+
+    @mock.patch('spotify.utils.load')
+    def test_load_adds_track_to_metadata_store(self, load_mock, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        track.load(10)
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 1)
+        snapshot = self.session.metadata_store.put.call_args[0][0]
+        self.assertIs(snapshot.track, track)
+
+    @mock.patch('spotify.utils.load')
+    def test_load_does_not_store_already_loaded_track(
+            self, load_mock, lib_mock):
+        lib_mock.sp_track_is_loaded.return_value = 1
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        track.load(10)
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 0)
+
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        future = mock.Mock()
+        load_async_mock.return_value = future
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result = track.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, track, timeout=10)
+        self.assertIs(result, future)
+
+    @unittest.skipIf(futures is None, 'concurrent.futures not available')
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async_adds_loaded_track_to_metadata_store(
+            self, load_async_mock, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        load_async_mock.return_value = futures.Future()
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        future = track.load_async(10)
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 0)
+
+        future.set_result(track)
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 1)
+
+    @unittest.skipIf(futures is None, 'concurrent.futures not available')
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async_does_not_store_already_loaded_track(
+            self, load_async_mock, lib_mock):
+        lib_mock.sp_track_is_loaded.return_value = 1
+        load_async_mock.return_value = futures.Future()
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        future = track.load_async(10)
+        future.set_result(track)
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 0)
+
+    @unittest.skipIf(futures is None, 'concurrent.futures not available')
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async_does_not_store_failed_track(
+            self, load_async_mock, lib_mock):
+        lib_mock.sp_track_is_loaded.return_value = 0
+        load_async_mock.return_value = futures.Future()
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        future = track.load_async(10)
+        future.set_exception(spotify.Timeout(10))
+
+        self.assertEqual(self.session.metadata_store.put.call_count, 0)
 
     def test_offline_status(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
@@ -232,6 +384,20 @@ class TrackTest(unittest.TestCase):
         self.assertIsInstance(result, spotify.Track)
         self.assertEqual(result._sp_track, sp_track_playable)
 
+    def test_playable_reuses_cached_track(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        sp_track_playable = spotify.ffi.new('int *')
+        lib_mock.sp_track_get_playable.return_value = sp_track_playable
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        lib_mock.sp_track_add_ref.reset_mock()
+
+        result1 = track.playable
+        result2 = track.playable
+
+        self.assertIs(result1, result2)
+        lib_mock.sp_track_add_ref.assert_called_once_with(sp_track_playable)
+
     def test_playable_is_none_if_unloaded(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.IS_LOADING
         lib_mock.sp_track_is_loaded.return_value = 0
@@ -417,6 +583,49 @@ class TrackTest(unittest.TestCase):
         lib_mock.sp_track_name.assert_called_once_with(sp_track)
         self.assertIsNone(result)
 
+    def test_name_is_remembered_if_metadata_caching_is_enabled(
+            self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_name.return_value = spotify.ffi.new(
+            'char[]', b'Foo Bar Baz')
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        spotify.set_metadata_caching(True)
+        self.addCleanup(spotify.set_metadata_caching, False)
+
+        self.assertEqual(track.name, 'Foo Bar Baz')
+        self.assertEqual(track.name, 'Foo Bar Baz')
+
+        self.assertEqual(lib_mock.sp_track_name.call_count, 1)
+
+        self.session._metadata_generation += 1
+        self.assertEqual(track.name, 'Foo Bar Baz')
+
+        self.assertEqual(lib_mock.sp_track_name.call_count, 1)
+
+        lib_mock.sp_track_error.return_value = (
+            spotify.ErrorType.OTHER_PERMANENT)
+        self.session._metadata_generation += 1
+        with self.assertRaises(spotify.Error):
+            track.name
+
+        self.assertEqual(lib_mock.sp_track_name.call_count, 1)
+
+    def test_name_is_not_remembered_if_unloaded(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        lib_mock.sp_track_name.return_value = spotify.ffi.new('char[]', b'')
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        spotify.set_metadata_caching(True)
+        self.addCleanup(spotify.set_metadata_caching, False)
+
+        self.assertIsNone(track.name)
+        self.assertIsNone(track.name)
+
+        self.assertEqual(lib_mock.sp_track_name.call_count, 2)
+
     def test_name_fails_if_error(self, lib_mock):
         self.assert_fails_if_error(lib_mock, lambda t: t.name)
 
@@ -520,6 +729,138 @@ class TrackTest(unittest.TestCase):
     def test_index_fails_if_error(self, lib_mock):
         self.assert_fails_if_error(lib_mock, lambda t: t.index)
 
+    @mock.patch('spotify.album.lib', spec=spotify.lib)
+    @mock.patch('spotify.artist.lib', spec=spotify.lib)
+    def test_snapshot(self, artist_lib_mock, album_lib_mock, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_name.return_value = spotify.ffi.new(
+            'char[]', b'Get Lucky')
+        lib_mock.sp_track_duration.return_value = 369000
+        lib_mock.sp_track_popularity.return_value = 82
+        lib_mock.sp_track_disc.return_value = 1
+        lib_mock.sp_track_index.return_value = 8
+        lib_mock.sp_track_get_availability.return_value = int(
+            spotify.TrackAvailability.AVAILABLE)
+        lib_mock.sp_track_is_starred.return_value = 1
+        sp_artist = spotify.ffi.cast('sp_artist *', spotify.ffi.new('int *'))
+        lib_mock.sp_track_num_artists.return_value = 1
+        lib_mock.sp_track_artist.return_value = sp_artist
+        sp_album = spotify.ffi.new('int *')
+        lib_mock.sp_track_album.return_value = sp_album
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result = track.snapshot()
+
+        self.assertIsInstance(result, spotify.TrackSnapshot)
+        self.assertIs(result.track, track)
+        self.assertTrue(result.is_loaded)
+        self.assertEqual(result.name, 'Get Lucky')
+        self.assertEqual(result.duration, 369000)
+        self.assertEqual(result.popularity, 82)
+        self.assertEqual(result.disc, 1)
+        self.assertEqual(result.index, 8)
+        self.assertIs(result.availability, spotify.TrackAvailability.AVAILABLE)
+        self.assertIs(result.starred, True)
+        self.assertEqual(len(result.artists), 1)
+        self.assertIsInstance(result.artists, tuple)
+        self.assertEqual(result.artists[0]._sp_artist, sp_artist)
+        self.assertIsInstance(result.album, spotify.Album)
+        self.assertEqual(result.album._sp_album, sp_album)
+        self.assertEqual(lib_mock.sp_track_error.call_count, 1)
+        self.assertEqual(lib_mock.sp_track_is_loaded.call_count, 1)
+
+    def test_snapshot_is_immutable(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result = track.snapshot()
+
+        self.assertFalse(hasattr(result, '__dict__'))
+        with self.assertRaises(AttributeError):
+            result.name = 'foo'
+
+    def test_snapshot_if_unloaded(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.IS_LOADING
+        lib_mock.sp_track_is_loaded.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result = track.snapshot()
+
+        self.assertIs(result.track, track)
+        self.assertFalse(result.is_loaded)
+        self.assertIsNone(result.name)
+        self.assertIsNone(result.duration)
+        self.assertIsNone(result.availability)
+        self.assertEqual(result.artists, ())
+        self.assertIsNone(result.album)
+        self.assertEqual(lib_mock.sp_track_name.call_count, 0)
+
+    def test_snapshot_fails_if_error(self, lib_mock):
+        self.assert_fails_if_error(lib_mock, lambda t: t.snapshot())
+
+    def test_snapshot_is_added_to_metadata_store(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        result = track.snapshot()
+
+        self.session.metadata_store.put.assert_called_once_with(result)
+
+    def test_snapshot_many_adds_snapshots_to_metadata_store(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        track1 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+        track2 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        result = spotify.Track.snapshot_many([track1, track2])
+
+        self.session.metadata_store.put_many.assert_called_once_with(result)
+
+    def test_snapshot_many(self, lib_mock):
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 0
+        track1 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+        track2 = spotify.Track(
+            self.session, sp_track=spotify.ffi.new('int *'))
+
+        result = spotify.Track.snapshot_many([track1, track2])
+
+        self.assertEqual(len(result), 2)
+        self.assertIs(result[0].track, track1)
+        self.assertIs(result[1].track, track2)
+
+    def test_snapshot_many_has_none_in_place_of_failed_tracks(
+            self, lib_mock):
+        lib_mock.sp_track_error.side_effect = [
+            spotify.ErrorType.OK, spotify.ErrorType.OTHER_PERMANENT,
+            spotify.ErrorType.OK]
+        lib_mock.sp_track_is_loaded.return_value = 0
+        tracks = [
+            spotify.Track(self.session, sp_track=spotify.ffi.new('int *'))
+            for _ in range(3)]
+        self.session.metadata_store = mock.Mock(spec=spotify.MetadataStore)
+
+        result = spotify.Track.snapshot_many(tracks)
+
+        self.assertEqual(len(result), 3)
+        self.assertIs(result[0].track, tracks[0])
+        self.assertIsNone(result[1])
+        self.assertIs(result[2].track, tracks[2])
+        self.session.metadata_store.put_many.assert_called_once_with(
+            [result[0], result[2]])
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_track(self, link_mock, lib_mock):
         sp_track = spotify.ffi.new('int *')
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -57,6 +58,64 @@ class UserTest(unittest.TestCase):
 
         lib_mock.sp_user_release.assert_called_with(sp_user)
 
+    def test_has_no_instance_dict_but_can_be_weakly_referenced(
+            self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+        user = spotify.User(self.session, sp_user=sp_user)
+
+        self.assertFalse(hasattr(user, '__dict__'))
+        self.assertIs(weakref.ref(user)(), user)
+
+    def test_eq_if_same_sp_user(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+        user1 = spotify.User(self.session, sp_user=sp_user)
+        user2 = spotify.User(self.session, sp_user=sp_user)
+
+        self.assertIsNot(user1, user2)
+        self.assertTrue(user1 == user2)
+        self.assertFalse(user1 != user2)
+        self.assertEqual(hash(user1), hash(user2))
+        self.assertEqual(len(set([user1, user2])), 1)
+
+    def test_not_eq_if_different_sp_user(self, lib_mock):
+        user1 = spotify.User(
+            self.session, sp_user=spotify.ffi.new('int *'))
+        user2 = spotify.User(
+            self.session, sp_user=spotify.ffi.new('int *'))
+
+        self.assertFalse(user1 == user2)
+        self.assertTrue(user1 != user2)
+
+    def test_not_eq_to_other_types(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+        user = spotify.User(self.session, sp_user=sp_user)
+
+        self.assertFalse(user == sp_user)
+        self.assertTrue(user != 'foo')
+
+    def test_cached_user(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+
+        result1 = spotify.User._cached(self.session, sp_user)
+        result2 = spotify.User._cached(self.session, sp_user)
+
+        self.assertIsInstance(result1, spotify.User)
+        self.assertIs(result1, result2)
+        lib_mock.sp_user_add_ref.assert_called_once_with(sp_user)
+
+    def test_cached_user_releases_extra_ref_if_already_cached(
+            self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+
+        result1 = spotify.User._cached(
+            self.session, sp_user, add_ref=False)
+        result2 = spotify.User._cached(
+            self.session, sp_user, add_ref=False)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(lib_mock.sp_user_add_ref.call_count, 0)
+        lib_mock.sp_user_release.assert_called_once_with(sp_user)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -2,6 +2,7 @@
 
 from __future__ import unicode_literals
 
+import threading
 import unittest
 
 import spotify
@@ -30,6 +31,40 @@ class EventEmitterTest(unittest.TestCase):
 
         listener_mock.assert_called_with('abc', 1, 2, 3)
 
+    def test_listeners_with_and_without_user_args(self):
+        listener_mock1 = mock.Mock()
+        listener_mock2 = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.on('some_event', listener_mock1)
+        emitter.on('some_event', listener_mock2, 1)
+        emitter.emit('some_event', 'abc')
+
+        listener_mock1.assert_called_with('abc')
+        listener_mock2.assert_called_with('abc', 1)
+
+    def test_emit_counts_listeners_called(self):
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', mock.Mock())
+        emitter.on('some_event', mock.Mock())
+        before = utils.listeners_called()
+
+        emitter.emit('some_event')
+        emitter.emit('other_event')
+
+        self.assertEqual(utils.listeners_called() - before, 2)
+
+    def test_emit_does_not_count_listeners_called_in_other_threads(self):
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', mock.Mock())
+        before = utils.listeners_called()
+
+        thread = threading.Thread(target=emitter.emit, args=('some_event',))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(utils.listeners_called(), before)
+
     def test_multiple_listeners_for_same_event(self):
         listener_mock1 = mock.Mock()
         listener_mock2 = mock.Mock()
@@ -96,6 +131,76 @@ class EventEmitterTest(unittest.TestCase):
         self.assertEqual(listener_mock1.call_count, 1)
         self.assertEqual(listener_mock2.call_count, 2)
 
+    def test_listener_added_during_emit_is_not_called_until_next_emit(self):
+        emitter = utils.EventEmitter()
+        listener_mock = mock.Mock()
+        emitter.on(
+            'some_event', lambda: emitter.on('some_event', listener_mock))
+
+        emitter.emit('some_event')
+
+        self.assertEqual(listener_mock.call_count, 0)
+        self.assertEqual(emitter.num_listeners('some_event'), 2)
+
+    def test_listener_removed_during_emit_is_still_called(self):
+        emitter = utils.EventEmitter()
+        listener_mock = mock.Mock()
+        emitter.on('some_event', lambda: emitter.off('some_event'))
+        emitter.on('some_event', listener_mock)
+
+        emitter.emit('some_event')
+
+        listener_mock.assert_called_once_with()
+        self.assertEqual(emitter.num_listeners('some_event'), 0)
+
+    def test_listener_storage_is_allocated_by_first_listener(self):
+        emitter = utils.EventEmitter()
+        self.assertIsNone(emitter._listeners)
+
+        emitter.on('some_event', mock.Mock())
+
+        self.assertIsNotNone(emitter._listeners)
+
+    def test_removing_last_listener_frees_listener_storage(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', listener_mock)
+        emitter.on('other_event', listener_mock)
+
+        emitter.off('some_event', listener_mock)
+
+        self.assertNotIn('some_event', emitter._listeners)
+
+        emitter.off('other_event', listener_mock)
+
+        self.assertIsNone(emitter._listeners)
+
+    def test_off_without_listeners_does_nothing(self):
+        emitter = utils.EventEmitter()
+
+        emitter.off()
+        emitter.off('some_event', mock.Mock())
+
+        self.assertIsNone(emitter._listeners)
+        self.assertEqual(emitter.num_listeners(), 0)
+
+    @mock.patch('spotify.utils._dispatcher')
+    def test_emit_without_listeners_is_not_dispatched(self, dispatcher_mock):
+        emitter = utils.EventEmitter()
+
+        emitter.emit('some_event')
+
+        self.assertEqual(dispatcher_mock.call_count, 0)
+
+    @mock.patch('spotify.utils._dispatcher')
+    def test_emit_with_listeners_is_dispatched(self, dispatcher_mock):
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', mock.Mock())
+
+        emitter.emit('some_event', 1, 2)
+
+        dispatcher_mock.assert_called_once_with(emitter, 'some_event', (1, 2))
+
     def test_num_listeners_returns_total_number_of_listeners(self):
         listener_mock1 = mock.Mock()
         listener_mock2 = mock.Mock()
@@ -151,6 +256,16 @@ class EventEmitterTest(unittest.TestCase):
         listener_mock.assert_called_with('abc', 1, 2, 3)
         self.assertEqual(result, listener_mock.return_value)
 
+    def test_call_without_user_args(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.on('some_event', listener_mock)
+        result = emitter.call('some_event', 'abc')
+
+        listener_mock.assert_called_with('abc')
+        self.assertEqual(result, listener_mock.return_value)
+
 
 class IntEnumTest(unittest.TestCase):
 
@@ -177,6 +292,309 @@ class IntEnumTest(unittest.TestCase):
         self.assertIsNot(self.Foo(2), self.Foo.bar)
         self.assertIsNot(self.Foo(1), self.Foo.baz)
 
+    def test_known_values_are_in_lookup_table(self):
+        self.assertIs(self.Foo._table[1], self.Foo.bar)
+        self.assertIs(self.Foo._table[2], self.Foo.baz)
+
+    def test_unknown_value_in_table_gap_is_identical(self):
+        self.assertIs(self.Foo(0), self.Foo(0))
+        self.assertEqual(self.Foo(0), 0)
+        self.assertEqual(repr(self.Foo(0)), '<Unknown Foo: 0>')
+
+    def test_unknown_value_after_table_is_identical(self):
+        self.assertIs(self.Foo(5), self.Foo(5))
+        self.assertEqual(repr(self.Foo(5)), '<Unknown Foo: 5>')
+
+    def test_looking_up_unknown_values_does_not_change_table(self):
+        self.Foo(5)
+
+        self.assertEqual(len(self.Foo._table), 3)
+
+    def test_unknown_values_looked_up_by_many_threads(self):
+        results = []
+
+        def look_up():
+            results.append([self.Foo(i) for i in range(3, 100)])
+
+        threads = [threading.Thread(target=look_up) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for result in results:
+            self.assertEqual(result, list(range(3, 100)))
+            for instance in result:
+                self.assertIs(instance, self.Foo(instance))
+        self.assertEqual(self.Foo._table, [0, 1, 2])
+
+    def test_adding_value_names_instance_looked_up_before(self):
+        unknown = self.Foo(5)
+
+        self.Foo.add('qux', 5)
+
+        self.assertIs(self.Foo.qux, unknown)
+        self.assertIs(self.Foo._table[5], unknown)
+        self.assertEqual(repr(self.Foo(5)), '<Foo.qux: 5>')
+
+    def test_negative_value_is_not_in_table(self):
+        self.Foo.add('qux', -1)
+
+        self.assertIs(self.Foo(-1), self.Foo.qux)
+        self.assertNotIn(self.Foo.qux, self.Foo._table)
+
+    def test_large_value_is_not_in_table(self):
+        self.Foo.add('quux', 10000)
+
+        self.assertIs(self.Foo(10000), self.Foo.quux)
+        self.assertEqual(len(self.Foo._table), 3)
+
+    def test_subclasses_have_separate_tables(self):
+        class Bar(utils.IntEnum):
+            pass
+
+        Bar.add('bar', 1)
+
+        self.assertIsNot(Bar(1), self.Foo(1))
+        self.assertIsInstance(Bar(1), Bar)
+
+
+class FakeLib(object):
+    SP_FOO_BAR = 1
+    SP_FOO_BAZ = 2
+    SP_FOOBAR_QUX = 3
+    SP_OTHER = 4
+    sp_foo_function = None
+
+    dir_calls = 0
+
+    def __dir__(self):
+        FakeLib.dir_calls += 1
+        return [
+            'SP_FOO_BAR', 'SP_FOO_BAZ', 'SP_FOOBAR_QUX', 'SP_OTHER',
+            'sp_foo_function']
+
+
+class MakeEnumTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeLib.dir_calls = 0
+        patcher = mock.patch.object(utils, 'lib', FakeLib())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        constants_patcher = mock.patch.object(utils, '_constants', None)
+        constants_patcher.start()
+        self.addCleanup(constants_patcher.stop)
+
+    def test_adds_constants_with_prefix(self):
+        @utils.make_enum('SP_FOO_')
+        class Foo(utils.IntEnum):
+            pass
+
+        self.assertEqual(Foo.BAR, 1)
+        self.assertEqual(Foo.BAZ, 2)
+        self.assertFalse(hasattr(Foo, 'BAR_QUX'))
+        self.assertFalse(hasattr(Foo, 'OTHER'))
+
+    def test_adds_enum_prefix_to_names(self):
+        @utils.make_enum('SP_FOO_', 'FOO_')
+        class Foo(utils.IntEnum):
+            pass
+
+        self.assertEqual(Foo.FOO_BAR, 1)
+        self.assertEqual(repr(Foo.FOO_BAZ), '<Foo.FOO_BAZ: 2>')
+
+    def test_walks_lib_only_once(self):
+        @utils.make_enum('SP_FOO_')
+        class Foo(utils.IntEnum):
+            pass
+
+        @utils.make_enum('SP_FOOBAR_')
+        class FooBar(utils.IntEnum):
+            pass
+
+        self.assertEqual(FakeLib.dir_calls, 1)
+        self.assertEqual(FooBar.QUX, 3)
+
+    def test_get_constants_returns_sorted_pairs(self):
+        self.assertEqual(
+            utils._get_constants('SP_FOO'), [
+                ('SP_FOOBAR_QUX', 3),
+                ('SP_FOO_BAR', 1),
+                ('SP_FOO_BAZ', 2),
+            ])
+        self.assertEqual(utils._get_constants('SP_NONE_'), [])
+
+
+class PointerWrapper(utils.PointerEquality):
+    __slots__ = ['_sp_foo']
+    _sp_attr = '_sp_foo'
+
+    def __init__(self, sp_foo):
+        self._sp_foo = sp_foo
+
+
+class OtherPointerWrapper(utils.PointerEquality):
+    __slots__ = ['_sp_bar']
+    _sp_attr = '_sp_bar'
+
+    def __init__(self, sp_bar):
+        self._sp_bar = sp_bar
+
+
+class PointerEqualityTest(unittest.TestCase):
+
+    def test_eq_and_hash_eq_if_same_pointer(self):
+        sp_foo = spotify.ffi.new('int *')
+        wrapper1 = PointerWrapper(sp_foo)
+        wrapper2 = PointerWrapper(sp_foo)
+
+        self.assertTrue(wrapper1 == wrapper2)
+        self.assertFalse(wrapper1 != wrapper2)
+        self.assertEqual(hash(wrapper1), hash(wrapper2))
+        self.assertEqual(len(set([wrapper1, wrapper2])), 1)
+
+    def test_not_eq_if_other_pointer(self):
+        wrapper1 = PointerWrapper(spotify.ffi.new('int *'))
+        wrapper2 = PointerWrapper(spotify.ffi.new('int *'))
+
+        self.assertFalse(wrapper1 == wrapper2)
+        self.assertTrue(wrapper1 != wrapper2)
+
+    def test_not_eq_to_wrappers_of_other_types(self):
+        sp_obj = spotify.ffi.new('int *')
+
+        self.assertFalse(PointerWrapper(sp_obj) == OtherPointerWrapper(sp_obj))
+        self.assertFalse(PointerWrapper(sp_obj) == sp_obj)
+
+    def test_adds_no_instance_dict(self):
+        wrapper = PointerWrapper(spotify.ffi.new('int *'))
+
+        self.assertFalse(hasattr(wrapper, '__dict__'))
+
+
+class GetCachedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.sp_obj = spotify.ffi.new('int *')
+        self.release_func = mock.Mock()
+        self.create = mock.Mock(side_effect=lambda: mock.Mock())
+
+    def test_creates_and_caches_missing_wrapper(self):
+        result = utils.get_cached(
+            self.session, self.sp_obj, True, self.release_func, self.create)
+
+        self.create.assert_called_once_with()
+        self.assertIs(self.session._cache[self.sp_obj], result)
+        self.assertEqual(self.release_func.call_count, 0)
+
+    def test_returns_cached_wrapper(self):
+        result1 = utils.get_cached(
+            self.session, self.sp_obj, True, self.release_func, self.create)
+        result2 = utils.get_cached(
+            self.session, self.sp_obj, True, self.release_func, self.create)
+
+        self.assertIs(result1, result2)
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(self.release_func.call_count, 0)
+
+    def test_releases_passed_reference_if_cached(self):
+        result1 = utils.get_cached(
+            self.session, self.sp_obj, False, self.release_func, self.create)
+        result2 = utils.get_cached(
+            self.session, self.sp_obj, False, self.release_func, self.create)
+
+        self.assertIs(result1, result2)
+        self.release_func.assert_called_once_with(self.sp_obj)
+
+
+class Memoized(object):
+
+    def __init__(self, session, is_loaded=True):
+        self._session = session
+        self._memo = None
+        self.is_loaded = is_loaded
+        self.calls = 0
+
+    @utils.memoized
+    def name(self):
+        self.calls += 1
+        return 'foo %d' % self.calls
+
+
+class MemoizedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        spotify.set_metadata_caching(True)
+
+    def tearDown(self):
+        spotify.set_metadata_caching(False)
+
+    def test_remembers_value_if_loaded(self):
+        obj = Memoized(self.session)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        self.assertEqual(obj.name(), 'foo 1')
+        self.assertEqual(obj.calls, 1)
+
+    def test_does_not_remember_value_if_not_loaded(self):
+        obj = Memoized(self.session, is_loaded=False)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        self.assertEqual(obj.name(), 'foo 2')
+        self.assertIsNone(obj._memo)
+
+    def test_does_not_remember_value_if_caching_is_disabled(self):
+        spotify.set_metadata_caching(False)
+        obj = Memoized(self.session)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        self.assertEqual(obj.name(), 'foo 2')
+
+    def test_keeps_value_when_metadata_is_updated_if_state_is_same(self):
+        obj = Memoized(self.session)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        self.session._metadata_generation += 1
+
+        self.assertEqual(obj.name(), 'foo 1')
+        self.assertEqual(obj.calls, 1)
+
+    def test_does_not_check_state_until_metadata_is_updated(self):
+        obj = Memoized(self.session)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        obj.is_loaded = False
+
+        self.assertEqual(obj.name(), 'foo 1')
+
+    def test_forgets_value_when_metadata_is_updated_and_unloaded(self):
+        obj = Memoized(self.session)
+
+        self.assertEqual(obj.name(), 'foo 1')
+        obj.is_loaded = False
+        self.session._metadata_generation += 1
+
+        self.assertEqual(obj.name(), 'foo 2')
+        self.assertIsNone(obj._memo)
+
+    def test_forgets_value_when_metadata_is_updated_and_error_changes(self):
+        obj = Memoized(self.session)
+        obj.error = spotify.ErrorType.OK
+
+        self.assertEqual(obj.name(), 'foo 1')
+        obj.error = spotify.ErrorType.OTHER_PERMANENT
+        self.session._metadata_generation += 1
+
+        self.assertEqual(obj.name(), 'foo 2')
+        self.assertEqual(obj.name(), 'foo 2')
+
+    def test_wraps_function(self):
+        self.assertEqual(Memoized.name.__name__, 'name')
+
 
 @mock.patch('spotify.search.lib', spec=spotify.lib)
 class SequenceTest(unittest.TestCase):